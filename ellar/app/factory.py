@@ -94,6 +94,9 @@ class AppFactory:
         config_module: t.Union[str, t.Dict, None] = None,
         injector: t.Optional[EllarInjector] = None,
     ) -> App:
+        # building an application defines metadata
+        reflect.unfreeze()
+
         def _get_config_kwargs() -> t.Dict:
             if config_module is None:
                 return {}
@@ -147,6 +150,9 @@ class AppFactory:
 
             routes = core_module_ref.get_routes()
             app.router.extend(routes)
+            app.router.routes.compile_parameter_resolvers(
+                config.COMPILED_PARAMETER_RESOLVERS
+            )
 
             for item in config.OVERRIDE_CORE_SERVICE:
                 provider_type = item.get_type()
@@ -168,6 +174,8 @@ class AppFactory:
             execute_coroutine(build_with_context_event.run())
             build_with_context_event.disconnect_all()
 
+        if config.FREEZE_REFLECT_METADATA:
+            reflect.freeze()
         return app
 
     @classmethod
@@ -199,6 +207,7 @@ class AppFactory:
             modules=modules,
             commands=commands,
         )
+        reflect.unfreeze()
         app_factory_module = get_unique_type()
         module(app_factory_module)
         app = cls._create_app(
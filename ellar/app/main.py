@@ -20,6 +20,7 @@ from ellar.core.execution_context import injector_context
 from ellar.core.middleware import (
     Middleware as EllarMiddleware,
 )
+from ellar.core.middleware import RequestTracingMiddleware
 from ellar.core.routing import ApplicationRouter, AppStaticFileMount
 from ellar.core.services import Reflector, reflector
 from ellar.core.versioning import BaseAPIVersioning, VersioningSchemes
@@ -68,6 +69,7 @@ class App:
         self.router = ApplicationRouter(
             routes=_routes,
             redirect_slashes=self.config.REDIRECT_SLASHES,
+            compiled=self.config.COMPILED_ROUTER,
             default=self.config.DEFAULT_NOT_FOUND_HANDLER,
             lifespan=EllarApplicationLifespan(
                 self.config.DEFAULT_LIFESPAN_HANDLER  # type: ignore[arg-type]
@@ -155,7 +157,7 @@ class App:
             *EXCEPTION_DEFAULT_EXCEPTION_HANDLERS, *list(self.config.EXCEPTION_HANDLERS)
         )
 
-        app = self.router
+        app: ASGIApp = self.router
         for cls, args, kwargs in reversed(
             t.cast(t.List[EllarMiddleware], self.config.MIDDLEWARE)
         ):
@@ -164,6 +166,9 @@ class App:
             except Exception as ex:
                 logger.exception(ex, f"Unable to setup middleware='{cls}'")
                 raise ex
+
+        if RequestTracingMiddleware.is_enabled(self.config):
+            app = RequestTracingMiddleware.from_config(app, self.config)
         return app
 
     def request_context(
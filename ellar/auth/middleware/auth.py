@@ -1,5 +1,6 @@
 from ellar.auth.services import IdentityAuthenticationService
 from ellar.common import AnonymousIdentity, IHostContextFactory
+from ellar.common.tracing import get_request_trace, now
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.core.conf import Config
 from ellar.core.middleware import Middleware as EllarMiddleware
@@ -37,7 +38,14 @@ class IdentityMiddleware:
             context = context_factory.create_context(scope, receive, send)
 
             context.user = AnonymousIdentity()
-            await self.identity_auth_service.authenticate(context)
+
+            trace = get_request_trace(scope)
+            if trace is None:
+                await self.identity_auth_service.authenticate(context)
+            else:
+                start = now()
+                await self.identity_auth_service.authenticate(context)
+                trace.record("authentication", start)
 
         await self.app(scope, receive, send)
 
@@ -1,3 +1,17 @@
-from .serializer import ICacheSerializer, RedisSerializer
+from .serializer import (
+    CopySerializer,
+    ICacheSerializer,
+    MemcacheSerializer,
+    PickleSerializer,
+    RedisSerializer,
+    ReferenceSerializer,
+)
 
-__all__ = ["ICacheSerializer", "RedisSerializer"]
+__all__ = [
+    "ICacheSerializer",
+    "RedisSerializer",
+    "MemcacheSerializer",
+    "PickleSerializer",
+    "ReferenceSerializer",
+    "CopySerializer",
+]
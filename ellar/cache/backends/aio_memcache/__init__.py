@@ -0,0 +1,15 @@
+from .backend import AioMemCacheBackend
+from .client import (
+    MemcacheClient,
+    MemcacheError,
+    MemcacheIllegalInputError,
+    MemcacheUnexpectedResponseError,
+)
+
+__all__ = [
+    "AioMemCacheBackend",
+    "MemcacheClient",
+    "MemcacheError",
+    "MemcacheIllegalInputError",
+    "MemcacheUnexpectedResponseError",
+]
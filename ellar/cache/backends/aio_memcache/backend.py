@@ -0,0 +1,274 @@
+import asyncio
+import math
+import time
+import typing as t
+import weakref
+from abc import ABC
+
+from ellar.threading import run_in_event_loop_thread
+
+from ...interface import IBaseCacheBackendAsync
+from ...make_key_decorator import (
+    make_key_decorator,
+    make_key_decorator_and_validate,
+    make_many_keys_decorator,
+    make_many_keys_decorator_and_validate,
+)
+from ...model import BaseCacheBackend
+from ..serializer import ICacheSerializer, MemcacheSerializer
+from .client import MemcacheClient
+
+
+class _AioMemCacheBackendSync(IBaseCacheBackendAsync, ABC):
+    def _async_executor(self, func: t.Coroutine) -> t.Any:
+        # runs on a shared background loop, so it works from threadpool workers
+        # and from threads already running an event loop
+        return run_in_event_loop_thread(func)
+
+    def get(self, key: str, version: t.Optional[str] = None) -> t.Any:
+        return self._async_executor(self.get_async(key, version=version))
+
+    def delete(self, key: str, version: t.Optional[str] = None) -> bool:
+        res = self._async_executor(self.delete_async(key, version=version))
+        return bool(res)
+
+    def set(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        res = self._async_executor(self.set_async(key, value, version=version, ttl=ttl))
+        return bool(res)
+
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        res = self._async_executor(self.add_async(key, value, version=version, ttl=ttl))
+        return bool(res)
+
+    def touch(
+        self,
+        key: str,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        res = self._async_executor(self.touch_async(key, version=version, ttl=ttl))
+        return bool(res)
+
+    def has_key(self, key: str, version: t.Optional[str] = None) -> bool:
+        res = self._async_executor(self.has_key_async(key, version=version))
+        return bool(res)
+
+    def incr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
+        res = self._async_executor(self.incr_async(key, delta=delta, version=version))
+        return t.cast(int, res)
+
+    def decr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
+        res = self._async_executor(self.decr_async(key, delta=delta, version=version))
+        return t.cast(int, res)
+
+    def get_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        res = self._async_executor(self.get_many_async(keys, version=version))
+        return t.cast(t.Dict[str, t.Any], res)
+
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        res = self._async_executor(
+            self.set_many_async(mapping, ttl=ttl, version=version)
+        )
+        return t.cast(t.List[str], res)
+
+    def delete_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        self._async_executor(self.delete_many_async(keys, version=version))
+
+
+class AioMemCacheBackend(_AioMemCacheBackendSync, BaseCacheBackend):
+    """
+    Memcached-based cache backend running on asyncio streams,
+    without a thread per call like the pymemcache and pylibmc backends.
+
+    Construct example::
+        backend = AioMemCacheBackend(servers=['127.0.0.1:11211'])
+        OR
+        backend = AioMemCacheBackend(servers=['172.19.26.240:11211', '172.19.26.242:11212'])
+        OR
+        backend = AioMemCacheBackend(servers=['/tmp/memcached.sock'])
+
+    `options` are passed to `MemcacheClient`, e.g. `{'pool_size': 10, 'timeout': 1.0}`.
+    """
+
+    MEMCACHE_CLIENT: t.Type[MemcacheClient] = MemcacheClient
+    POOL_SIZE = 10
+    # memcached reads expiration times longer than 30 days as unix timestamps
+    MAX_RELATIVE_TTL = 60 * 60 * 24 * 30
+
+    def __init__(
+        self,
+        servers: t.List[str],
+        options: t.Optional[t.Dict] = None,
+        serializer: t.Optional[ICacheSerializer] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._servers = servers
+        self._options = {"pool_size": self.POOL_SIZE, **(options or {})}
+        self._serializer = serializer or MemcacheSerializer()
+        # clients and their connections are bound to the event loop they are used from
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, MemcacheClient
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def _cache_client(self) -> MemcacheClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self.MEMCACHE_CLIENT(
+                self._servers, **self._options
+            )
+        return client
+
+    def get_backend_ttl(self, ttl: t.Union[float, int, None] = None) -> int:
+        if ttl is None:
+            ttl = self._default_ttl
+        if ttl <= 0:
+            # expires immediately, 0 would mean `never` to memcached
+            return -1
+        if ttl > self.MAX_RELATIVE_TTL:
+            return int(time.time() + ttl)
+        return math.ceil(ttl)
+
+    def validate_key(self, key: str) -> None:
+        super().validate_key(key)
+        self._memcache_key_warnings(key)
+
+    @make_key_decorator
+    async def get_async(self, key: str, version: t.Optional[str] = None) -> t.Any:
+        value = await self._cache_client.get(key)
+        if value is not None:
+            return self._serializer.load(value)
+        return None
+
+    @make_key_decorator_and_validate
+    async def set_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        client = self._cache_client
+        result = await client.set(
+            key, self._serializer.dumps(value), self.get_backend_ttl(ttl)
+        )
+        if not result:
+            # Make sure the key doesn't keep its old value in case of failure
+            # to set (memcached's 1MB limit).
+            await client.delete(key)
+        return result
+
+    @make_key_decorator_and_validate
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        return await self._cache_client.add(
+            key, self._serializer.dumps(value), self.get_backend_ttl(ttl)
+        )
+
+    @make_key_decorator
+    async def delete_async(self, key: str, version: t.Optional[str] = None) -> bool:
+        return await self._cache_client.delete(key)
+
+    @make_key_decorator
+    async def touch_async(
+        self,
+        key: str,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        return await self._cache_client.touch(key, self.get_backend_ttl(ttl))
+
+    async def _incr_decr(self, key: str, delta: int) -> int:
+        client = self._cache_client
+        if delta < 0:
+            result = await client.decr(key, -delta)
+        else:
+            result = await client.incr(key, delta)
+
+        if result is None:
+            raise ValueError("Key '%s' not found" % key)
+        return result
+
+    @make_key_decorator
+    async def incr_async(
+        self, key: str, delta: int = 1, version: t.Optional[str] = None
+    ) -> int:
+        return await self._incr_decr(key, delta)
+
+    @make_key_decorator
+    async def decr_async(
+        self, key: str, delta: int = 1, version: t.Optional[str] = None
+    ) -> int:
+        return await self._incr_decr(key, -delta)
+
+    @make_many_keys_decorator
+    async def get_many_async(
+        self, keys: t.List[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        if not keys:
+            return {}
+        values = await self._cache_client.get_multi(keys)
+        return {key: self._serializer.load(value) for key, value in values.items()}
+
+    @make_many_keys_decorator_and_validate
+    async def set_many_async(
+        self,
+        mapping: t.Dict[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        if not mapping:
+            return []
+        return await self._cache_client.set_multi(
+            {key: self._serializer.dumps(value) for key, value in mapping.items()},
+            self.get_backend_ttl(ttl),
+        )
+
+    @make_many_keys_decorator
+    async def delete_many_async(
+        self, keys: t.List[str], version: t.Optional[str] = None
+    ) -> None:
+        if keys:
+            await self._cache_client.delete_multi(keys)
+
+    async def clear_async(self) -> None:
+        await self._cache_client.flush_all()
+
+    async def close_async(self, **kwargs: t.Any) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            client.close()
+
+    def clear(self) -> None:
+        self._async_executor(self.clear_async())
+
+    def close(self, **kwargs: t.Any) -> None:
+        self._async_executor(self.close_async(**kwargs))
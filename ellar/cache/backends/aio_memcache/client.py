@@ -0,0 +1,407 @@
+"""
+Memcached client speaking the text protocol over pooled asyncio streams.
+"""
+
+import asyncio
+import bisect
+import collections
+import contextlib
+import hashlib
+import typing as t
+
+DEFAULT_PORT = 11211
+MAX_KEY_LENGTH = 250
+_ERRORS = (b"ERROR", b"CLIENT_ERROR", b"SERVER_ERROR")
+_STORE_RESPONSES = (b"STORED", b"NOT_STORED", b"EXISTS", b"NOT_FOUND")
+
+
+class MemcacheError(Exception):
+    """Raised when memcached answers a command with an error."""
+
+
+class MemcacheIllegalInputError(MemcacheError, ValueError):
+    """Raised for keys that can not be sent in a memcached command."""
+
+
+class MemcacheUnexpectedResponseError(MemcacheError):
+    """
+    Raised when a response does not match the command sent. The connection it was
+    read from is closed, since the responses still to be read are out of sync.
+    """
+
+
+def parse_server(server: str) -> t.Tuple[str, t.Optional[int]]:
+    """
+    Returns the host and port of `server`.
+    - '127.0.0.1:11211' -> ('127.0.0.1', 11211)
+    - '127.0.0.1' -> ('127.0.0.1', 11211)
+    - '/tmp/memcached.sock' or 'unix:/tmp/memcached.sock' -> ('/tmp/memcached.sock', None)
+    """
+    if server.startswith("unix:"):
+        return server[5:], None
+    if server.startswith("/"):
+        return server, None
+
+    host, _, port = server.partition(":")
+    return host, int(port) if port else DEFAULT_PORT
+
+
+class HashRing:
+    """
+    Consistent hashing of keys to servers.
+
+    Each server is placed `replicas` times on a ring of md5 points, like ketama,
+    so adding or removing a server only moves the keys of that server.
+    """
+
+    __slots__ = ("_points", "_nodes")
+
+    def __init__(self, nodes: t.Sequence[str], replicas: int = 160) -> None:
+        ring = sorted(
+            (self._hash(f"{node}-{index}"), node)
+            for node in nodes
+            for index in range(replicas)
+        )
+        self._points = [point for point, _ in ring]
+        self._nodes = [node for _, node in ring]
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:4], "little")
+
+    def get_node(self, key: str) -> str:
+        index = bisect.bisect(self._points, self._hash(key))
+        return self._nodes[index % len(self._nodes)]
+
+
+class MemcacheConnection:
+    __slots__ = ("reader", "writer")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: t.Optional[int]) -> "MemcacheConnection":
+        if port is None:
+            reader, writer = await asyncio.open_unix_connection(host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    @property
+    def is_usable(self) -> bool:
+        return not (self.reader.at_eof() or self.writer.is_closing())
+
+    async def send(self, data: bytes) -> None:
+        self.writer.write(data)
+        await self.writer.drain()
+
+    async def read_line(self) -> bytes:
+        line = await self.reader.readuntil(b"\r\n")
+        if line.startswith(_ERRORS):
+            raise MemcacheError(line[:-2].decode("utf-8", "replace"))
+        return line[:-2]
+
+    async def read_response(self, expected: t.Container[bytes]) -> bytes:
+        line = await self.read_line()
+        if line not in expected:
+            raise self.unexpected_response(line)
+        return line
+
+    async def read_values(self) -> t.Dict[bytes, bytes]:
+        """Reads the `VALUE` lines answered to a retrieval command, up to `END`."""
+        values = {}
+        line = await self.read_line()
+        while line != b"END":
+            parts = line.split(b" ")
+            if len(parts) != 4 or parts[0] != b"VALUE" or not parts[3].isdigit():
+                raise self.unexpected_response(line)
+            _, key, _flags, length = parts
+            data = await self.reader.readexactly(int(length) + 2)
+            values[key] = data[:-2]
+            line = await self.read_line()
+        return values
+
+    def unexpected_response(self, line: bytes) -> MemcacheUnexpectedResponseError:
+        self.close()
+        return MemcacheUnexpectedResponseError(
+            "Unexpected response: %s" % line.decode("utf-8", "replace")
+        )
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class ConnectionPool:
+    """
+    Connections to one memcached server, bound to the event loop they are used from.
+    At most `size` connections are open at a time, idle ones are reused.
+    """
+
+    def __init__(self, host: str, port: t.Optional[int], size: int = 2) -> None:
+        self._host = host
+        self._port = port
+        self._semaphore = asyncio.Semaphore(size)
+        self._idle: t.Deque[MemcacheConnection] = collections.deque()
+
+    async def _get_connection(self) -> MemcacheConnection:
+        while self._idle:
+            connection = self._idle.pop()
+            if connection.is_usable:
+                return connection
+            connection.close()
+        return await MemcacheConnection.open(self._host, self._port)
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> t.AsyncIterator[MemcacheConnection]:
+        async with self._semaphore:
+            connection = await self._get_connection()
+            try:
+                yield connection
+            except BaseException:
+                # the connection may hold an unread or partially sent response
+                connection.close()
+                raise
+            self._idle.append(connection)
+
+    def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
+
+
+class MemcacheClient:
+    """
+    Asyncio memcached client. Keys are distributed over `servers` with a `HashRing`,
+    bulk commands send one request per server concurrently.
+    """
+
+    def __init__(
+        self,
+        servers: t.Sequence[str],
+        pool_size: int = 2,
+        timeout: t.Optional[float] = None,
+        hash_replicas: int = 160,
+    ) -> None:
+        self._pools = {
+            server: ConnectionPool(*parse_server(server), size=pool_size)
+            for server in servers
+        }
+        self._ring = HashRing(list(self._pools), replicas=hash_replicas)
+        self._timeout = timeout
+        # keys of a single server are not hashed
+        self._single_pool = (
+            next(iter(self._pools.values())) if len(self._pools) == 1 else None
+        )
+
+    def _get_pool(self, key: str) -> ConnectionPool:
+        # every command looks up the pool of its keys, so they are rejected
+        # before a connection is taken
+        _encode(key)
+        if self._single_pool is not None:
+            return self._single_pool
+        return self._pools[self._ring.get_node(key)]
+
+    def _group_by_pool(
+        self, keys: t.Iterable[str]
+    ) -> t.Dict[ConnectionPool, t.List[str]]:
+        groups: t.Dict[ConnectionPool, t.List[str]] = {}
+        for key in keys:
+            groups.setdefault(self._get_pool(key), []).append(key)
+        return groups
+
+    async def _execute(
+        self,
+        pool: ConnectionPool,
+        handler: t.Callable[..., t.Awaitable[t.Any]],
+        *args: t.Any,
+    ) -> t.Any:
+        async def _run() -> t.Any:
+            async with pool.connection() as connection:
+                return await handler(connection, *args)
+
+        if self._timeout is None:
+            return await _run()
+        return await asyncio.wait_for(_run(), self._timeout)
+
+    async def _command(
+        self, key: str, command: bytes, expected: t.Container[bytes]
+    ) -> bytes:
+        return t.cast(
+            bytes, await self._execute(self._get_pool(key), _call, command, expected)
+        )
+
+    async def get(self, key: str) -> t.Optional[bytes]:
+        values = await self._execute(self._get_pool(key), _retrieve, [key])
+        return t.cast(t.Optional[bytes], values.get(key))
+
+    async def get_multi(self, keys: t.Iterable[str]) -> t.Dict[str, bytes]:
+        groups = self._group_by_pool(keys)
+        results = await asyncio.gather(
+            *(self._execute(pool, _retrieve, _keys) for pool, _keys in groups.items())
+        )
+        values: t.Dict[str, bytes] = {}
+        for result in results:
+            values.update(result)
+        return values
+
+    async def set(self, key: str, value: bytes, exptime: int = 0) -> bool:
+        failed = await self._execute(self._get_pool(key), _store, {key: value}, exptime)
+        return not failed
+
+    async def add(self, key: str, value: bytes, exptime: int = 0) -> bool:
+        """Stores `value` only if `key` does not exist yet."""
+        failed = await self._execute(
+            self._get_pool(key), _store, {key: value}, exptime, b"add"
+        )
+        return not failed
+
+    async def set_multi(
+        self, mapping: t.Mapping[str, bytes], exptime: int = 0
+    ) -> t.List[str]:
+        """Stores every key of `mapping` and returns the keys that were not stored."""
+        groups = self._group_by_pool(mapping)
+        results = await asyncio.gather(
+            *(
+                self._execute(
+                    pool, _store, {key: mapping[key] for key in _keys}, exptime
+                )
+                for pool, _keys in groups.items()
+            )
+        )
+        return [key for failed in results for key in failed]
+
+    async def delete(self, key: str) -> bool:
+        response = await self._command(
+            key, b"delete %s\r\n" % _encode(key), (b"DELETED", b"NOT_FOUND")
+        )
+        return response == b"DELETED"
+
+    async def delete_multi(self, keys: t.Iterable[str]) -> None:
+        groups = self._group_by_pool(keys)
+        await asyncio.gather(
+            *(self._execute(pool, _delete, _keys) for pool, _keys in groups.items())
+        )
+
+    async def touch(self, key: str, exptime: int = 0) -> bool:
+        response = await self._command(
+            key,
+            b"touch %s %d\r\n" % (_encode(key), exptime),
+            (b"TOUCHED", b"NOT_FOUND"),
+        )
+        return response == b"TOUCHED"
+
+    async def incr(self, key: str, delta: int = 1) -> t.Optional[int]:
+        """Returns the incremented value, or None if the key does not exist."""
+        return t.cast(
+            t.Optional[int],
+            await self._execute(
+                self._get_pool(key),
+                _call_counter,
+                b"incr %s %d\r\n" % (_encode(key), delta),
+            ),
+        )
+
+    async def decr(self, key: str, delta: int = 1) -> t.Optional[int]:
+        """
+        Returns the decremented value, or None if the key does not exist.
+        Memcached does not decrement below 0.
+        """
+        return t.cast(
+            t.Optional[int],
+            await self._execute(
+                self._get_pool(key),
+                _call_counter,
+                b"decr %s %d\r\n" % (_encode(key), delta),
+            ),
+        )
+
+    async def flush_all(self) -> None:
+        await asyncio.gather(
+            *(
+                self._execute(pool, _call, b"flush_all\r\n", (b"OK",))
+                for pool in self._pools.values()
+            )
+        )
+
+    def close(self) -> None:
+        for pool in self._pools.values():
+            pool.close()
+
+
+def _encode(key: str) -> bytes:
+    """
+    Encodes `key` for the text protocol, where keys are at most 250 bytes long
+    and are separated from the rest of the command by whitespace.
+    """
+    encoded = key.encode("utf-8")
+    if len(encoded) > MAX_KEY_LENGTH:
+        raise MemcacheIllegalInputError(
+            "Key is longer than %d bytes: %r" % (MAX_KEY_LENGTH, key)
+        )
+    if any(byte <= 32 or byte == 127 for byte in encoded):
+        raise MemcacheIllegalInputError(
+            "Key contains whitespace or control characters: %r" % key
+        )
+    return encoded
+
+
+async def _call(
+    connection: MemcacheConnection, command: bytes, expected: t.Container[bytes]
+) -> bytes:
+    await connection.send(command)
+    return await connection.read_response(expected)
+
+
+async def _call_counter(
+    connection: MemcacheConnection, command: bytes
+) -> t.Optional[int]:
+    await connection.send(command)
+    response = await connection.read_line()
+    if response == b"NOT_FOUND":
+        return None
+    if not response.isdigit():
+        raise connection.unexpected_response(response)
+    return int(response)
+
+
+async def _retrieve(
+    connection: MemcacheConnection, keys: t.List[str]
+) -> t.Dict[str, bytes]:
+    await connection.send(b"get %s\r\n" % b" ".join(_encode(key) for key in keys))
+    values = await connection.read_values()
+    return {key.decode("utf-8"): value for key, value in values.items()}
+
+
+async def _store(
+    connection: MemcacheConnection,
+    mapping: t.Dict[str, bytes],
+    exptime: int,
+    command: bytes = b"set",
+) -> t.List[str]:
+    # all commands are written at once, then their responses are read in order
+    await connection.send(
+        b"".join(
+            b"%s %s 0 %d %d\r\n%s\r\n"
+            % (command, _encode(key), exptime, len(value), value)
+            for key, value in mapping.items()
+        )
+    )
+    failed = []
+    for key in mapping:
+        try:
+            stored = await connection.read_response(_STORE_RESPONSES) == b"STORED"
+        except MemcacheError as ex:
+            # e.g. values larger than the item size limit of the server
+            if not str(ex).startswith("SERVER_ERROR"):
+                raise
+            stored = False
+        if not stored:
+            failed.append(key)
+    return failed
+
+
+async def _delete(connection: MemcacheConnection, keys: t.List[str]) -> None:
+    await connection.send(b"".join(b"delete %s\r\n" % _encode(key) for key in keys))
+    for _ in keys:
+        await connection.read_response((b"DELETED", b"NOT_FOUND"))
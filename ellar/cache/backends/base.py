@@ -3,7 +3,12 @@ from abc import ABC
 
 from starlette.concurrency import run_in_threadpool
 
-from ..make_key_decorator import make_key_decorator, make_key_decorator_and_validate
+from ..make_key_decorator import (
+    make_key_decorator,
+    make_key_decorator_and_validate,
+    make_many_keys_decorator,
+    make_many_keys_decorator_and_validate,
+)
 from ..model import BaseCacheBackend
 
 
@@ -30,6 +35,17 @@ class _BasePylibMemcachedCacheSync(BaseCacheBackend, ABC):
             return False
         return bool(result)
 
+    @make_key_decorator_and_validate
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        result = self._cache_client.add(key, value, int(self.get_backend_ttl(ttl)))
+        return bool(result)
+
     @make_key_decorator
     def delete(self, key: str, version: t.Optional[str] = None) -> bool:
         result = self._cache_client.delete(key)
@@ -55,6 +71,26 @@ class _BasePylibMemcachedCacheSync(BaseCacheBackend, ABC):
         result = self._cache_client.decr(key, abs(delta))
         return t.cast(int, result)
 
+    @make_many_keys_decorator
+    def get_many(
+        self, keys: t.List[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        return t.cast(t.Dict[str, t.Any], self._cache_client.get_multi(keys))
+
+    @make_many_keys_decorator_and_validate
+    def set_many(
+        self,
+        mapping: t.Dict[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        failed = self._cache_client.set_multi(mapping, int(self.get_backend_ttl(ttl)))
+        return list(failed or [])
+
+    @make_many_keys_decorator
+    def delete_many(self, keys: t.List[str], version: t.Optional[str] = None) -> None:
+        self._cache_client.delete_multi(keys)
+
     def close(self, **kwargs: t.Any) -> None:
         """Many clients don't clean up connections properly."""
 
@@ -101,6 +137,16 @@ class BasePylibMemcachedCache(_BasePylibMemcachedCacheSync):
         result = await self.executor(self.set, key, value, ttl=ttl, version=version)
         return bool(result)
 
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        result = await self.executor(self.add, key, value, ttl=ttl, version=version)
+        return bool(result)
+
     async def delete_async(self, key: str, version: t.Optional[str] = None) -> bool:
         result = await self.executor(self.delete, key, version=version)
         return bool(result)
@@ -114,6 +160,26 @@ class BasePylibMemcachedCache(_BasePylibMemcachedCacheSync):
         result = await self.executor(self.touch, key, ttl=ttl, version=version)
         return bool(result)
 
+    async def get_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        res = await self.executor(self.get_many, keys, version=version)
+        return t.cast(t.Dict[str, t.Any], res)
+
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        res = await self.executor(self.set_many, mapping, ttl=ttl, version=version)
+        return t.cast(t.List[str], res)
+
+    async def delete_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        await self.executor(self.delete_many, keys, version=version)
+
     async def close_async(self, **kwargs: t.Any) -> None:
         # Many clients don't clean up connections properly.
         await self.executor(self._cache_client.disconnect_all)
@@ -1,158 +1,458 @@
+import contextlib
+import heapq
 import pickle
+import sys
+import threading
 import time
 import typing as t
 from abc import ABC
 from collections import OrderedDict
 
-from anyio import Lock
-from ellar.utils.event_loop import get_or_create_eventloop
-
-from ..interface import IBaseCacheBackendAsync
-from ..make_key_decorator import make_key_decorator, make_key_decorator_and_validate
+from ..interface import IBaseCacheBackendSync
+from ..make_key_decorator import (
+    make_key_decorator,
+    make_key_decorator_and_validate,
+    make_many_keys_decorator,
+    make_many_keys_decorator_and_validate,
+)
 from ..model import BaseCacheBackend
+from .serializer import (
+    CopySerializer,
+    ICacheSerializer,
+    PickleSerializer,
+    ReferenceSerializer,
+)
 
+_empty = object()
 
-class _LocalMemCacheBackendSync(IBaseCacheBackendAsync, ABC):
-    def _async_executor(self, func: t.Awaitable) -> t.Any:
-        return get_or_create_eventloop().run_until_complete(func)
 
-    def get(self, key: str, version: t.Optional[str] = None) -> t.Any:
-        return self._async_executor(self.get_async(key, version=version))
+class _LocalMemCacheBackendAsync(IBaseCacheBackendSync, ABC):
+    # the local cache never waits on I/O, async methods run the sync ones directly
 
-    def delete(self, key: str, version: t.Optional[str] = None) -> bool:
-        res = self._async_executor(self.delete_async(key, version=version))
-        return bool(res)
+    async def get_async(self, key: str, version: t.Optional[str] = None) -> t.Any:
+        return self.get(key, version=version)
 
-    def set(
+    async def delete_async(self, key: str, version: t.Optional[str] = None) -> bool:
+        return self.delete(key, version=version)
+
+    async def set_async(
         self,
         key: str,
         value: t.Any,
         ttl: t.Union[float, int, None] = None,
         version: t.Optional[str] = None,
     ) -> bool:
-        res = self._async_executor(self.set_async(key, value, ttl=ttl, version=version))
-        return bool(res)
+        return self.set(key, value, ttl=ttl, version=version)
 
-    def touch(
+    async def add_async(
         self,
         key: str,
+        value: t.Any,
         ttl: t.Union[float, int, None] = None,
         version: t.Optional[str] = None,
     ) -> bool:
-        res = self._async_executor(self.touch_async(key, ttl=ttl, version=version))
-        return bool(res)
+        return self.add(key, value, ttl=ttl, version=version)
 
-    def incr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
-        res = self._async_executor(self.incr_async(key, delta=delta, version=version))
-        return t.cast(int, res)
+    async def touch_async(
+        self,
+        key: str,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        return self.touch(key, ttl=ttl, version=version)
 
-    def decr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
-        res = self._async_executor(self.decr_async(key, delta=delta, version=version))
-        return t.cast(int, res)
+    async def has_key_async(self, key: str, version: t.Optional[str] = None) -> bool:
+        return self.has_key(key, version=version)
+
+    async def incr_async(
+        self, key: str, delta: int = 1, version: t.Optional[str] = None
+    ) -> int:
+        return self.incr(key, delta=delta, version=version)
+
+    async def decr_async(
+        self, key: str, delta: int = 1, version: t.Optional[str] = None
+    ) -> int:
+        return self.decr(key, delta=delta, version=version)
 
+    async def get_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        return self.get_many(keys, version=version)
+
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        return self.set_many(mapping, ttl=ttl, version=version)
+
+    async def delete_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        self.delete_many(keys, version=version)
+
+
+class LocalMemCacheBackend(_LocalMemCacheBackendAsync, BaseCacheBackend):
+    """
+    In-process cache backend.
+
+    Values are stored according to `value_storage`:
+    `pickle` (default) pickles them, `reference` keeps the object itself and
+    `copy`/`deepcopy` keep a shallow/deep copy and return a new copy on every read.
+    Integers are always kept as they are. A custom `serializer` can be used instead.
+
+    Entries are kept in least recently used order and the least recently used ones
+    are evicted once `max_entries` or `max_bytes` is exceeded.
+    Expired entries are removed when read and by a periodic sweep, every
+    `sweep_interval` seconds, through a heap of expiry times.
+
+    Reads of live keys take no lock. Writes to a key hold one of `lock_stripes`
+    locks chosen by the key hash, and a short lock around the shared LRU, size and
+    expiry bookkeeping. No lock is held across an `await`, so threading locks are used
+    and the backend is also safe to use from several threads.
+    """
 
-class LocalMemCacheBackend(_LocalMemCacheBackendSync, BaseCacheBackend):
     pickle_protocol = pickle.HIGHEST_PROTOCOL
+    VALUE_STORAGE = "pickle"
+    value_storage_serializers: t.Dict[str, t.Callable[..., ICacheSerializer]] = {
+        "pickle": lambda backend: PickleSerializer(backend.pickle_protocol),
+        "reference": lambda backend: ReferenceSerializer(),
+        "copy": lambda backend: CopySerializer(),
+        "deepcopy": lambda backend: CopySerializer(deep=True),
+    }
+    MAX_ENTRIES: t.Optional[int] = None
+    MAX_BYTES: t.Optional[int] = None
+    SWEEP_INTERVAL: float = 60
+    LOCK_STRIPES: int = 16
 
-    def __init__(self, **kwargs: t.Any) -> None:
+    def __init__(
+        self,
+        max_entries: t.Optional[int] = None,
+        max_bytes: t.Optional[int] = None,
+        sweep_interval: t.Optional[float] = None,
+        lock_stripes: t.Optional[int] = None,
+        value_storage: t.Optional[str] = None,
+        serializer: t.Optional[ICacheSerializer] = None,
+        **kwargs: t.Any,
+    ) -> None:
         super().__init__(**kwargs)
-        self._cache: t.Dict[str, bytes] = OrderedDict()
+        value_storage = value_storage or self.VALUE_STORAGE
+        if serializer is None:
+            if value_storage not in self.value_storage_serializers:
+                raise ValueError(
+                    f"Invalid value_storage={value_storage!r}, expected one of "
+                    f"{list(self.value_storage_serializers)}"
+                )
+            serializer = self.value_storage_serializers[value_storage](self)
+        self._serializer = serializer
+        self._max_entries = max_entries if max_entries is not None else self.MAX_ENTRIES
+        self._max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+        self._sweep_interval = (
+            sweep_interval if sweep_interval is not None else self.SWEEP_INTERVAL
+        )
+
+        self._cache: t.OrderedDict[str, t.Any] = OrderedDict()
+        # size of each stored value, measured once when it is stored
+        self._sizes: t.Dict[str, int] = {}
         self._expire_track: t.Dict[str, float] = {}
-        self._lock = Lock()
+        # (expiry time, key). Entries are not removed when a key is updated or
+        # deleted, `_sweep_expired` skips them when they no longer match `_expire_track`
+        self._expiry_heap: t.List[t.Tuple[float, str]] = []
+        self._next_sweep = time.time() + self._sweep_interval
+        self._size = 0
 
-    @make_key_decorator
-    async def get_async(self, key: str, version: t.Optional[str] = None) -> t.Any:
-        async with self._lock:
-            if self._has_expired(key):
-                await self._delete(key)
-                return None
+        # counters are updated without locking and may miss concurrent updates
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-            pickled = self._cache[key]
-            return pickle.loads(pickled)
+        self._key_locks = tuple(
+            threading.Lock() for _ in range(lock_stripes or self.LOCK_STRIPES)
+        )
+        self._lock = threading.Lock()
+
+    def get_stats(self) -> t.Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._cache),
+            "bytes": self._size,
+        }
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        return self._key_locks[hash(key) % len(self._key_locks)]
+
+    @contextlib.contextmanager
+    def _many_keys_lock(self, keys: t.Iterable[str]) -> t.Iterator[None]:
+        # stripes are always taken in index order, so bulk writes can not deadlock
+        stripes = sorted({hash(key) % len(self._key_locks) for key in keys})
+        with contextlib.ExitStack() as stack:
+            for index in stripes:
+                stack.enter_context(self._key_locks[index])
+            stack.enter_context(self._lock)
+            yield
+
+    def _get_live(self, key: str, key_locked: bool = False) -> t.Any:
+        """
+        Returns the stored value of `key` if it has not expired, without locking.
+        Returns `_empty` otherwise. `key_locked` is set when the caller holds the lock
+        of `key`, which is then not taken again to delete an expired value.
+        """
+        stored = self._cache.get(key, _empty)
+        if stored is _empty:
+            return _empty
+
+        exp = self._expire_track.get(key)
+        if exp is not None and exp <= time.time():
+            if key_locked:
+                with self._lock:
+                    self._delete(key)
+            else:
+                self._delete_expired(key, exp)
+            return _empty
 
-    async def _delete(self, key: str) -> bool:
         try:
-            self._cache.pop(key)
-            self._expire_track.pop(key)
-        except KeyError:
-            return False
-        return True
+            self._cache.move_to_end(key)
+        except KeyError:  # pragma: no cover
+            # deleted by another thread in between
+            pass
+        return stored
+
+    def _delete_expired(self, key: str, exp: float) -> None:
+        with self._key_lock(key):
+            if self._expire_track.get(key) == exp:
+                with self._lock:
+                    self._delete(key)
 
     @make_key_decorator
-    async def delete_async(self, key: str, version: t.Optional[str] = None) -> bool:
-        async with self._lock:
-            return await self._delete(key)
+    def get(self, key: str, version: t.Optional[str] = None) -> t.Any:
+        stored = self._get_live(key)
+        if stored is _empty:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if type(stored) is int:
+            return stored
+        return self._serializer.load(stored)
+
+    def _sizeof(self, stored: t.Any) -> int:
+        if type(stored) is bytes:
+            return len(stored)
+        return sys.getsizeof(stored)
+
+    def _delete(self, key: str) -> bool:
+        # expiry and size are dropped even when the value is gone,
+        # e.g. evicted by a write to another key
+        self._expire_track.pop(key, None)
+        self._size -= self._sizes.pop(key, 0)
+        return self._cache.pop(key, _empty) is not _empty
+
+    def _store(self, key: str, stored: t.Any, size: int) -> None:
+        self._size += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+        self._cache[key] = stored
+        self._cache.move_to_end(key)
+
+    def _set_expiry(self, key: str, expiry: float) -> None:
+        self._expire_track[key] = expiry
+        heapq.heappush(self._expiry_heap, (expiry, key))
+
+    def _evict(self) -> None:
+        while self._cache and (
+            (self._max_entries is not None and len(self._cache) > self._max_entries)
+            or (self._max_bytes is not None and self._size > self._max_bytes)
+        ):
+            key, _ = self._cache.popitem(last=False)
+            self._expire_track.pop(key, None)
+            self._size -= self._sizes.pop(key, 0)
+            self.evictions += 1
+
+    def _sweep_expired(self, force: bool = False) -> None:
+        now = time.time()
+        if not force and now < self._next_sweep:
+            return
+
+        self._next_sweep = now + self._sweep_interval
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            if self._expire_track.get(key) == expiry:
+                self._delete(key)
+
+        if len(heap) > 2 * len(self._expire_track) + 64:
+            # drop outdated entries left by updates and deletes
+            self._expiry_heap = [(exp, key) for key, exp in self._expire_track.items()]
+            heapq.heapify(self._expiry_heap)
+
+    @make_key_decorator
+    def delete(self, key: str, version: t.Optional[str] = None) -> bool:
+        with self._key_lock(key), self._lock:
+            return self._delete(key)
+
+    def _set(self, key: str, stored: t.Any, size: int, expiry: float) -> bool:
+        # the caller holds the lock of `key`
+        with self._lock:
+            if self._max_bytes is not None and size > self._max_bytes:
+                # would evict every other entry and still not fit
+                self._delete(key)
+                return False
+
+            self._sweep_expired()
+            self._store(key, stored, size)
+            self._set_expiry(key, expiry)
+            self._evict()
+            return True
 
     @make_key_decorator_and_validate
-    async def set_async(
+    def set(
         self,
         key: str,
         value: t.Any,
         ttl: t.Union[float, int, None] = None,
         version: t.Optional[str] = None,
     ) -> bool:
-        async with self._lock:
-            self._cache[key] = pickle.dumps(value, self.pickle_protocol)
-            self._expire_track[key] = self.get_backend_ttl(ttl)
-            return True
+        stored = value if type(value) is int else self._serializer.dumps(value)
+        size = self._sizeof(stored)
+        expiry = self.get_backend_ttl(ttl)
+        with self._key_lock(key):
+            return self._set(key, stored, size, expiry)
+
+    @make_key_decorator_and_validate
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        stored = value if type(value) is int else self._serializer.dumps(value)
+        size = self._sizeof(stored)
+        expiry = self.get_backend_ttl(ttl)
+        with self._key_lock(key):
+            if self._get_live(key, key_locked=True) is not _empty:
+                return False
+            return self._set(key, stored, size, expiry)
+
+    @make_many_keys_decorator
+    def get_many(
+        self, keys: t.List[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        result = {}
+        for key in keys:
+            stored = self._get_live(key)
+            if stored is _empty:
+                self.misses += 1
+                continue
+
+            self.hits += 1
+            result[key] = (
+                stored if type(stored) is int else self._serializer.load(stored)
+            )
+        return result
+
+    @make_many_keys_decorator_and_validate
+    def set_many(
+        self,
+        mapping: t.Dict[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        items = []
+        for key, value in mapping.items():
+            stored = value if type(value) is int else self._serializer.dumps(value)
+            items.append((key, stored, self._sizeof(stored)))
+
+        expiry = self.get_backend_ttl(ttl)
+        failed = []
+        with self._many_keys_lock(mapping):
+            self._sweep_expired()
+            for key, stored, size in items:
+                if self._max_bytes is not None and size > self._max_bytes:
+                    self._delete(key)
+                    failed.append(key)
+                    continue
+                self._store(key, stored, size)
+                self._set_expiry(key, expiry)
+            self._evict()
+        return failed
+
+    @make_many_keys_decorator
+    def delete_many(self, keys: t.List[str], version: t.Optional[str] = None) -> None:
+        with self._many_keys_lock(keys):
+            for key in keys:
+                self._delete(key)
+
+    def clear(self) -> None:
+        with contextlib.ExitStack() as stack:
+            for lock in self._key_locks:
+                stack.enter_context(lock)
+            stack.enter_context(self._lock)
+            self._cache.clear()
+            self._sizes.clear()
+            self._expire_track.clear()
+            self._expiry_heap = []
+            self._size = 0
+
+    async def clear_async(self) -> None:
+        self.clear()
 
     def _has_expired(self, key: str) -> bool:
         exp = self._expire_track.get(key, -1)
         return exp is not None and exp <= time.time()
 
     @make_key_decorator
-    async def has_key_async(self, key: str, version: t.Optional[str] = None) -> bool:
-        async with self._lock:
-            if self._has_expired(key):
-                await self._delete(key)
-                return False
-            return True
+    def has_key(self, key: str, version: t.Optional[str] = None) -> bool:
+        return self._get_live(key) is not _empty
 
     @make_key_decorator
-    async def touch_async(
+    def touch(
         self,
         key: str,
         ttl: t.Union[float, int, None] = None,
         version: t.Optional[str] = None,
     ) -> bool:
-        async with self._lock:
-            if self._has_expired(key):
+        expiry = self.get_backend_ttl(ttl)
+        with self._key_lock(key), self._lock:
+            # checked under the shared lock, so the key can not be evicted in between
+            if key not in self._cache or self._has_expired(key):
+                self._delete(key)
                 return False
 
-            self._expire_track[key] = self.get_backend_ttl(ttl)
+            self._set_expiry(key, expiry)
             return True
 
-    def has_key(self, key: str, version: t.Optional[str] = None) -> bool:
-        res = self._async_executor(self.has_key_async(key, version=version))
-        return bool(res)
-
-    def _incr_decr_action(self, key: str, delta: int) -> int:
-        pickled = self._cache[key]
-        value = t.cast(int, pickle.loads(pickled))
-        new_value = value + delta
-        pickled = pickle.dumps(new_value, self.pickle_protocol)
-        self._cache[key] = pickled
+    def _incr_decr_action(self, key: str, delta: int, floor: bool = False) -> int:
+        # the caller holds the lock of `key`
+        value = self._get_live(key, key_locked=True)
+        if value is _empty:
+            raise ValueError("Key '%s' not found" % key)
+        if type(value) is not int:
+            value = self._serializer.load(value)
+
+        new_value = t.cast(int, value + delta)
+        if floor and new_value < 0:
+            new_value = 0
+
+        stored = (
+            new_value if type(new_value) is int else self._serializer.dumps(new_value)
+        )
+        with self._lock:
+            if key not in self._cache:
+                # evicted by a write to another key in between
+                raise ValueError("Key '%s' not found" % key)
+            self._store(key, stored, self._sizeof(stored))
+            self._evict()
         return new_value
 
     @make_key_decorator
-    async def incr_async(
-        self, key: str, delta: int = 1, version: t.Optional[str] = None
-    ) -> int:
-        async with self._lock:
-            if self._has_expired(key):
-                await self._delete(key)
-                raise ValueError("Key '%s' not found" % key)
+    def incr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
+        with self._key_lock(key):
             return self._incr_decr_action(key, delta)
 
     @make_key_decorator
-    async def decr_async(
-        self, key: str, delta: int = 1, version: t.Optional[str] = None
-    ) -> int:
-        async with self._lock:
-            if self._has_expired(key):
-                await self._delete(key)
-                raise ValueError("Key '%s' not found" % key)
-            res = self._incr_decr_action(key, delta * -1)
-            if res < 0:
-                return self._incr_decr_action(key, res * -1)
-            return res
+    def decr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
+        with self._key_lock(key):
+            return self._incr_decr_action(key, delta * -1, floor=True)
@@ -1,8 +1,12 @@
+import asyncio
+import itertools
 import random
+import time
 import typing as t
+import weakref
 from abc import ABC
 
-from ellar.utils.event_loop import get_or_create_eventloop
+from ellar.threading import run_in_event_loop_thread
 
 try:
     from redis.asyncio import Redis
@@ -13,15 +17,23 @@ except ImportError as e:  # pragma: no cover
     ) from e
 
 
-from ...interface import IBaseCacheBackendAsync
-from ...make_key_decorator import make_key_decorator, make_key_decorator_and_validate
+from ...interface import IBaseCacheBackendAsync, ICacheBackendPubSub
+from ...make_key_decorator import (
+    make_key_decorator,
+    make_key_decorator_and_validate,
+    make_many_keys_decorator,
+    make_many_keys_decorator_and_validate,
+)
 from ...model import BaseCacheBackend
 from ..serializer import ICacheSerializer, RedisSerializer
+from .pipeline import AutoPipeline
 
 
 class _RedisCacheBackendSync(IBaseCacheBackendAsync, ABC):
-    def _async_executor(self, func: t.Awaitable) -> t.Any:
-        return get_or_create_eventloop().run_until_complete(func)
+    def _async_executor(self, func: t.Coroutine) -> t.Any:
+        # runs on a shared background loop, so it works from threadpool workers
+        # and from threads already running an event loop
+        return run_in_event_loop_thread(func)
 
     def get(self, key: str, version: t.Optional[str] = None) -> t.Any:
         return self._async_executor(self.get_async(key, version=version))
@@ -40,6 +52,16 @@ class _RedisCacheBackendSync(IBaseCacheBackendAsync, ABC):
         res = self._async_executor(self.set_async(key, value, version=version, ttl=ttl))
         return bool(res)
 
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        res = self._async_executor(self.add_async(key, value, version=version, ttl=ttl))
+        return bool(res)
+
     def touch(
         self,
         key: str,
@@ -61,8 +83,30 @@ class _RedisCacheBackendSync(IBaseCacheBackendAsync, ABC):
         res = self._async_executor(self.decr_async(key, delta=delta, version=version))
         return t.cast(int, res)
 
+    def get_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        res = self._async_executor(self.get_many_async(keys, version=version))
+        return t.cast(t.Dict[str, t.Any], res)
+
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        res = self._async_executor(
+            self.set_many_async(mapping, ttl=ttl, version=version)
+        )
+        return t.cast(t.List[str], res)
+
+    def delete_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        self._async_executor(self.delete_many_async(keys, version=version))
 
-class RedisCacheBackend(_RedisCacheBackendSync, BaseCacheBackend):
+
+class RedisCacheBackend(_RedisCacheBackendSync, BaseCacheBackend, ICacheBackendPubSub):
     MEMCACHE_CLIENT: t.Type[Redis] = Redis
     """Redis-based cache backend.
 
@@ -77,45 +121,94 @@ class RedisCacheBackend(_RedisCacheBackendSync, BaseCacheBackend):
 
     """
 
+    READ_STRATEGIES = ("random", "round_robin", "least_latency")
+    HEALTH_CHECK_INTERVAL = 30
+    # weight of the last read in the moving average used by `least_latency`
+    LATENCY_SMOOTHING = 0.2
+
     def __init__(
         self,
         servers: t.List[str],
         options: t.Optional[t.Dict] = None,
         serializer: t.Optional[ICacheSerializer] = None,
+        read_strategy: str = "random",
+        auto_pipeline: bool = True,
         **kwargs: t.Any,
     ) -> None:
         super().__init__(**kwargs)
+        if read_strategy not in self.READ_STRATEGIES:
+            raise ValueError(
+                f"Invalid read_strategy={read_strategy!r}, expected one of "
+                f"{list(self.READ_STRATEGIES)}"
+            )
 
-        self._pools: t.Dict[int, ConnectionPool] = {}
+        # clients and their connection pools are bound to the event loop they are used from
+        self._pipelines: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, t.Dict[int, AutoPipeline]
+        ] = weakref.WeakKeyDictionary()
         self._servers = servers
         _default_options = options or {}
         self._options = {
+            # connections idle for longer are checked with a PING before being reused
+            "health_check_interval": self.HEALTH_CHECK_INTERVAL,
             **_default_options,
         }
         self._serializer = serializer or RedisSerializer()
+        self._read_strategy = read_strategy
+        self._auto_pipeline = auto_pipeline
+        self._round_robin = itertools.cycle(range(1, max(len(servers), 2)))
+        self._latencies = [0.0] * len(servers)
 
     def _get_connection_pool_index(self, write: bool) -> int:
         # Write to the first server. Read from other servers if there are more,
         # otherwise read from the first server.
         if write or len(self._servers) == 1:
             return 0
+        if self._read_strategy == "round_robin":
+            return next(self._round_robin)
+        if self._read_strategy == "least_latency":
+            # replicas not read from yet have a latency of 0 and are tried first
+            return min(range(1, len(self._servers)), key=self._latencies.__getitem__)
         return random.randint(1, len(self._servers) - 1)
 
-    def _get_connection_pool(self, write: bool) -> ConnectionPool:
-        index = self._get_connection_pool_index(write)
-        if index not in self._pools:
-            self._pools[index] = ConnectionPool.from_url(
-                self._servers[index],
-                **self._options,
+    def _record_latency(self, index: int, latency: float) -> None:
+        self._latencies[index] += self.LATENCY_SMOOTHING * (
+            latency - self._latencies[index]
+        )
+
+    def _get_auto_pipeline(self, index: int) -> AutoPipeline:
+        loop = asyncio.get_running_loop()
+        pipelines = self._pipelines.get(loop)
+        if pipelines is None:
+            pipelines = self._pipelines[loop] = {}
+
+        pipeline = pipelines.get(index)
+        if pipeline is None:
+            pool = ConnectionPool.from_url(self._servers[index], **self._options)
+            pipeline = pipelines[index] = AutoPipeline(
+                self.MEMCACHE_CLIENT(connection_pool=pool)
             )
-        return self._pools[index]
+        return pipeline
 
     def _get_client(self, *, write: bool = False) -> Redis:
-        # key is used so that the method signature remains the same and custom
-        # cache client can be implemented which might require the key to select
-        # the server, e.g. sharding.
-        pool = self._get_connection_pool(write)
-        return self.MEMCACHE_CLIENT(connection_pool=pool)
+        """Returns the long-lived client of the server to use, for the running loop."""
+        index = self._get_connection_pool_index(write)
+        return self._get_auto_pipeline(index).client
+
+    async def _execute(
+        self, command: str, *args: t.Any, write: bool = False, **kwargs: t.Any
+    ) -> t.Any:
+        index = self._get_connection_pool_index(write)
+        pipeline = self._get_auto_pipeline(index)
+        start = time.perf_counter()
+        if self._auto_pipeline:
+            result = await pipeline.execute(command, *args, **kwargs)
+        else:
+            result = await getattr(pipeline.client, command)(*args, **kwargs)
+
+        if not write:
+            self._record_latency(index, time.perf_counter() - start)
+        return result
 
     def get_backend_ttl(
         self, ttl: t.Union[float, int, None] = None
@@ -128,8 +221,7 @@ class RedisCacheBackend(_RedisCacheBackendSync, BaseCacheBackend):
 
     @make_key_decorator
     async def get_async(self, key: str, version: t.Optional[str] = None) -> t.Any:
-        client = self._get_client()
-        value = await client.get(key)
+        value = await self._execute("get", key)
         if value is not None:
             return self._serializer.load(value)
         return None
@@ -142,17 +234,40 @@ class RedisCacheBackend(_RedisCacheBackendSync, BaseCacheBackend):
         ttl: t.Union[float, int, None] = None,
         version: t.Optional[str] = None,
     ) -> bool:
-        client = self._get_client()
         value = self._serializer.dumps(value)
         if ttl == 0:
-            await client.delete(key)
+            await self._execute("delete", key, write=True)
 
-        return bool(await client.set(key, value, ex=self.get_backend_ttl(ttl)))
+        return bool(
+            await self._execute(
+                "set", key, value, ex=self.get_backend_ttl(ttl), write=True
+            )
+        )
+
+    @make_key_decorator_and_validate
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        value = self._serializer.dumps(value)
+        if ttl == 0:
+            # added and expired right away
+            added = await self._execute("set", key, value, nx=True, write=True)
+            if added:
+                await self._execute("delete", key, write=True)
+            return bool(added)
+
+        result = await self._execute(
+            "set", key, value, ex=self.get_backend_ttl(ttl), nx=True, write=True
+        )
+        return bool(result)
 
     @make_key_decorator
     async def delete_async(self, key: str, version: t.Optional[str] = None) -> bool:
-        client = self._get_client()
-        result = await client.delete(key)
+        result = await self._execute("delete", key, write=True)
         return bool(result)
 
     @make_key_decorator
@@ -162,32 +277,87 @@ class RedisCacheBackend(_RedisCacheBackendSync, BaseCacheBackend):
         ttl: t.Union[float, int, None] = None,
         version: t.Optional[str] = None,
     ) -> bool:
-        client = self._get_client()
         if ttl is None:
-            res = await client.persist(key)
+            res = await self._execute("persist", key, write=True)
             return bool(res)
 
-        res = await client.expire(key, int(self.get_backend_ttl(ttl)))
+        res = await self._execute(
+            "expire", key, int(self.get_backend_ttl(ttl)), write=True
+        )
         return bool(res)
 
     @make_key_decorator
     async def has_key_async(self, key: str, version: t.Optional[str] = None) -> bool:
-        client = self._get_client()
-        res = await client.exists(key)
+        res = await self._execute("exists", key)
         return bool(res)
 
     @make_key_decorator
     async def incr_async(
         self, key: str, delta: int = 1, version: t.Optional[str] = None
     ) -> int:
-        client = self._get_client()
-        res = await client.incr(key, amount=delta)
-        return res
+        res = await self._execute("incr", key, amount=delta, write=True)
+        return t.cast(int, res)
 
     @make_key_decorator
     async def decr_async(
         self, key: str, delta: int = 1, version: t.Optional[str] = None
     ) -> int:
+        res = await self._execute("decr", key, amount=delta, write=True)
+        return t.cast(int, res)
+
+    @make_many_keys_decorator
+    async def get_many_async(
+        self, keys: t.List[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        if not keys:
+            return {}
         client = self._get_client()
-        res = await client.decr(key, amount=delta)
-        return res
+        values = await client.mget(keys)
+        return {
+            key: self._serializer.load(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    @make_many_keys_decorator_and_validate
+    async def set_many_async(
+        self,
+        mapping: t.Dict[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        if not mapping:
+            return []
+        client = self._get_client(write=True)
+        if ttl == 0:
+            await client.delete(*mapping)
+            return []
+
+        ex = self.get_backend_ttl(ttl)
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, self._serializer.dumps(value), ex=ex)
+            results = await pipe.execute()
+        return [key for key, result in zip(mapping, results) if not result]
+
+    @make_many_keys_decorator
+    async def delete_many_async(
+        self, keys: t.List[str], version: t.Optional[str] = None
+    ) -> None:
+        if keys:
+            client = self._get_client(write=True)
+            await client.delete(*keys)
+
+    async def publish_async(self, channel: str, message: bytes) -> None:
+        await self._get_client(write=True).publish(channel, message)
+
+    async def subscribe_async(self, channel: str) -> t.AsyncIterator[bytes]:
+        # a subscribed connection can not run other commands, pubsub() holds its own one
+        pubsub = self._get_client(write=True).pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()  # type: ignore[no-untyped-call]
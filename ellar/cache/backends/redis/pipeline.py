@@ -0,0 +1,66 @@
+import asyncio
+import typing as t
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from redis.asyncio import Redis
+
+
+class AutoPipeline:
+    """
+    Sends the commands issued in the same event loop iteration as one pipeline.
+
+    A command waits until the running callbacks of the loop iteration are done and is then
+    sent together with every other command queued in the meantime, in a single round trip.
+    A lone command is sent as it is, without a pipeline.
+    """
+
+    __slots__ = ("client", "_pending", "_flushes")
+
+    def __init__(self, client: "Redis") -> None:
+        self.client = client
+        self._pending: t.List[
+            t.Tuple[str, t.Tuple, t.Dict[str, t.Any], asyncio.Future]
+        ] = []
+        # the loop only keeps weak references to tasks, running flushes are kept here
+        self._flushes: t.Set[asyncio.Task] = set()
+
+    def execute(self, command: str, *args: t.Any, **kwargs: t.Any) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((command, args, kwargs, future))
+        if len(self._pending) == 1:
+            loop.call_soon(self._schedule_flush, loop)
+        return future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        pending, self._pending = self._pending, []
+        task = loop.create_task(self._flush(pending))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self,
+        pending: t.List[t.Tuple[str, t.Tuple, t.Dict[str, t.Any], asyncio.Future]],
+    ) -> None:
+        try:
+            if len(pending) == 1:
+                command, args, kwargs, _ = pending[0]
+                results = [await getattr(self.client, command)(*args, **kwargs)]
+            else:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    for command, args, kwargs, _ in pending:
+                        getattr(pipe, command)(*args, **kwargs)
+                    results = await pipe.execute(raise_on_error=False)
+        except Exception as ex:
+            for *_, future in pending:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for (*_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -1,3 +1,4 @@
+import copy
 import pickle
 import typing as t
 from abc import ABC, abstractmethod
@@ -33,16 +34,67 @@ class RedisSerializer(ICacheSerializer):
         return pickle.dumps(data, self._protocol)
 
 
-# class AioCacheSerializer(RedisSerializer):
-#     def load(self, data: t.Any) -> t.Any:
-#         try:
-#             return int(data.decode("utf-8"))
-#         except ValueError:
-#             return pickle.loads(data)
-#
-#     def dumps(self, data: t.Any) -> t.Any:
-#         # Only skip pickling for integers, an int subclasses as bool should be
-#         # pickled.
-#         if type(data) is int:
-#             return str(data).encode("utf-8")
-#         return pickle.dumps(data, self._protocol)
+class PickleSerializer(ICacheSerializer):
+    """Pickles values, except integers which are kept as they are."""
+
+    def __init__(self, protocol: t.Optional[int] = None) -> None:
+        self._protocol = protocol or self.default_protocol
+
+    def load(self, data: t.Any) -> t.Any:
+        if type(data) is int:
+            return data
+        return pickle.loads(data)
+
+    def dumps(self, data: t.Any) -> t.Any:
+        if type(data) is int:
+            return data
+        return pickle.dumps(data, self._protocol)
+
+
+class ReferenceSerializer(ICacheSerializer):
+    """
+    Keeps values as they are. Changes made to a cached object are seen
+    by every reader, so it should only be used for immutable values.
+    """
+
+    def load(self, data: t.Any) -> t.Any:
+        return data
+
+    def dumps(self, data: t.Any) -> t.Any:
+        return data
+
+
+class CopySerializer(ICacheSerializer):
+    """Keeps a copy of values and returns a copy of it on every read."""
+
+    def __init__(self, deep: bool = False) -> None:
+        self._deep = deep
+
+    def _copy(self, data: t.Any) -> t.Any:
+        return copy.deepcopy(data) if self._deep else copy.copy(data)
+
+    def load(self, data: t.Any) -> t.Any:
+        return self._copy(data)
+
+    def dumps(self, data: t.Any) -> t.Any:
+        return self._copy(data)
+
+
+class MemcacheSerializer(RedisSerializer):
+    """
+    Pickles values to bytes. Integers are stored as their decimal representation,
+    which memcached can increment and decrement.
+    """
+
+    def load(self, data: t.Any) -> t.Any:
+        try:
+            return int(data)
+        except ValueError:
+            return pickle.loads(data)
+
+    def dumps(self, data: t.Any) -> t.Any:
+        # Only skip pickling for integers, an int subclasses as bool should be
+        # pickled.
+        if type(data) is int:
+            return str(data).encode("utf-8")
+        return pickle.dumps(data, self._protocol)
@@ -0,0 +1,448 @@
+import asyncio
+import json
+import threading
+import typing as t
+import uuid
+
+from ellar.common.logging import logger
+from ellar.threading import EventLoopThread, run_in_event_loop_thread
+
+from ..interface import ICacheBackendPubSub
+from ..model import BaseCacheBackend
+
+
+class TieredCacheBackend(BaseCacheBackend):
+    """
+    Cache backend layering a small in-process backend (L1) in front of a shared one (L2).
+
+    Reads are served by L1 when possible, otherwise by L2, and values read from L2
+    are kept in L1 for `l1_ttl` seconds. Writes go to both tiers and deletes
+    remove the key from both.
+
+    L1 entries of other workers are stale for at most `l1_ttl` seconds after a write.
+    With `invalidation_channel`, writes are also published on that channel of L2,
+    which must implement `ICacheBackendPubSub`, and every worker removes the written
+    keys from its L1 as soon as it receives them.
+
+    Construct example::
+        backend = TieredCacheBackend(
+            l1=LocalMemCacheBackend(max_entries=1000),
+            l2=RedisCacheBackend(servers=['redis://localhost:6379/0']),
+            l1_ttl=5,
+            invalidation_channel='ellar-cache-invalidation',
+        )
+    """
+
+    L1_TTL: t.Union[float, int] = 5
+    # seconds to wait before subscribing again after the channel failed
+    RESUBSCRIBE_INTERVAL: float = 1
+
+    def __init__(
+        self,
+        l1: BaseCacheBackend,
+        l2: BaseCacheBackend,
+        l1_ttl: t.Union[float, int, None] = None,
+        invalidation_channel: t.Optional[str] = None,
+        **kwargs: t.Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if invalidation_channel and not isinstance(l2, ICacheBackendPubSub):
+            raise ValueError(
+                f"{type(l2).__name__} does not support publishing invalidations, "
+                f"`invalidation_channel` requires a backend implementing ICacheBackendPubSub"
+            )
+
+        self._l1 = l1
+        self._l2 = l2
+        self._l1_ttl = l1_ttl if l1_ttl is not None else self.L1_TTL
+        self._invalidation_channel = invalidation_channel
+        # tells the messages of this backend apart from the ones of other workers
+        self._id = uuid.uuid4().hex
+
+        self._listener: t.Optional[asyncio.Task] = None
+        self._listener_thread: t.Optional[EventLoopThread] = None
+        self._listener_lock = threading.Lock()
+
+        # counters are updated without locking and may miss concurrent updates
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    @property
+    def key_prefix(self) -> str:
+        return self._l2.key_prefix
+
+    @property
+    def _local(self) -> BaseCacheBackend:
+        """L1, once the invalidations of other workers are listened to."""
+        if self._listener is None and self._invalidation_channel:
+            self._start_listener()
+        return self._l1
+
+    def get_stats(self) -> t.Dict[str, int]:
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+        }
+
+    def _get_l1_ttl(self, ttl: t.Union[float, int, None]) -> t.Union[float, int]:
+        return self._l1_ttl if ttl is None else min(ttl, self._l1_ttl)
+
+    # Invalidations
+
+    def _start_listener(self) -> None:
+        with self._listener_lock:
+            if self._listener is not None:
+                return
+            thread = EventLoopThread(name="ellar-cache-invalidation")
+            self._listener = thread.run(self._create_listener())
+            self._listener_thread = thread
+
+    async def _create_listener(self) -> asyncio.Task:
+        return asyncio.ensure_future(self._listen())
+
+    @staticmethod
+    async def _cancel_listener(listener: asyncio.Task) -> None:
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+
+    async def _listen(self) -> None:
+        l2 = t.cast(ICacheBackendPubSub, self._l2)
+        channel = t.cast(str, self._invalidation_channel)
+        while True:
+            try:
+                async for message in l2.subscribe_async(channel):
+                    await self._on_invalidation(message)
+            except Exception:
+                logger.warning(
+                    "Cache invalidation channel '%s' failed", channel, exc_info=True
+                )
+            # writes published while not subscribed are lost
+            await self._clear_l1_async()
+            await asyncio.sleep(self.RESUBSCRIBE_INTERVAL)
+
+    async def _on_invalidation(self, message: bytes) -> None:
+        data = json.loads(message)
+        if data["id"] == self._id:
+            return
+        if data.get("clear"):
+            await self._clear_l1_async()
+        else:
+            await self._l1.delete_many_async(data["keys"], version=data["version"])
+
+    def _invalidation_message(
+        self,
+        keys: t.Optional[t.Iterable[str]] = None,
+        version: t.Optional[str] = None,
+    ) -> bytes:
+        if keys is None:
+            data: t.Dict[str, t.Any] = {"id": self._id, "clear": True}
+        else:
+            data = {"id": self._id, "keys": list(keys), "version": version}
+        return json.dumps(data).encode()
+
+    async def _publish_async(
+        self,
+        keys: t.Optional[t.Iterable[str]] = None,
+        version: t.Optional[str] = None,
+    ) -> None:
+        if self._invalidation_channel:
+            await t.cast(ICacheBackendPubSub, self._l2).publish_async(
+                self._invalidation_channel, self._invalidation_message(keys, version)
+            )
+
+    def _publish(
+        self,
+        keys: t.Optional[t.Iterable[str]] = None,
+        version: t.Optional[str] = None,
+    ) -> None:
+        if self._invalidation_channel:
+            run_in_event_loop_thread(self._publish_async(keys, version))
+
+    async def _clear_l1_async(self) -> None:
+        clear_async = getattr(self._l1, "clear_async", None)
+        if clear_async is not None:
+            await clear_async()
+
+    def close(self, **kwargs: t.Any) -> None:
+        with self._listener_lock:
+            listener, thread = self._listener, self._listener_thread
+            self._listener = self._listener_thread = None
+        if listener is not None and thread is not None:
+            thread.run(self._cancel_listener(listener))
+            thread.stop()
+
+        for backend in (self._l1, self._l2):
+            close = getattr(backend, "close", None)
+            if close is not None:
+                close(**kwargs)
+
+    def clear(self) -> None:
+        for backend in (self._l1, self._l2):
+            clear = getattr(backend, "clear", None)
+            if clear is not None:
+                clear()
+        self._publish()
+
+    async def clear_async(self) -> None:
+        for backend in (self._l1, self._l2):
+            clear_async = getattr(backend, "clear_async", None)
+            if clear_async is not None:
+                await clear_async()
+        await self._publish_async()
+
+    # Async API
+
+    async def get_async(self, key: str, version: t.Optional[str] = None) -> t.Any:
+        l1 = self._local
+        value = await l1.get_async(key, version=version)
+        if value is not None:
+            self.l1_hits += 1
+            return value
+
+        value = await self._l2.get_async(key, version=version)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.l2_hits += 1
+        await l1.set_async(key, value, ttl=self._l1_ttl, version=version)
+        return value
+
+    async def set_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        result = await self._l2.set_async(key, value, ttl=ttl, version=version)
+        if result:
+            await self._local.set_async(
+                key, value, ttl=self._get_l1_ttl(ttl), version=version
+            )
+        else:
+            await self._local.delete_async(key, version=version)
+        await self._publish_async([key], version)
+        return result
+
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        result = await self._l2.add_async(key, value, ttl=ttl, version=version)
+        if result:
+            await self._local.set_async(
+                key, value, ttl=self._get_l1_ttl(ttl), version=version
+            )
+            await self._publish_async([key], version)
+        return result
+
+    async def delete_async(self, key: str, version: t.Optional[str] = None) -> bool:
+        await self._local.delete_async(key, version=version)
+        result = await self._l2.delete_async(key, version=version)
+        await self._publish_async([key], version)
+        return result
+
+    async def touch_async(
+        self,
+        key: str,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        await self._local.touch_async(key, ttl=self._get_l1_ttl(ttl), version=version)
+        return await self._l2.touch_async(key, ttl=ttl, version=version)
+
+    async def has_key_async(self, key: str, version: t.Optional[str] = None) -> bool:
+        if await self._local.has_key_async(key, version=version):
+            return True
+        return await self._l2.has_key_async(key, version=version)
+
+    async def incr_async(
+        self, key: str, delta: int = 1, version: t.Optional[str] = None
+    ) -> int:
+        result = await self._l2.incr_async(key, delta=delta, version=version)
+        # counters are read from L2, so every worker sees the last value
+        await self._local.delete_async(key, version=version)
+        await self._publish_async([key], version)
+        return result
+
+    async def decr_async(
+        self, key: str, delta: int = 1, version: t.Optional[str] = None
+    ) -> int:
+        result = await self._l2.decr_async(key, delta=delta, version=version)
+        await self._local.delete_async(key, version=version)
+        await self._publish_async([key], version)
+        return result
+
+    async def get_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        keys = list(keys)
+        l1 = self._local
+        result = await l1.get_many_async(keys, version=version)
+        self.l1_hits += len(result)
+        missing = [key for key in keys if key not in result]
+        if not missing:
+            return result
+
+        values = await self._l2.get_many_async(missing, version=version)
+        self.l2_hits += len(values)
+        self.misses += len(missing) - len(values)
+        if values:
+            await l1.set_many_async(values, ttl=self._l1_ttl, version=version)
+            result.update(values)
+        return result
+
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        failed = await self._l2.set_many_async(mapping, ttl=ttl, version=version)
+        l1 = self._local
+        if failed:
+            await l1.delete_many_async(failed, version=version)
+        await l1.set_many_async(
+            {key: value for key, value in mapping.items() if key not in failed},
+            ttl=self._get_l1_ttl(ttl),
+            version=version,
+        )
+        await self._publish_async(mapping, version)
+        return failed
+
+    async def delete_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        keys = list(keys)
+        await self._local.delete_many_async(keys, version=version)
+        await self._l2.delete_many_async(keys, version=version)
+        await self._publish_async(keys, version)
+
+    # Sync API
+
+    def get(self, key: str, version: t.Optional[str] = None) -> t.Any:
+        l1 = self._local
+        value = l1.get(key, version=version)
+        if value is not None:
+            self.l1_hits += 1
+            return value
+
+        value = self._l2.get(key, version=version)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.l2_hits += 1
+        l1.set(key, value, ttl=self._l1_ttl, version=version)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        result = self._l2.set(key, value, ttl=ttl, version=version)
+        if result:
+            self._local.set(key, value, ttl=self._get_l1_ttl(ttl), version=version)
+        else:
+            self._local.delete(key, version=version)
+        self._publish([key], version)
+        return result
+
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        result = self._l2.add(key, value, ttl=ttl, version=version)
+        if result:
+            self._local.set(key, value, ttl=self._get_l1_ttl(ttl), version=version)
+            self._publish([key], version)
+        return result
+
+    def delete(self, key: str, version: t.Optional[str] = None) -> bool:
+        self._local.delete(key, version=version)
+        result = self._l2.delete(key, version=version)
+        self._publish([key], version)
+        return result
+
+    def touch(
+        self,
+        key: str,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        self._local.touch(key, ttl=self._get_l1_ttl(ttl), version=version)
+        return self._l2.touch(key, ttl=ttl, version=version)
+
+    def has_key(self, key: str, version: t.Optional[str] = None) -> bool:
+        if self._local.has_key(key, version=version):
+            return True
+        return self._l2.has_key(key, version=version)
+
+    def incr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
+        result = self._l2.incr(key, delta=delta, version=version)
+        self._local.delete(key, version=version)
+        self._publish([key], version)
+        return result
+
+    def decr(self, key: str, delta: int = 1, version: t.Optional[str] = None) -> int:
+        result = self._l2.decr(key, delta=delta, version=version)
+        self._local.delete(key, version=version)
+        self._publish([key], version)
+        return result
+
+    def get_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        keys = list(keys)
+        l1 = self._local
+        result = l1.get_many(keys, version=version)
+        self.l1_hits += len(result)
+        missing = [key for key in keys if key not in result]
+        if not missing:
+            return result
+
+        values = self._l2.get_many(missing, version=version)
+        self.l2_hits += len(values)
+        self.misses += len(missing) - len(values)
+        if values:
+            l1.set_many(values, ttl=self._l1_ttl, version=version)
+            result.update(values)
+        return result
+
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        failed = self._l2.set_many(mapping, ttl=ttl, version=version)
+        l1 = self._local
+        if failed:
+            l1.delete_many(failed, version=version)
+        l1.set_many(
+            {key: value for key, value in mapping.items() if key not in failed},
+            ttl=self._get_l1_ttl(ttl),
+            version=version,
+        )
+        self._publish(mapping, version)
+        return failed
+
+    def delete_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        keys = list(keys)
+        self._local.delete_many(keys, version=version)
+        self._l2.delete_many(keys, version=version)
+        self._publish(keys, version)
@@ -1,16 +1,26 @@
+import copy
 import dataclasses
+import hashlib
+import math
+import time
 import typing as t
+import uuid
 
+import anyio
 from ellar.cache.interface import ICacheService
+from ellar.cache.response import CachedHTTPResponse, ResponseRecorder, etag_matches
 from ellar.common import (
     EllarInterceptor,
     IExecutionContext,
+    Response,
     UseInterceptors,
     set_metadata,
 )
 from ellar.common.constants import ROUTE_CACHE_OPTIONS
+from ellar.common.logging import logger
 from ellar.core import Reflector
 from ellar.di import injectable
+from starlette.background import BackgroundTasks
 
 
 @dataclasses.dataclass
@@ -20,6 +30,41 @@ class RouteCacheOptions:
     make_key_callback: t.Callable[[IExecutionContext, str], str]
     version: t.Optional[str] = None
     backend: str = "default"
+    stale_ttl: t.Union[int, float] = 0
+    lock: bool = False
+    lock_ttl: t.Union[int, float] = 10
+    cache_response: bool = False
+    vary: t.Sequence[str] = ()
+
+
+class RouteCacheEntry(t.NamedTuple):
+    """
+    Cached route value. Wrapping the value lets falsy and `None` values be cached,
+    since backends return `None` for missing keys.
+    """
+
+    fresh_until: float
+    value: t.Any
+
+
+# responses are only cached for safe requests
+_RESPONSE_CACHE_METHODS = ("GET", "HEAD")
+
+
+class _RouteCacheResult(t.NamedTuple):
+    value: t.Any
+    # entry cached by the lock owner, when this worker did not run the handler
+    entry: t.Optional[RouteCacheEntry] = None
+
+
+class _RouteCacheFlight:
+    """A route value being computed, awaited by concurrent requests of the same key."""
+
+    __slots__ = ("done", "result")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: t.Optional[_RouteCacheResult] = None
 
 
 def _route_cache_make_key(context: IExecutionContext, key_prefix: str) -> str:
@@ -28,16 +73,31 @@ def _route_cache_make_key(context: IExecutionContext, key_prefix: str) -> str:
     return f"{connection.get_client().url}:{key_prefix or 'view'}"
 
 
+def _route_cache_vary_key(context: IExecutionContext, vary: t.Sequence[str]) -> str:
+    """Hash of the request headers a cached response varies on"""
+    headers = context.switch_to_http_connection().get_client().headers
+    values = "\n".join(headers.get(header, "") for header in vary)
+    return hashlib.blake2b(values.encode(), digest_size=16).hexdigest()
+
+
 @injectable
 class _CacheEllarInterceptor(EllarInterceptor):
     __slots__ = (
         "_cache_service",
         "_reflector",
+        "_flights",
+        "_refreshing",
     )
 
+    # seconds between two reads of a key locked by another worker
+    LOCK_POLL_INTERVAL = 0.05
+
     def __init__(self, cache_service: ICacheService, reflector: "Reflector") -> None:
         self._cache_service = cache_service
         self._reflector = reflector
+        # computations and background refreshes running in this worker
+        self._flights: t.Dict[t.Tuple, _RouteCacheFlight] = {}
+        self._refreshing: t.Set[t.Tuple] = set()
 
     async def intercept(
         self, context: IExecutionContext, next_interceptor: t.Callable[..., t.Coroutine]
@@ -46,24 +106,249 @@ class _CacheEllarInterceptor(EllarInterceptor):
             ROUTE_CACHE_OPTIONS, context.get_handler()
         )
 
+        if opts.cache_response and context.get_args()[0]["method"] not in (
+            _RESPONSE_CACHE_METHODS
+        ):
+            return await next_interceptor()
+
         backend = self._cache_service.get_backend(backend=opts.backend)
         key = opts.make_key_callback(context, opts.key_prefix or backend.key_prefix)
+        if opts.vary:
+            key = f"{key}:{_route_cache_vary_key(context, opts.vary)}"
+
+        entry = await self._get_entry(key, opts)
+        if entry is not None:
+            if entry.fresh_until > time.time():
+                return self._cached_value(context, key, opts, entry)
+            if opts.stale_ttl:
+                return self._serve_stale(context, next_interceptor, key, opts, entry)
+
+        result, ran_handler = await self._single_flight(next_interceptor, key, opts)
+        if result.entry is not None:
+            return self._cached_value(context, key, opts, result.entry, record=False)
+        if opts.cache_response and ran_handler:
+            # only the response sent by the request that ran the handler is recorded
+            self._record_response(context, key, opts)
+        return result.value
+
+    def _cached_value(
+        self,
+        context: IExecutionContext,
+        key: str,
+        opts: RouteCacheOptions,
+        entry: RouteCacheEntry,
+        record: bool = True,
+    ) -> t.Any:
+        value = entry.value
+        if not opts.cache_response:
+            return value
 
-        cached_value = await self._cache_service.get_async(
+        if not isinstance(value, CachedHTTPResponse):
+            # a refreshed value is rendered by this request and recorded, unless
+            # the worker that computed it records its own response
+            if record:
+                self._record_response(context, key, opts, entry.fresh_until)
+            return value
+
+        if_none_match = (
+            context.switch_to_http_connection()
+            .get_client()
+            .headers.get("if-none-match")
+        )
+        if if_none_match and etag_matches(value.etag, if_none_match):
+            return value.to_not_modified_response()
+        return value.to_response()
+
+    def _record_response(
+        self,
+        context: IExecutionContext,
+        key: str,
+        opts: RouteCacheOptions,
+        fresh_until: t.Optional[float] = None,
+    ) -> None:
+        """
+        Replaces the cached value by the bytes of the response sent for it, or removes it
+        when the response can not be cached.
+        """
+
+        async def _on_record(response: t.Optional[CachedHTTPResponse]) -> None:
+            if response is None:
+                await self._cache_service.delete_async(
+                    key, version=opts.version, backend=opts.backend
+                )
+            else:
+                await self._set_entry(key, opts, response, fresh_until=fresh_until)
+
+        send = context.get_args()[2]
+        context.send = ResponseRecorder(send, _on_record, opts.vary)  # type: ignore[attr-defined]
+
+    async def _get_entry(
+        self, key: str, opts: RouteCacheOptions
+    ) -> t.Optional[RouteCacheEntry]:
+        entry = await self._cache_service.get_async(
             key, opts.version, backend=opts.backend
         )
-        if cached_value:
-            return cached_value
-
-        response = await next_interceptor()
-        await self._cache_service.set_async(
-            key,
-            response,
-            ttl=opts.ttl,
+        return entry if isinstance(entry, RouteCacheEntry) else None
+
+    async def _set_entry(
+        self,
+        key: str,
+        opts: RouteCacheOptions,
+        value: t.Any,
+        fresh_until: t.Optional[float] = None,
+    ) -> None:
+        now = time.time()
+        if fresh_until is None:
+            fresh_until = now + opts.ttl
+        # kept for `stale_ttl` after it is no longer fresh, in whole seconds since
+        # backends such as redis truncate the ttl to an integer
+        ttl = math.ceil(fresh_until - now + opts.stale_ttl)
+        if ttl > 0:
+            await self._cache_service.set_async(
+                key,
+                RouteCacheEntry(fresh_until, value),
+                ttl=ttl,
+                version=opts.version,
+                backend=opts.backend,
+            )
+        # a refresh that never ran, e.g. when the stale response was not sent,
+        # must not keep the key from being refreshed again
+        self._refreshing.discard((opts.backend, opts.version, key))
+
+    async def _single_flight(
+        self,
+        next_interceptor: t.Callable[..., t.Coroutine],
+        key: str,
+        opts: RouteCacheOptions,
+    ) -> t.Tuple[_RouteCacheResult, bool]:
+        """
+        Computes the value of `key` once for concurrent requests of this worker.
+        Returns the result and whether this request ran the handler.
+        """
+        flight_key = (opts.backend, opts.version, key)
+        flight = self._flights.get(flight_key)
+        if flight is not None:
+            await flight.done.wait()
+            if flight.result is not None:
+                return flight.result, False
+            # the computation failed, this request runs the handler itself
+            return _RouteCacheResult(await next_interceptor()), True
+
+        flight = self._flights[flight_key] = _RouteCacheFlight()
+        try:
+            # a worker waiting for the lock computes the value when it is not cached
+            result = t.cast(
+                _RouteCacheResult, await self._compute(next_interceptor, key, opts)
+            )
+            flight.result = result
+            return result, result.entry is None
+        finally:
+            del self._flights[flight_key]
+            flight.done.set()
+
+    async def _compute(
+        self,
+        next_interceptor: t.Callable[..., t.Coroutine],
+        key: str,
+        opts: RouteCacheOptions,
+        wait: bool = True,
+    ) -> t.Optional[_RouteCacheResult]:
+        """
+        Runs the handler and caches its response. With `opts.lock`, a worker that does not
+        get the lock waits for the entry cached by the lock owner when `wait` is set,
+        otherwise it returns `None` without computing.
+        """
+        lock_key = f"{key}:lock"
+        lock_token = await self._acquire_lock(lock_key, opts) if opts.lock else None
+        if opts.lock and lock_token is None:
+            if not wait:
+                return None
+            entry = await self._wait_for_entry(key, opts)
+            if entry is not None:
+                return _RouteCacheResult(entry.value, entry)
+
+        try:
+            response = await next_interceptor()
+            await self._set_entry(key, opts, response)
+            return _RouteCacheResult(response)
+        finally:
+            if lock_token is not None:
+                await self._release_lock(lock_key, lock_token, opts)
+
+    async def _acquire_lock(
+        self, lock_key: str, opts: RouteCacheOptions
+    ) -> t.Optional[str]:
+        """Returns the token identifying the owner of the lock, or `None` when it is held."""
+        token = uuid.uuid4().hex
+        added = await self._cache_service.add_async(
+            lock_key,
+            token,
+            ttl=math.ceil(opts.lock_ttl),
             version=opts.version,
             backend=opts.backend,
         )
-        return response
+        return token if added else None
+
+    async def _release_lock(
+        self, lock_key: str, token: str, opts: RouteCacheOptions
+    ) -> None:
+        # a lock that expired while the handler ran may now belong to another worker
+        value = await self._cache_service.get_async(
+            lock_key, version=opts.version, backend=opts.backend
+        )
+        if value == token:
+            await self._cache_service.delete_async(
+                lock_key, version=opts.version, backend=opts.backend
+            )
+
+    async def _wait_for_entry(
+        self, key: str, opts: RouteCacheOptions
+    ) -> t.Optional[RouteCacheEntry]:
+        deadline = time.monotonic() + opts.lock_ttl
+        while time.monotonic() < deadline:
+            await anyio.sleep(self.LOCK_POLL_INTERVAL)
+            entry = await self._get_entry(key, opts)
+            if entry is not None and entry.fresh_until > time.time():
+                return entry
+        return None
+
+    def _serve_stale(
+        self,
+        context: IExecutionContext,
+        next_interceptor: t.Callable[..., t.Coroutine],
+        key: str,
+        opts: RouteCacheOptions,
+        entry: RouteCacheEntry,
+    ) -> t.Any:
+        """
+        Returns the stale value and refreshes it after the response is sent,
+        once per key in this worker.
+        """
+        flight_key = (opts.backend, opts.version, key)
+        if flight_key in self._refreshing:
+            return self._cached_value(context, key, opts, entry)
+
+        self._refreshing.add(flight_key)
+
+        async def _refresh() -> None:
+            try:
+                await self._compute(next_interceptor, key, opts, wait=False)
+            except Exception:
+                logger.exception("Unable to refresh the cached value of '%s'", key)
+            finally:
+                self._refreshing.discard(flight_key)
+
+        value = self._cached_value(context, key, opts, entry)
+        if isinstance(value, Response):
+            # a returned response is sent as it is, so the refresh runs as its background
+            value = copy.copy(value)
+            tasks = BackgroundTasks([value.background] if value.background else [])
+            tasks.add_task(_refresh)
+            value.background = tasks
+        else:
+            response = context.switch_to_http_connection().get_response()
+            t.cast(BackgroundTasks, response.background).add_task(_refresh)
+        return value
 
 
 def Cache(
@@ -73,15 +358,28 @@ def Cache(
     version: t.Optional[str] = None,
     backend: str = "default",
     make_key_callback: t.Optional[t.Callable[[IExecutionContext, str], str]] = None,
+    stale_ttl: t.Union[float, int] = 0,
+    lock: bool = False,
+    lock_ttl: t.Union[float, int] = 10,
+    cache_response: bool = False,
+    vary: t.Sequence[str] = (),
 ) -> t.Callable:
     """
     =========CONTROLLER AND ROUTE FUNCTION DECORATOR ==============
 
+    Concurrent requests of a key that is not cached run the route function once per worker.
+
     :param ttl: the time to live
     :param key_prefix: cache key prefix
     :param version: will be used in constructing the key
     :param backend: Cache Backend to use. Default is `default`
     :param make_key_callback: Key dynamic construct.
+    :param stale_ttl: seconds an expired value is still served while it is refreshed after the response
+    :param lock: use a lock stored in the cache backend so only one worker computes a value at a time
+    :param lock_ttl: the time to live of the lock, and the maximum time to wait for it
+    :param cache_response: cache the status, headers and body sent for GET and HEAD requests,
+        with an `ETag` answering `If-None-Match` requests with 304
+    :param vary: request headers whose values are part of the key, and of the `Vary` header
     :return: TCallable
     """
 
@@ -92,6 +390,11 @@ def Cache(
             version=version,
             backend=backend or "default",
             make_key_callback=make_key_callback or _route_cache_make_key,
+            stale_ttl=stale_ttl,
+            lock=lock,
+            lock_ttl=lock_ttl,
+            cache_response=cache_response,
+            vary=tuple(header.lower() for header in vary),
         )
         func = set_metadata(ROUTE_CACHE_OPTIONS, options)(func)
         return UseInterceptors(_CacheEllarInterceptor)(func)  # type: ignore[no-any-return]
@@ -45,6 +45,20 @@ class IBaseCacheBackendAsync(ABC):
         :rtype: boolean
         """
 
+    @abstractmethod
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        """
+        Add `key` to the cache only if it does not exist yet, atomically
+        where the backend supports it. Can be used as a lock.
+        :returns: ``True`` if the key has been added, ``False`` if it already exists.
+        """
+
     @abstractmethod
     async def touch_async(
         self,
@@ -79,6 +93,60 @@ class IBaseCacheBackendAsync(ABC):
         Decrements the number stored at key by one. If the key does not exist, it is set to 0
         """
 
+    @abstractmethod
+    async def get_many_async(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+    ) -> t.Dict[str, t.Any]:
+        """Look up many keys in the cache at once.
+        :param keys: the keys to be looked up.
+        :param version: the version for the keys
+        :returns: A dict of the keys found and their values.
+        """
+
+    @abstractmethod
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        """Add many key/value pairs to the cache at once.
+        :param mapping: the keys and values to set
+        :param ttl: the cache ttl for the keys in seconds
+        :param version: the version for the keys
+        :returns: The list of keys that could not be set.
+        """
+
+    @abstractmethod
+    async def delete_many_async(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+    ) -> None:
+        """Delete many keys from the cache at once.
+        :param keys: the keys to delete.
+        :param version: the version for the keys
+        """
+
+
+class ICacheBackendPubSub(ABC):
+    """Cache backend able to broadcast messages to every worker sharing it."""
+
+    @abstractmethod
+    async def publish_async(self, channel: str, message: bytes) -> None:
+        """Send `message` to the subscribers of `channel`.
+        :param channel: the channel name.
+        :param message: the message to send.
+        """
+
+    @abstractmethod
+    def subscribe_async(self, channel: str) -> t.AsyncIterator[bytes]:
+        """Iterate over the messages sent to `channel` from now on.
+        :param channel: the channel name.
+        """
+
 
 class IBaseCacheBackendSync(ABC):
     @abstractmethod
@@ -120,6 +188,20 @@ class IBaseCacheBackendSync(ABC):
         :rtype: boolean
         """
 
+    @abstractmethod
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        """
+        Add `key` to the cache only if it does not exist yet, atomically
+        where the backend supports it. Can be used as a lock.
+        :returns: ``True`` if the key has been added, ``False`` if it already exists.
+        """
+
     @abstractmethod
     def touch(
         self,
@@ -150,6 +232,43 @@ class IBaseCacheBackendSync(ABC):
         Decrements the number stored at key by one. If the key does not exist, it is set to 0
         """
 
+    @abstractmethod
+    def get_many(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+    ) -> t.Dict[str, t.Any]:
+        """Look up many keys in the cache at once.
+        :param keys: the keys to be looked up.
+        :param version: the version for the keys
+        :returns: A dict of the keys found and their values.
+        """
+
+    @abstractmethod
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        """Add many key/value pairs to the cache at once.
+        :param mapping: the keys and values to set
+        :param ttl: the cache ttl for the keys in seconds
+        :param version: the version for the keys
+        :returns: The list of keys that could not be set.
+        """
+
+    @abstractmethod
+    def delete_many(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+    ) -> None:
+        """Delete many keys from the cache at once.
+        :param keys: the keys to delete.
+        :param version: the version for the keys
+        """
+
 
 class ICacheServiceSync(ABC):
     @abstractmethod
@@ -199,6 +318,21 @@ class ICacheServiceSync(ABC):
         :rtype: boolean
         """
 
+    @abstractmethod
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> bool:
+        """
+        Add `key` to the cache only if it does not exist yet, atomically
+        where the backend supports it. Can be used as a lock.
+        :returns: ``True`` if the key has been added, ``False`` if it already exists.
+        """
+
     @abstractmethod
     def touch(
         self,
@@ -244,6 +378,49 @@ class ICacheServiceSync(ABC):
         Decrements the number stored at key by one. If the key does not exist, it is set to 0
         """
 
+    @abstractmethod
+    def get_many(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.Dict[str, t.Any]:
+        """Look up many keys in the cache at once.
+        :param keys: the keys to be looked up.
+        :param version: the version for the keys
+        :param backend: a backend service name
+        :returns: A dict of the keys found and their values.
+        """
+
+    @abstractmethod
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.List[str]:
+        """Add many key/value pairs to the cache at once.
+        :param mapping: the keys and values to set
+        :param ttl: the cache ttl for the keys in seconds
+        :param version: the version for the keys
+        :param backend: a backend service name
+        :returns: The list of keys that could not be set.
+        """
+
+    @abstractmethod
+    def delete_many(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> None:
+        """Delete many keys from the cache at once.
+        :param keys: the keys to delete.
+        :param version: the version for the keys
+        :param backend: a backend service name
+        """
+
 
 class ICacheServiceAsync(ABC):
     @abstractmethod
@@ -293,6 +470,21 @@ class ICacheServiceAsync(ABC):
         :rtype: boolean
         """
 
+    @abstractmethod
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> bool:
+        """
+        Add `key` to the cache only if it does not exist yet, atomically
+        where the backend supports it. Can be used as a lock.
+        :returns: ``True`` if the key has been added, ``False`` if it already exists.
+        """
+
     @abstractmethod
     async def touch_async(
         self,
@@ -338,6 +530,49 @@ class ICacheServiceAsync(ABC):
         Decrements the number stored at key by one. If the key does not exist, it is set to 0
         """
 
+    @abstractmethod
+    async def get_many_async(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.Dict[str, t.Any]:
+        """Look up many keys in the cache at once.
+        :param keys: the keys to be looked up.
+        :param version: the version for the keys
+        :param backend: a backend service name
+        :returns: A dict of the keys found and their values.
+        """
+
+    @abstractmethod
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.List[str]:
+        """Add many key/value pairs to the cache at once.
+        :param mapping: the keys and values to set
+        :param ttl: the cache ttl for the keys in seconds
+        :param version: the version for the keys
+        :param backend: a backend service name
+        :returns: The list of keys that could not be set.
+        """
+
+    @abstractmethod
+    async def delete_many_async(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> None:
+        """Delete many keys from the cache at once.
+        :param keys: the keys to delete.
+        :param version: the version for the keys
+        :param backend: a backend service name
+        """
+
 
 class ICacheService(ICacheServiceSync, ICacheServiceAsync, ABC):
     """Cache Service Interface"""
@@ -349,3 +584,11 @@ class ICacheService(ICacheServiceSync, ICacheServiceAsync, ABC):
         :param backend: Cache Backend configuration name. If not set, 'default' backend will be returned
         :return: BaseCacheBackend
         """
+
+    @abstractmethod
+    def get_stats(self, backend: t.Optional[str] = None) -> t.Dict[str, int]:
+        """
+        Return usage counters, e.g. hits, misses and evictions, of a given Cache Backend.
+        :param backend: Cache Backend configuration name. If not set, 'default' backend is used
+        :return: Dict
+        """
@@ -53,6 +53,69 @@ class MakeKeyDecorator:
         return _wrap
 
 
+class MakeManyKeysDecorator(MakeKeyDecorator):
+    """
+    Makes the keys of bulk operations. `keys` can be an iterable of keys or a mapping
+    of key to value. Results that are mappings or lists of backend keys are mapped
+    back to the keys given by the caller.
+    """
+
+    __slots__ = ()
+
+    def _make_keys(
+        self,
+        instance: "BaseCacheBackend",
+        keys: t.Union[t.Iterable[str], t.Mapping[str, t.Any]],
+        version: t.Optional[str],
+    ) -> t.Tuple[t.Dict[str, str], t.Any]:
+        key_map: t.Dict[str, str] = {}
+        for key in keys:
+            if self._validate:
+                instance.validate_key(key)
+            key_map[instance.make_key(key, version=version)] = key
+
+        if isinstance(keys, t.Mapping):
+            return key_map, {_key: keys[key] for _key, key in key_map.items()}
+        return key_map, list(key_map)
+
+    def _restore_keys(self, key_map: t.Dict[str, str], result: t.Any) -> t.Any:
+        if isinstance(result, dict):
+            return {key_map[_key]: value for _key, value in result.items()}
+        if isinstance(result, list):
+            return [key_map[_key] for _key in result]
+        return result
+
+    def get_async_make_key_decorator(self) -> t.Callable:
+        @functools.wraps(self._func)
+        async def _wrap(
+            instance: "BaseCacheBackend",
+            keys: t.Union[t.Iterable[str], t.Mapping[str, t.Any]],
+            *args: t.Any,
+            version: t.Optional[str] = None,
+            **kwargs: t.Any,
+        ) -> t.Any:
+            key_map, _keys = self._make_keys(instance, keys, version)
+            result = await self._func(instance, _keys, *args, version=version, **kwargs)
+            return self._restore_keys(key_map, result)
+
+        return _wrap
+
+    def get_make_key_decorator(self) -> t.Callable:
+        @functools.wraps(self._func)
+        def _wrap(
+            instance: "BaseCacheBackend",
+            keys: t.Union[t.Iterable[str], t.Mapping[str, t.Any]],
+            *args: t.Any,
+            version: t.Optional[str] = None,
+            **kwargs: t.Any,
+        ) -> t.Any:
+            key_map, _keys = self._make_keys(instance, keys, version)
+            result = self._func(instance, _keys, *args, version=version, **kwargs)
+            return self._restore_keys(key_map, result)
+
+        return _wrap
+
+
 @t.no_type_check
 def make_key_decorator(func: t.Callable) -> t.Callable[..., t.Awaitable]:
     make_key = MakeKeyDecorator(func, validate=False)
@@ -63,3 +126,17 @@ def make_key_decorator(func: t.Callable) -> t.Callable[..., t.Awaitable]:
 def make_key_decorator_and_validate(func: t.Callable) -> t.Callable[..., t.Awaitable]:
     make_key = MakeKeyDecorator(func, validate=True)
     return make_key.get_decorator()
+
+
+@t.no_type_check
+def make_many_keys_decorator(func: t.Callable) -> t.Callable[..., t.Awaitable]:
+    make_keys = MakeManyKeysDecorator(func, validate=False)
+    return make_keys.get_decorator()
+
+
+@t.no_type_check
+def make_many_keys_decorator_and_validate(
+    func: t.Callable,
+) -> t.Callable[..., t.Awaitable]:
+    make_keys = MakeManyKeysDecorator(func, validate=True)
+    return make_keys.get_decorator()
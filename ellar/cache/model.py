@@ -39,6 +39,97 @@ class BaseCacheBackend(IBaseCacheBackendSync, IBaseCacheBackendAsync, ABC):
         """
         return self.get(key, version=version) is not None
 
+    # `add` falls back to a check then a set, which is not atomic.
+    # Backends override it with a native add command.
+
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        if await self.has_key_async(key, version=version):
+            return False
+        return await self.set_async(key, value, ttl=ttl, version=version)
+
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> bool:
+        if self.has_key(key, version=version):
+            return False
+        return self.set(key, value, ttl=ttl, version=version)
+
+    # Bulk operations fall back to one call per key.
+    # Backends override them with native multi-key commands.
+
+    async def get_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        result = {}
+        for key in keys:
+            value = await self.get_async(key, version=version)
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        return [
+            key
+            for key, value in mapping.items()
+            if not await self.set_async(key, value, ttl=ttl, version=version)
+        ]
+
+    async def delete_many_async(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        for key in keys:
+            await self.delete_async(key, version=version)
+
+    def get_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> t.Dict[str, t.Any]:
+        result = {}
+        for key in keys:
+            value = self.get(key, version=version)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+    ) -> t.List[str]:
+        return [
+            key
+            for key, value in mapping.items()
+            if not self.set(key, value, ttl=ttl, version=version)
+        ]
+
+    def delete_many(
+        self, keys: t.Iterable[str], version: t.Optional[str] = None
+    ) -> None:
+        for key in keys:
+            self.delete(key, version=version)
+
+    def get_stats(self) -> t.Dict[str, int]:
+        """
+        Return usage counters of the backend, e.g. hits, misses and evictions.
+        Backends that do not keep counters return an empty dict.
+        """
+        return {}
+
     def validate_key(self, key: str) -> None:
         if len(key) > self.MEMCACHE_MAX_KEY_LENGTH:
             warnings.warn(
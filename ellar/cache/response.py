@@ -0,0 +1,139 @@
+import hashlib
+import typing as t
+
+from ellar.common.types import TMessage, TSend
+from starlette.responses import Response
+
+# statuses cacheable by default, RFC 9110 section 15.1
+CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414})
+# headers a 304 response repeats from the cached response, RFC 9110 section 15.4.5
+NOT_MODIFIED_HEADERS = frozenset(
+    {b"cache-control", b"content-location", b"date", b"etag", b"expires", b"vary"}
+)
+
+
+class CachedHTTPResponse(t.NamedTuple):
+    """Status, headers and body of a response as they were sent."""
+
+    status_code: int
+    headers: t.List[t.Tuple[bytes, bytes]]
+    body: bytes
+    etag: bytes
+
+    def to_response(self) -> "CachedResponse":
+        return CachedResponse(self.status_code, self.headers, self.body)
+
+    def to_not_modified_response(self) -> "CachedResponse":
+        headers = [
+            (name, value)
+            for name, value in self.headers
+            if name in NOT_MODIFIED_HEADERS
+        ]
+        return CachedResponse(304, headers, b"")
+
+
+class CachedResponse(Response):
+    """Sends raw headers and body as they are, without encoding them again."""
+
+    def __init__(
+        self, status_code: int, headers: t.List[t.Tuple[bytes, bytes]], body: bytes
+    ) -> None:
+        self.status_code = status_code
+        self.raw_headers = headers
+        self.body = body
+        self.background = None
+
+
+def make_etag(body: bytes) -> bytes:
+    """Strong ETag of a response body."""
+    return b'"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest().encode()
+
+
+def etag_matches(etag: bytes, if_none_match: str) -> bool:
+    """Weak comparison of `etag` with the ETags of an `If-None-Match` header."""
+    if if_none_match.strip() == "*":
+        return True
+    _etag = etag.decode("latin-1")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == _etag:
+            return True
+    return False
+
+
+def is_cacheable(status_code: int, headers: t.List[t.Tuple[bytes, bytes]]) -> bool:
+    if status_code not in CACHEABLE_STATUS_CODES:
+        return False
+    for name, value in headers:
+        if name == b"set-cookie":
+            return False
+        if name == b"cache-control" and (b"no-store" in value or b"private" in value):
+            return False
+    return True
+
+
+class ResponseRecorder:
+    """
+    Wraps `send` to record the response of a route.
+
+    The start message is held back until the body is known, so an `ETag` and
+    a `Vary` header can be added to it. Once the response is sent, it is passed to
+    `on_record` when it was sent in one body message and can be cached, otherwise
+    `None` is passed.
+    """
+
+    __slots__ = ("_send", "_on_record", "_vary", "_start")
+
+    def __init__(
+        self,
+        send: TSend,
+        on_record: t.Callable[[t.Optional[CachedHTTPResponse]], t.Awaitable[None]],
+        vary: t.Sequence[str] = (),
+    ) -> None:
+        self._send = send
+        self._on_record = on_record
+        self._vary = vary
+        self._start: t.Optional[TMessage] = None
+
+    def _add_headers(
+        self, headers: t.List[t.Tuple[bytes, bytes]], body: bytes
+    ) -> t.Tuple[t.List[t.Tuple[bytes, bytes]], bytes]:
+        headers = list(headers)
+        etag = next((value for name, value in headers if name == b"etag"), None)
+        if etag is None:
+            etag = make_etag(body)
+            headers.append((b"etag", etag))
+
+        if self._vary:
+            vary = [value for name, value in headers if name == b"vary"]
+            headers = [(name, value) for name, value in headers if name != b"vary"]
+            vary.extend(header.encode("latin-1") for header in self._vary)
+            headers.append((b"vary", b", ".join(vary)))
+        return headers, etag
+
+    async def __call__(self, message: TMessage) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+
+        start, self._start = self._start, None
+        if start is None:
+            # rest of a streamed response
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        status_code = start["status"]
+        headers = [(bytes(name), bytes(value)) for name, value in start["headers"]]
+        if message.get("more_body", False) or not is_cacheable(status_code, headers):
+            await self._send(start)
+            await self._send(message)
+            await self._on_record(None)
+            return
+
+        headers, etag = self._add_headers(headers, body)
+        await self._send({**start, "headers": headers})
+        await self._send(message)
+        await self._on_record(CachedHTTPResponse(status_code, headers, body, etag))
@@ -57,6 +57,17 @@ class _CacheServiceSync(ICacheServiceSync):
         _backend = self.get_backend(backend)
         return _backend.set(key, value, version=version, ttl=ttl)
 
+    def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> bool:
+        _backend = self.get_backend(backend)
+        return _backend.add(key, value, version=version, ttl=ttl)
+
     def touch(
         self,
         key: str,
@@ -73,6 +84,34 @@ class _CacheServiceSync(ICacheServiceSync):
         _backend = self.get_backend(backend)
         return _backend.has_key(key, version=version)
 
+    def get_many(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.Dict[str, t.Any]:
+        _backend = self.get_backend(backend)
+        return _backend.get_many(keys, version=version)
+
+    def set_many(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.List[str]:
+        _backend = self.get_backend(backend)
+        return _backend.set_many(mapping, ttl=ttl, version=version)
+
+    def delete_many(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> None:
+        _backend = self.get_backend(backend)
+        _backend.delete_many(keys, version=version)
+
 
 @injectable
 class CacheService(_CacheServiceSync, ICacheService):
@@ -100,6 +139,9 @@ class CacheService(_CacheServiceSync, ICacheService):
                 f"There is no backend configured with the name: '{_backend}'"
             ) from kex
 
+    def get_stats(self, backend: t.Optional[str] = None) -> t.Dict[str, int]:
+        return self.get_backend(backend).get_stats()
+
     async def get_async(
         self, key: str, version: t.Optional[str] = None, backend: t.Optional[str] = None
     ) -> t.Any:
@@ -123,6 +165,17 @@ class CacheService(_CacheServiceSync, ICacheService):
         _backend = self.get_backend(backend)
         return await _backend.set_async(key, value, ttl=ttl, version=version)
 
+    async def add_async(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> bool:
+        _backend = self.get_backend(backend)
+        return await _backend.add_async(key, value, ttl=ttl, version=version)
+
     async def touch_async(
         self,
         key: str,
@@ -158,3 +211,31 @@ class CacheService(_CacheServiceSync, ICacheService):
     ) -> int:
         _backend = self.get_backend(backend)
         return await _backend.decr_async(key, delta=delta, version=version)
+
+    async def get_many_async(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.Dict[str, t.Any]:
+        _backend = self.get_backend(backend)
+        return await _backend.get_many_async(keys, version=version)
+
+    async def set_many_async(
+        self,
+        mapping: t.Mapping[str, t.Any],
+        ttl: t.Union[float, int, None] = None,
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> t.List[str]:
+        _backend = self.get_backend(backend)
+        return await _backend.set_many_async(mapping, ttl=ttl, version=version)
+
+    async def delete_many_async(
+        self,
+        keys: t.Iterable[str],
+        version: t.Optional[str] = None,
+        backend: t.Optional[str] = None,
+    ) -> None:
+        _backend = self.get_backend(backend)
+        await _backend.delete_many_async(keys, version=version)
@@ -91,6 +91,7 @@ from .responses import (
     JSONResponse,
     ORJSONResponse,
     PlainTextResponse,
+    PydanticJSONResponse,
     RedirectResponse,
     Response,
     StreamingResponse,
@@ -158,6 +159,7 @@ __all__ = [
     "JSONResponse",
     "UJSONResponse",
     "ORJSONResponse",
+    "PydanticJSONResponse",
     "StreamingResponse",
     "HTMLResponse",
     "FileResponse",
@@ -21,6 +21,7 @@ SCOPE_RESPONSE_STARTED = "__response_started__"
 SCOPED_RESPONSE = "__response__"
 SCOPE_API_VERSIONING_RESOLVER = "API_VERSIONING_RESOLVER"
 SCOPE_API_VERSIONING_SCHEME = "API_VERSIONING_SCHEME"
+SCOPE_REQUEST_TRACE = "ellar.request_trace"
 ELLAR_CONFIG_MODULE = "ELLAR_CONFIG_MODULE"
 
 
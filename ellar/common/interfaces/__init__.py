@@ -13,6 +13,7 @@ from .exceptions import IExceptionHandler, IExceptionMiddlewareService
 from .guard_consumer import IGuardsConsumer
 from .identity_schemes import IIdentitySchemes
 from .interceptor_consumer import IInterceptorsConsumer
+from .metrics import IRequestMetricsSink
 from .middleware import IEllarMiddleware
 from .module import IModuleSetup
 from .operation import IWebSocketConnectionAttributes
@@ -45,4 +46,5 @@ __all__ = [
     "IApplicationReady",
     "ITemplateRenderingService",
     "IWebSocketConnectionAttributes",
+    "IRequestMetricsSink",
 ]
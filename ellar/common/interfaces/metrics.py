@@ -0,0 +1,13 @@
+import typing as t
+from abc import ABC, abstractmethod
+
+from ellar.common.types import TScope
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.common.tracing import RequestTrace
+
+
+class IRequestMetricsSink(ABC):
+    @abstractmethod
+    def record(self, scope: TScope, trace: "RequestTrace") -> None:
+        """Receives the phase timings of a finished request"""
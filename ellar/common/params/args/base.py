@@ -26,6 +26,7 @@ from .. import params
 from ..decorators import get_default_resolver
 from ..resolvers import (
     BaseRouteParameterResolver,
+    CompiledParameterResolver,
     IRouteParameterResolver,
     SystemParameterResolver,
 )
@@ -141,6 +142,8 @@ class EndpointArgsModel:
         "_route_models",
         "param_converters",
         "_extra_endpoint_args",
+        "_compiled_resolver",
+        "_uncompiled_route_models",
     )
 
     def __init__(
@@ -165,6 +168,8 @@ class EndpointArgsModel:
         self._extra_endpoint_args: t.List[ExtraEndpointArg] = (
             list(extra_endpoint_args) if extra_endpoint_args else []
         )
+        self._compiled_resolver: t.Optional[CompiledParameterResolver] = None
+        self._uncompiled_route_models: t.List[IRouteParameterResolver] = []
 
     def get_route_models(self) -> t.List[IRouteParameterResolver]:
         """
@@ -229,6 +234,31 @@ class EndpointArgsModel:
             + self._computation_models[params.CookieFieldInfo.in_.value]
             + self._computation_models[SystemParameterResolver.in_]
         )
+        self._compiled_resolver = None
+        self._uncompiled_route_models = self._route_models
+
+    def compile_route_models(self, compiled: bool = True) -> None:
+        """
+        Replaces path, query, header and cookie resolvers of the route models
+        with a single `CompiledParameterResolver`, or restores them when `compiled` is False
+        :return:
+        """
+        self._compiled_resolver = None
+        self._uncompiled_route_models = self._route_models
+        if not compiled:
+            return
+
+        compilable: t.List[BaseRouteParameterResolver] = []
+        uncompiled: t.List[IRouteParameterResolver] = []
+        for model in self._route_models:
+            if CompiledParameterResolver.can_compile(model):
+                compilable.append(t.cast(BaseRouteParameterResolver, model))
+            else:
+                uncompiled.append(model)
+
+        if compilable:
+            self._compiled_resolver = CompiledParameterResolver(compilable)
+            self._uncompiled_route_models = uncompiled
 
     def compute_route_parameter_list(
         self, body_field_class: t.Type[FieldInfo] = params.BodyFieldInfo
@@ -337,7 +367,13 @@ class EndpointArgsModel:
         body_resolver = await self.resolve_body(ctx)
 
         if body_resolver and not body_resolver.errors:
-            for parameter_resolver in self._route_models:
+            if self._compiled_resolver is not None:
+                compiled_res = self._compiled_resolver.resolve(ctx)
+                body_resolver.data.update(compiled_res.data)
+                body_resolver.errors.extend(compiled_res.errors)
+                body_resolver.raw_data.update(compiled_res.raw_data)
+
+            for parameter_resolver in self._uncompiled_route_models:
                 res = await parameter_resolver.resolve(ctx=ctx)
                 if res.data:
                     body_resolver.data.update(res.data)
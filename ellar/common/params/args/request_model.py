@@ -69,6 +69,8 @@ class RequestEndpointArgsModel(EndpointArgsModel):
         "_route_models",
         "param_converters",
         "_extra_endpoint_args",
+        "_compiled_resolver",
+        "_uncompiled_route_models",
     )
 
     def __init__(
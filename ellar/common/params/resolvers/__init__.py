@@ -8,6 +8,7 @@ from .bulk_parameter import (
     BulkFormParameterResolver,
     BulkParameterResolver,
 )
+from .compiled import CompiledParameterResolver
 from .parameter import (
     BodyParameterResolver,
     CookieParameterResolver,
@@ -40,4 +41,5 @@ __all__ = [
     "FileParameterResolver",
     "SystemParameterResolver",
     "BaseConnectionParameterResolver",
+    "CompiledParameterResolver",
 ]
@@ -29,7 +29,7 @@ class BulkParameterResolver(BaseRouteParameterResolver):
         self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> ResolverResult:
         request_logger.debug(
-            f"Resolving Bulk Path Parameters - '{self.__class__.__name__}'"
+            "Resolving Bulk Path Parameters - '%s'", self.__class__.__name__
         )
         values: t.Dict[str, t.Any] = {}
         errors = []
@@ -83,7 +83,7 @@ class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
         self, ctx: IExecutionContext, body: t.Any
     ) -> ResolverResult:
         request_logger.debug(
-            f"Resolving Form Grouped Field - '{self.__class__.__name__}'"
+            "Resolving Form Grouped Field - '%s'", self.__class__.__name__
         )
         res = await self._get_resolver_data(ctx, body, by_alias=True)
         if res.errors:
@@ -141,7 +141,9 @@ class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
         body: t.Optional[t.Any] = None,
         **kwargs: t.Any,
     ) -> ResolverResult:
-        request_logger.debug(f"Resolving Form Parameters - '{self.__class__.__name__}'")
+        request_logger.debug(
+            "Resolving Form Parameters - '%s'", self.__class__.__name__
+        )
         _body = body or await self.get_request_body(ctx)
         return await self._use_resolver(ctx, _body)
 
@@ -151,7 +153,7 @@ class BulkBodyParameterResolver(BulkParameterResolver, BodyParameterResolver):
         self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> ResolverResult:
         request_logger.debug(
-            f"Resolving Request Body Parameters - '{self.__class__.__name__}'"
+            "Resolving Request Body Parameters - '%s'", self.__class__.__name__
         )
         _body = await self.get_request_body(ctx)
 
@@ -0,0 +1,143 @@
+import copy
+import typing as t
+
+from ellar.common.interfaces import IExecutionContext
+from ellar.common.logging import request_logger
+from ellar.pydantic import ModelField, TypeAdapter, is_sequence_field
+from ellar.pydantic import types as pydantic_types
+from pydantic import ValidationError
+from typing_extensions import Annotated, TypedDict
+
+from .base import BaseRouteParameterResolver, ResolverResult
+from .parameter import (
+    CookieParameterResolver,
+    HeaderParameterResolver,
+    PathParameterResolver,
+    QueryParameterResolver,
+)
+
+
+class _CompiledParameter(t.NamedTuple):
+    name: str
+    alias: str
+    loc: t.Tuple[str, str]
+    # connection attribute to read the value from
+    source: str
+    is_sequence: bool
+    # Path and Cookie parameters are validated even when missing
+    validate_missing: bool
+    model_field: ModelField
+
+
+class CompiledParameterResolver:
+    """
+    Resolves path, query, header and cookie parameters of a route in a single synchronous pass.
+    All received values are validated together with one TypeAdapter computed at build time.
+    Errors, data and raw_data are the same as running each parameter resolver one after the other.
+    """
+
+    compilable_resolvers: t.Dict[t.Type[BaseRouteParameterResolver], t.Tuple] = {
+        HeaderParameterResolver: ("headers", False),
+        QueryParameterResolver: ("query_params", False),
+        PathParameterResolver: ("path_params", True),
+        CookieParameterResolver: ("cookies", True),
+    }
+
+    __slots__ = ("parameters", "_type_adapter")
+
+    def __init__(self, resolvers: t.Sequence[BaseRouteParameterResolver]) -> None:
+        self.parameters: t.List[_CompiledParameter] = []
+        fields: t.Dict[str, t.Any] = {}
+
+        for index, resolver in enumerate(resolvers):
+            source, validate_missing = self.compilable_resolvers[type(resolver)]
+            resolver.assert_field_info()
+
+            model_field = resolver.model_field
+            field_info = model_field.field_info
+            self.parameters.append(
+                _CompiledParameter(
+                    name=model_field.name,
+                    alias=model_field.alias,
+                    loc=(field_info.in_.value, model_field.alias),
+                    source=source,
+                    is_sequence=is_sequence_field(model_field),
+                    validate_missing=validate_missing,
+                    model_field=model_field,
+                )
+            )
+            # the aliases of FieldInfo would rename the key, and its default would be
+            # returned for parameters that were not received
+            compiled_field_info = copy.copy(field_info)
+            compiled_field_info.alias = None
+            compiled_field_info.validation_alias = None
+            compiled_field_info.serialization_alias = None
+            compiled_field_info.default = pydantic_types.Undefined
+            compiled_field_info.default_factory = None
+            fields[str(index)] = Annotated[field_info.annotation, compiled_field_info]
+
+        self._type_adapter: TypeAdapter = TypeAdapter(
+            TypedDict("CompiledParameters", fields, total=False)  # type: ignore[operator]
+        )
+
+    @classmethod
+    def can_compile(cls, resolver: t.Any) -> bool:
+        return type(resolver) in cls.compilable_resolvers
+
+    def resolve(self, ctx: IExecutionContext) -> ResolverResult:
+        request_logger.debug(
+            "Resolving Compiled Parameters - '%s'", self.__class__.__name__
+        )
+        connection = ctx.switch_to_http_connection().get_client()
+        received_sources: t.Dict[str, t.Any] = {}
+
+        data: t.Dict[str, t.Any] = {}
+        raw_data: t.Dict[str, t.Any] = {}
+        to_validate: t.Dict[str, t.Any] = {}
+        errors: t.Dict[int, t.List[t.Dict[str, t.Any]]] = {}
+
+        for index, parameter in enumerate(self.parameters):
+            received = received_sources.get(parameter.source)
+            if received is None:
+                received = getattr(connection, parameter.source)
+                received_sources[parameter.source] = received
+
+            if parameter.is_sequence and not parameter.validate_missing:
+                value = (
+                    received.getlist(parameter.alias) or parameter.model_field.default
+                )
+            else:
+                value = received.get(parameter.alias)
+
+            raw_data[parameter.name] = value
+
+            if value is None and not parameter.validate_missing:
+                if parameter.model_field.required:
+                    errors[index] = [
+                        BaseRouteParameterResolver.create_error(loc=parameter.loc)
+                    ]
+                else:
+                    data[parameter.name] = copy.deepcopy(parameter.model_field.default)
+                continue
+
+            to_validate[str(index)] = value
+
+        if to_validate:
+            try:
+                validated = self._type_adapter.validate_python(
+                    to_validate, from_attributes=True, context={}
+                )
+                for key, value in validated.items():
+                    data[self.parameters[int(key)].name] = value
+            except ValidationError as exc:
+                for err in exc.errors():
+                    index = int(err["loc"][0])
+                    errors.setdefault(index, []).append(
+                        {**err, "loc": self.parameters[index].loc + err["loc"][1:]}
+                    )
+
+        return ResolverResult(
+            data=data,
+            errors=[err for index in sorted(errors) for err in errors[index]],
+            raw_data=raw_data,
+        )
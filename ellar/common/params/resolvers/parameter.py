@@ -53,7 +53,7 @@ class HeaderParameterResolver(BaseRouteParameterResolver):
         alias = alias or self.model_field.alias
         name = name or self.model_field.name
         request_logger.debug(
-            f"Resolving Header Parameters - '{self.__class__.__name__}'"
+            "Resolving Header Parameters - '%s'", self.__class__.__name__
         )
         received_params = self.get_received_parameter(ctx=ctx)
         if is_sequence_field(self.model_field):
@@ -111,7 +111,9 @@ class PathParameterResolver(BaseRouteParameterResolver):
     ) -> ResolverResult:
         alias = alias or self.model_field.alias
         name = name or self.model_field.name
-        request_logger.debug(f"Resolving Path Parameters - '{self.__class__.__name__}'")
+        request_logger.debug(
+            "Resolving Path Parameters - '%s'", self.__class__.__name__
+        )
         received_params = self.get_received_parameter(ctx=ctx)
         value = received_params.get(str(alias))
         self.assert_field_info()
@@ -148,7 +150,7 @@ class WsBodyParameterResolver(BaseRouteParameterResolver):
         alias = alias or self.model_field.alias
         name = name or self.model_field.name
         request_logger.debug(
-            f"Resolving Websocket Body Parameters - '{self.__class__.__name__}'"
+            "Resolving Websocket Body Parameters - '%s'", self.__class__.__name__
         )
         embed = getattr(self.model_field.field_info, "embed", False)
         received_body = {alias: body}
@@ -193,7 +195,7 @@ class BodyParameterResolver(WsBodyParameterResolver):
 
     async def get_request_body(self, ctx: IExecutionContext) -> t.Any:
         request_logger.debug(
-            f"Resolving Request Body Parameters - '{self.__class__.__name__}'"
+            "Resolving Request Body Parameters - '%s'", self.__class__.__name__
         )
         try:
             request = ctx.switch_to_http_connection().get_request()
@@ -260,7 +262,7 @@ class FormParameterResolver(BodyParameterResolver):
 
     async def get_request_body(self, ctx: IExecutionContext) -> t.Any:
         request_logger.debug(
-            f"Resolving Request Form Parameters - '{self.__class__.__name__}'"
+            "Resolving Request Form Parameters - '%s'", self.__class__.__name__
         )
         try:
             request = ctx.switch_to_http_connection().get_request()
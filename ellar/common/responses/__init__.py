@@ -4,6 +4,7 @@ from .response_types import (
     JSONResponse,
     ORJSONResponse,
     PlainTextResponse,
+    PydanticJSONResponse,
     RedirectResponse,
     Response,
     StreamingResponse,
@@ -14,6 +15,7 @@ __all__ = [
     "JSONResponse",
     "UJSONResponse",
     "ORJSONResponse",
+    "PydanticJSONResponse",
     "StreamingResponse",
     "HTMLResponse",
     "FileResponse",
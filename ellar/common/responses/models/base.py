@@ -7,7 +7,12 @@ from ellar.common.exceptions import RequestValidationError
 from ellar.common.interfaces import IExecutionContext, IResponseModel
 from ellar.common.logging import request_logger
 from ellar.common.serializer import BaseSerializer, SerializerFilter, serialize_object
-from ellar.pydantic import ModelField, create_model_field
+from ellar.pydantic import (
+    BaseModel,
+    ModelField,
+    create_model_field,
+    lenient_issubclass,
+)
 from ellar.reflect import reflect
 from starlette.responses import Response
 
@@ -27,10 +32,27 @@ class ResponseModelField(ModelField):
     types for the of validation and OPENAPI documentation
     """
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        annotation = self.field_info.annotation
+        # instances of a model that is not revalidated by pydantic are returned
+        # as is by `validate_object`, so their validation can be skipped
+        self._skip_validation_type: t.Optional[t.Type[BaseModel]] = (
+            annotation
+            if lenient_issubclass(annotation, BaseModel)
+            and annotation.model_config.get("revalidate_instances", "never") == "never"
+            else None
+        )
+
     def validate_object(self, obj: t.Any) -> t.Any:
         request_logger.debug(
-            f"Validating Response Object - '{self.__class__.__name__}'"
+            "Validating Response Object - '%s'", self.__class__.__name__
         )
+        if self._skip_validation_type is not None and isinstance(
+            obj, self._skip_validation_type
+        ):
+            return obj, []
+
         values, error = self.validate(obj, {}, loc=(self.alias,))
         if error:
             _errors = (
@@ -39,18 +61,25 @@ class ResponseModelField(ModelField):
             return None, _errors
         return values, []
 
-    def prep_and_serialize(
+    def _get_serializer_filter(
         self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
-    ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
-        request_logger.debug(f"Serializing Response Data - '{self.__class__.__name__}'")
-        _serializer_filter = (
-            serializer_filter.dict()
+    ) -> t.Dict:
+        return (
+            serializer_filter.kwargs
             if serializer_filter
-            else obj._filter.dict()
+            else obj._filter.kwargs
             if isinstance(obj, BaseSerializer)
             else {}
         )
 
+    def prep_and_serialize(
+        self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
+    ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
+        request_logger.debug(
+            "Serializing Response Data - '%s'", self.__class__.__name__
+        )
+        _serializer_filter = self._get_serializer_filter(obj, serializer_filter)
+
         values, errors = self.validate_object(obj)
 
         if errors:
@@ -58,6 +87,25 @@ class ResponseModelField(ModelField):
 
         return self.serialize(values, **_serializer_filter)
 
+    def prep_and_serialize_json(
+        self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
+    ) -> bytes:
+        """
+        Validates `obj` and dumps it straight to JSON bytes,
+        skipping the intermediate python object of `prep_and_serialize`.
+        """
+        request_logger.debug(
+            "Serializing Response Data to JSON - '%s'", self.__class__.__name__
+        )
+        _serializer_filter = self._get_serializer_filter(obj, serializer_filter)
+
+        values, errors = self.validate_object(obj)
+
+        if errors:
+            raise RequestValidationError(errors)
+
+        return self.serialize_json(values, **_serializer_filter)
+
     def __hash__(self) -> int:
         # Each ModelField is unique for our purposes, to allow making a dict from
         # ModelField to its JSON Schema.
@@ -157,7 +205,8 @@ class BaseResponseModel(IResponseModel, ABC):
     ) -> Response:
         """Please override this function to create a custom response"""
         request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+            "Creating Response from returned Handler value - '%s'",
+            self.__class__.__name__,
         )
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
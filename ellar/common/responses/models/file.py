@@ -50,7 +50,8 @@ class FileResponseModel(ResponseModel):
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
         request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+            "Creating Response from returned Handler value - '%s'",
+            self.__class__.__name__,
         )
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
@@ -108,7 +109,8 @@ class StreamingResponseModel(ResponseModel):
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
         request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+            "Creating Response from returned Handler value - '%s'",
+            self.__class__.__name__,
         )
 
         response_args, headers = self.get_context_response(
@@ -28,7 +28,8 @@ class HTMLResponseModel(ResponseModel):
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
         request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+            "Creating Response from returned Handler value - '%s'",
+            self.__class__.__name__,
         )
         template_name = self._get_template_name(ctx=context)
         rendering_service: ITemplateRenderingService = (
@@ -6,8 +6,9 @@ from ellar.common.logging import request_logger
 from ellar.common.serializer import SerializerFilter
 from ellar.pydantic import as_pydantic_validator, create_model_field
 from ellar.reflect import reflect
+from pydantic_core import to_json
 
-from ..response_types import JSONResponse, Response
+from ..response_types import JSONResponse, PydanticJSONResponse, Response
 from .base import ResponseModel, ResponseModelField
 
 
@@ -43,7 +44,8 @@ class JSONResponseModel(ResponseModel):
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
         request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+            "Creating Response from returned Handler value - '%s'",
+            self.__class__.__name__,
         )
         json_response_class = t.cast(
             t.Type[JSONResponse],
@@ -55,9 +57,14 @@ class JSONResponseModel(ResponseModel):
         serializer_filter = reflect.get_metadata(
             SERIALIZER_FILTER_KEY, context.get_handler()
         )
+        content = (
+            self.serialize_json(response_obj, serializer_filter=serializer_filter)
+            if issubclass(json_response_class, PydanticJSONResponse)
+            else self.serialize(response_obj, serializer_filter=serializer_filter)
+        )
         response = json_response_class(
             **response_args,
-            content=self.serialize(response_obj, serializer_filter=serializer_filter),
+            content=content,
             headers=headers,
         )
         return response
@@ -73,6 +80,17 @@ class JSONResponseModel(ResponseModel):
             response_obj, serializer_filter=serializer_filter
         )
 
+    def serialize_json(
+        self,
+        response_obj: t.Any,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+    ) -> bytes:
+        _response_model_field = self.get_model_field()
+        assert _response_model_field, "schema must exist for JSONResponseModel"
+        return _response_model_field.prep_and_serialize_json(
+            response_obj, serializer_filter=serializer_filter
+        )
+
 
 class EmptyAPIResponseModel(JSONResponseModel):
     model_field_or_schema = DictModelField
@@ -88,3 +106,15 @@ class EmptyAPIResponseModel(JSONResponseModel):
             return self._serialize_with_serializer_object(
                 response_obj, serializer_filter
             )
+
+    def serialize_json(
+        self,
+        response_obj: t.Any,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+    ) -> bytes:
+        try:
+            return super().serialize_json(response_obj, serializer_filter)
+        except Exception:
+            return to_json(
+                self._serialize_with_serializer_object(response_obj, serializer_filter)
+            )
@@ -61,7 +61,7 @@ class RouteResponseModel:
         endpoint_response_content: t.Union[t.Any, t.Tuple[int, t.Any]],
     ) -> ResponseResolver:
         request_logger.debug(
-            f"Resolving Response Structure - '{self.__class__.__name__}'"
+            "Resolving Response Structure - '%s'", self.__class__.__name__
         )
         status_code: int = 200
         response_obj: t.Any = endpoint_response_content
@@ -95,7 +95,7 @@ class RouteResponseModel:
         self, ctx: IExecutionContext, response_obj: t.Union[t.Any, t.Tuple[int, t.Any]]
     ) -> t.Optional[Response]:
         request_logger.debug(
-            f"Response Processor Handler - '{self.__class__.__name__}'"
+            "Response Processor Handler - '%s'", self.__class__.__name__
         )
         if isinstance(response_obj, Response):
             return response_obj
@@ -104,7 +104,8 @@ class RouteResponseModel:
         if scope.get(SCOPE_RESPONSE_STARTED) is True:  # pragma: no cover
             # Similar condition exists in EllarConsumer Manager
             request_logger.debug(
-                f"Stopped Processing Since `response.send` has been called - '{self.__class__.__name__}'"
+                "Stopped Processing Since `response.send` has been called - '%s'",
+                self.__class__.__name__,
             )
             return None
 
@@ -1,5 +1,6 @@
 from typing import Any
 
+from pydantic_core import to_json
 from starlette.responses import (  # noqa
     FileResponse as FileResponse,
 )
@@ -46,3 +47,19 @@ class ORJSONResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
         assert orjson is not None, "orjson must be installed to use ORJSONResponse"
         return orjson.dumps(content)
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    Renders JSON response using pydantic-core.
+
+    When used as `DEFAULT_JSON_CLASS`, route responses with a schema are dumped
+    straight to JSON bytes by the response model field and passed through as is.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
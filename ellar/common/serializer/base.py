@@ -1,14 +1,14 @@
 import dataclasses
 import typing as t
-from dataclasses import asdict, is_dataclass
+from dataclasses import is_dataclass
 from enum import Enum
+from functools import partial
 from pathlib import PurePath
 from types import GeneratorType
 
 from ellar.pydantic import (
     BaseConfig,
     BaseModel,
-    TypeAdapter,
     model_dump,
 )
 from ellar.utils.functional import LazyStrImport
@@ -45,8 +45,29 @@ class SerializerConfig(BaseConfig):
     from_attributes = True
 
 
-@dataclasses.dataclass
+def _freeze_filter_fields(value: t.Any) -> t.Any:
+    if isinstance(value, t.Mapping):
+        return {key: _freeze_filter_fields(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset, list, tuple)):
+        return frozenset(value)
+    return value
+
+
+def _filter_fields_hash_key(value: t.Any) -> t.Any:
+    if isinstance(value, dict):
+        return frozenset(
+            (key, _filter_fields_hash_key(item)) for key, item in value.items()
+        )
+    return value
+
+
+@dataclasses.dataclass(frozen=True)
 class SerializerFilter:
+    """
+    Immutable pydantic serialization filter.
+    Its keyword arguments are computed once and reused for every serialized object.
+    """
+
     include: t.Optional[
         t.Union[t.Set[t.Union[int, str]], t.Mapping[t.Union[int, str], t.Any]]
     ] = None
@@ -58,14 +79,39 @@ class SerializerFilter:
     exclude_defaults: bool = False
     exclude_none: bool = False
 
-    def __post_init__(self) -> None:
-        self._type_adapter: TypeAdapter[t.Any] = TypeAdapter(self.__class__)
+    _kwargs: t.Dict[str, t.Any] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+    _hash: int = dataclasses.field(init=False, repr=False, compare=False)
 
-    def dict(self) -> t.Dict:
-        return self._type_adapter.dump_python(  # type:ignore[no-any-return]
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "include", _freeze_filter_fields(self.include))
+        object.__setattr__(self, "exclude", _freeze_filter_fields(self.exclude))
+        object.__setattr__(
             self,
-            mode="json",
+            "_kwargs",
+            {
+                field.name: getattr(self, field.name)
+                for field in dataclasses.fields(self)
+                if field.init
+            },
         )
+        object.__setattr__(
+            self,
+            "_hash",
+            hash(tuple(_filter_fields_hash_key(v) for v in self._kwargs.values())),
+        )
+
+    @property
+    def kwargs(self) -> t.Dict[str, t.Any]:
+        """Precomputed `model_dump` keyword arguments. Must not be mutated."""
+        return self._kwargs
+
+    def dict(self) -> t.Dict:
+        return dict(self.kwargs)
+
+    def __hash__(self) -> int:
+        return self._hash
 
 
 default_serializer_filter = SerializerFilter()
@@ -75,6 +121,8 @@ class BaseSerializer:
     _filter: SerializerFilter
 
     def _get_filter(self, **kwargs: t.Any) -> t.Dict:
+        if not kwargs:
+            return self._filter.kwargs
         _filter = self._filter.dict()
         _filter.update(kwargs)
         return _filter
@@ -97,13 +145,13 @@ class SerializerBase(BaseSerializer, __skip_filter__=True):
         self, serializer_filter: t.Optional[SerializerFilter] = None
     ) -> t.Dict:
         _filter = serializer_filter or self._filter
-        return self.model_dump(**_filter.dict())
+        return self.model_dump(**_filter.kwargs)
 
     def serialize_json(
         self, serializer_filter: t.Optional[SerializerFilter] = None
     ) -> str:
         _filter = serializer_filter or self._filter
-        return self.model_dump_json(**_filter.dict())
+        return self.model_dump_json(**_filter.kwargs)
 
     def dict(self, **kwargs: t.Any) -> t.Dict:
         return self.model_dump(**kwargs)
@@ -125,46 +173,155 @@ def _lazy_current_config() -> t.Any:
     return LazyStrImport("ellar.core:current_config")
 
 
+_SerializeHandler = t.Callable[
+    [t.Any, t.Dict[t.Any, t.Callable[[t.Any], t.Any]], t.Optional[SerializerFilter]],
+    t.Any,
+]
+
+_primitive_types = frozenset({str, int, float, bool, type(None)})
+# type(obj) -> handler, computed once per type by `_get_type_handler`
+_type_handlers: t.Dict[t.Type, _SerializeHandler] = {}
+
+
 def serialize_object(
     obj: t.Any,
     encoders: t.Optional[t.Dict[t.Any, t.Callable[[t.Any], t.Any]]] = None,
     serializer_filter: t.Optional[SerializerFilter] = None,
 ) -> t.Any:
+    if type(obj) in _primitive_types:
+        return obj
+
     _encoders = (
         encoders if encoders else _lazy_current_config().SERIALIZER_CUSTOM_ENCODER
     )
-    if isinstance(obj, (BaseModel, BaseSerializer)):
-        if isinstance(obj, BaseSerializer):
-            obj_dict = obj.serialize(serializer_filter)
-        else:
-            obj_dict = model_dump(
-                obj,
-                mode="json",
-                **(serializer_filter or default_serializer_filter).dict(),
-            )
-
-        return serialize_object(obj_dict, _encoders)
-    if is_dataclass(obj):
-        return serialize_object(
-            asdict(obj),  # type:ignore[call-overload]
-            encoders=_encoders,
-            serializer_filter=serializer_filter,
-        )
-    if isinstance(obj, dict):
-        return {
-            str(k): serialize_object(v, _encoders, serializer_filter)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
+    return _serialize(obj, _encoders, serializer_filter)
+
+
+def _serialize(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    obj_type = type(obj)
+    if obj_type in _primitive_types:
         return obj
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        return [serialize_object(item, _encoders, serializer_filter) for item in obj]
 
-    encoder = _encoders.get(type(obj))
+    handler = _type_handlers.get(obj_type)
+    if handler is None:
+        handler = _type_handlers[obj_type] = _get_type_handler(obj_type)
+    return handler(obj, encoders, serializer_filter)
+
+
+def _get_type_handler(obj_type: t.Type) -> _SerializeHandler:
+    if issubclass(obj_type, BaseSerializer):
+        return _serialize_serializer
+    if issubclass(obj_type, BaseModel):
+        return _serialize_model
+    if is_dataclass(obj_type):
+        field_names = tuple(field.name for field in dataclasses.fields(obj_type))
+        return partial(_serialize_dataclass, field_names)
+    if issubclass(obj_type, dict):
+        return _serialize_dict
+    if issubclass(obj_type, Enum):
+        return _serialize_enum
+    if issubclass(obj_type, PurePath):
+        return _serialize_path
+    if issubclass(obj_type, (str, int, float, type(None))):
+        return _serialize_primitive
+    if issubclass(obj_type, (list, set, frozenset, GeneratorType, tuple)):
+        return _serialize_sequence
+    return _serialize_with_encoder
+
+
+def _serialize_serializer(
+    obj: BaseSerializer,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return _serialize(obj.serialize(serializer_filter), encoders, None)
+
+
+def _serialize_model(
+    obj: BaseModel,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    obj_dict = model_dump(
+        obj,
+        mode="json",
+        **(serializer_filter or default_serializer_filter).kwargs,
+    )
+    return _serialize(obj_dict, encoders, None)
+
+
+def _serialize_dataclass(
+    field_names: t.Tuple[str, ...],
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return {
+        name: _serialize(getattr(obj, name), encoders, serializer_filter)
+        for name in field_names
+    }
+
+
+def _serialize_dict(
+    obj: t.Dict,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return {
+        str(k): v
+        if type(v) in _primitive_types
+        else _serialize(v, encoders, serializer_filter)
+        for k, v in obj.items()
+    }
+
+
+def _serialize_enum(
+    obj: Enum,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return obj.value
+
+
+def _serialize_path(
+    obj: PurePath,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return str(obj)
+
+
+def _serialize_primitive(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return obj
+
+
+def _serialize_sequence(
+    obj: t.Iterable,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    return [
+        item
+        if type(item) in _primitive_types
+        else _serialize(item, encoders, serializer_filter)
+        for item in obj
+    ]
+
+
+def _serialize_with_encoder(
+    obj: t.Any,
+    encoders: t.Dict[t.Any, t.Callable[[t.Any], t.Any]],
+    serializer_filter: t.Optional[SerializerFilter],
+) -> t.Any:
+    encoder = encoders.get(type(obj))
     if encoder:
         return encoder(obj)
 
@@ -178,4 +335,4 @@ def serialize_object(
         except Exception as e2:
             errors.append(e2)
             raise ValueError(errors) from e2
-    return serialize_object(data, _encoders, serializer_filter)
+    return _serialize(data, encoders, serializer_filter)
@@ -0,0 +1,111 @@
+import bisect
+import time
+import typing as t
+
+from .constants import SCOPE_REQUEST_TRACE
+from .interfaces import IRequestMetricsSink
+from .types import TScope
+
+# monotonic clock used by request spans
+now = time.perf_counter
+
+
+class TraceSpan(t.NamedTuple):
+    name: str
+    start: float
+    duration: float
+
+
+class RequestTrace:
+    """
+    Records the timing of request phases (versioning, authentication, match, guards,
+    interceptors, resolve, threadpool, handler, serialize).
+
+    An instance is set in the ASGI scope under `SCOPE_REQUEST_TRACE` for every request
+    when `REQUEST_TRACING` is enabled, and can be read back with `get_request_trace`.
+    """
+
+    __slots__ = ("start", "spans", "route")
+
+    def __init__(self) -> None:
+        self.start = now()
+        self.spans: t.List[TraceSpan] = []
+        # path format of the route operation that handled the request
+        self.route: t.Optional[str] = None
+
+    def record(self, name: str, start: float) -> None:
+        """Adds a span named `name` which started at `start` and ends now."""
+        self.spans.append(TraceSpan(name, start, now() - start))
+
+    def record_exclusive(self, name: str, start: float, first_span: int) -> None:
+        """
+        Adds a span named `name` which started at `start` and ends now,
+        without the time of the spans recorded from index `first_span` onwards.
+        """
+        inner = sum(span.duration for span in self.spans[first_span:])
+        self.spans.append(TraceSpan(name, start, now() - start - inner))
+
+    def durations(self) -> t.Dict[str, float]:
+        """Total duration in seconds of each span name, in order of first occurrence."""
+        result: t.Dict[str, float] = {}
+        for span in self.spans:
+            result[span.name] = result.get(span.name, 0.0) + span.duration
+        return result
+
+    def server_timing(self) -> str:
+        """Value of a `Server-Timing` header with the span durations in milliseconds."""
+        metrics = [
+            f"{name};dur={duration * 1000:.3f}"
+            for name, duration in self.durations().items()
+        ]
+        metrics.append(f"total;dur={(now() - self.start) * 1000:.3f}")
+        return ", ".join(metrics)
+
+
+def get_request_trace(scope: TScope) -> t.Optional[RequestTrace]:
+    return t.cast(t.Optional[RequestTrace], scope.get(SCOPE_REQUEST_TRACE))
+
+
+class Histogram:
+    """Counts observed values in buckets of fixed upper bounds."""
+
+    __slots__ = ("bounds", "buckets", "count", "sum")
+
+    def __init__(self, bounds: t.Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        # last bucket counts the values above every bound
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class InMemoryMetricsSink(IRequestMetricsSink):
+    """
+    Keeps a histogram of the phase durations, in milliseconds, per route and phase.
+    Meant for tests and local debugging.
+    """
+
+    default_bounds: t.Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+    unmatched_route = "<unmatched>"
+
+    def __init__(self, bounds: t.Optional[t.Sequence[float]] = None) -> None:
+        self.bounds = tuple(bounds or self.default_bounds)
+        self.histograms: t.Dict[t.Tuple[str, str], Histogram] = {}
+
+    def record(self, scope: TScope, trace: RequestTrace) -> None:
+        route = trace.route or self.unmatched_route
+        for name, duration in trace.durations().items():
+            self.get_histogram(route, name).observe(duration * 1000)
+        self.get_histogram(route, "total").observe((now() - trace.start) * 1000)
+
+    def get_histogram(self, route: str, phase: str) -> Histogram:
+        key = (route, phase)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.bounds)
+        return histogram
@@ -7,7 +7,12 @@ from ellar.common.constants import (
 from ellar.common.constants import (
     LOG_LEVELS as log_levels,
 )
-from ellar.common.interfaces import IAPIVersioning, IEllarMiddleware, IExceptionHandler
+from ellar.common.interfaces import (
+    IAPIVersioning,
+    IEllarMiddleware,
+    IExceptionHandler,
+    IRequestMetricsSink,
+)
 from ellar.common.responses import JSONResponse, PlainTextResponse
 from ellar.common.serializer import Serializer, SerializerFilter
 from ellar.common.types import ASGIApp, TReceive, TScope, TSend
@@ -83,6 +88,12 @@ _InterceptorValidator = AllowTypeOfSource(
 )
 InterceptorType = Annotated[EllarInterceptor, _InterceptorValidator]
 
+_MetricsSinkValidator = AllowTypeOfSource(
+    error_message=lambda source,
+    value: f"Expected IRequestMetricsSink object, received: {type(value)}"
+)
+MetricsSinkType = Annotated[IRequestMetricsSink, _MetricsSinkValidator]
+
 _JinjaLoaderValidator = AllowTypeOfSource(
     error_message=lambda source,
     value: f"Expected {BaseLoader} object, received: {type(value)}",
@@ -159,6 +170,18 @@ class ConfigSchema(Serializer, ConfigDefaultTypesMixin):
 
     REDIRECT_SLASHES: bool = False
 
+    COMPILED_ROUTER: bool = False
+
+    COMPILED_PARAMETER_RESOLVERS: bool = False
+
+    FREEZE_REFLECT_METADATA: bool = False
+
+    REQUEST_TRACING: bool = False
+
+    REQUEST_TRACING_SERVER_TIMING: bool = False
+
+    REQUEST_TRACING_METRICS_SINK: t.Optional[MetricsSinkType] = None
+
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]] = []
 
     STATIC_DIRECTORIES: t.Optional[t.List[t.Union[str, t.Any]]] = []
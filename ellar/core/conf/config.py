@@ -16,6 +16,7 @@ class Config(ConfigDefaultTypesMixin):
     __slots__ = (
         "_config_module",
         "_schema",
+        "_revision",
     )
 
     _initialized: bool = False
@@ -36,12 +37,24 @@ class Config(ConfigDefaultTypesMixin):
         data.update(**mapping)
 
         self._schema = ConfigSchema.model_validate(data, from_attributes=True)
+        self._revision = 0
         self._initialized = True
 
     @property
     def config_module(self) -> t.Optional[str]:
         return self._config_module
 
+    @property
+    def revision(self) -> int:
+        """
+        Number of changes made to the settings since the configuration was created.
+        Lets values computed from settings be reused until a setting changes.
+        """
+        return self._revision
+
+    def _changed(self) -> None:
+        object.__setattr__(self, "_revision", self._revision + 1)
+
     def _load_config_module(self, prefix: str) -> dict:
         data = {}
         _prefix = prefix.upper()
@@ -82,12 +95,14 @@ class Config(ConfigDefaultTypesMixin):
             super().__setattr__(key, value)
         else:
             setattr(self._schema, key, value)
+            self._changed()
 
     def __delattr__(self, key: t.Any) -> None:
         if key in self.__slots__ + ("_initialized",):
             # TODO: add test
             raise TypeError("can't delete config attributes.")
         delattr(self._schema, key)
+        self._changed()
 
     def __getattr__(self, key: t.Any) -> t.Any:
         value = getattr(self._schema, key)
@@ -101,6 +116,7 @@ class Config(ConfigDefaultTypesMixin):
             orig_value = getattr(self._schema, k, None)
             if orig_value is None:
                 setattr(self._schema, k, v)
+                self._changed()
         return self
 
     def get(self, key: t.Any, _default: t.Optional[t.Any] = None) -> t.Optional[t.Any]:
@@ -2,7 +2,12 @@ import typing as t
 
 from ellar.common import EllarInterceptor, GuardCanActivate
 from ellar.common.constants import LOG_LEVELS as log_levels
-from ellar.common.interfaces import IAPIVersioning, IEllarMiddleware, IExceptionHandler
+from ellar.common.interfaces import (
+    IAPIVersioning,
+    IEllarMiddleware,
+    IExceptionHandler,
+    IRequestMetricsSink,
+)
 from ellar.di import ProviderConfig
 from ellar.di.injector.tree_manager import ModuleTreeManager
 from jinja2 import BaseLoader
@@ -49,6 +54,24 @@ class ConfigDefaultTypesMixin:
     # Enable or Disable Application Router route searching by appending backslash
     REDIRECT_SLASHES: bool
 
+    # Enable or Disable route matching through a prefix tree of route paths computed at startup
+    COMPILED_ROUTER: bool
+
+    # Enable or Disable resolving path, query, header and cookie parameters of a route in a single validation
+    COMPILED_PARAMETER_RESOLVERS: bool
+
+    # Enable or Disable freezing `ellar.reflect` metadata into a read-only snapshot after the application is built
+    FREEZE_REFLECT_METADATA: bool
+
+    # Enable or Disable recording of request phase timings in the request scope
+    REQUEST_TRACING: bool
+
+    # Enable or Disable sending request phase timings as `Server-Timing` response header
+    REQUEST_TRACING_SERVER_TIMING: bool
+
+    # Receives the phase timings of every request when set
+    REQUEST_TRACING_METRICS_SINK: t.Optional[IRequestMetricsSink]
+
     # Define references to static folders in python packages.
     # eg STATIC_FOLDER_PACKAGES = [('boostrap4', 'statics')]
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]]
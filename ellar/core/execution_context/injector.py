@@ -7,11 +7,14 @@ from ellar.common.constants import ELLAR_CONFIG_MODULE
 from ellar.common.logging import logger
 from ellar.core.conf import Config
 from ellar.di import EllarInjector
-from ellar.utils.functional import SimpleLazyObject, empty
+from ellar.utils.functional import ContextLocalProxy, empty
 
 _injector_context_var: ContextVar[EllarInjector] = ContextVar("ellar.di.EllarInjector")
 _injector_context_var.set(empty)
 
+# config module -> Config used when `current_config` is accessed outside injector_context
+_fallback_configs: t.Dict[t.Optional[str], Config] = {}
+
 
 def _get_injector() -> EllarInjector:
     injector_ctx = _injector_context_var.get()
@@ -26,36 +29,39 @@ def _get_application_config() -> Config:
         return t.cast(Config, injector_ctx.get(Config))
 
     config_module = os.environ.get(ELLAR_CONFIG_MODULE)
-    if not config_module:
-        logger.warning(
-            "You are trying to access app config outside app context "
-            "and %s is not specified. This may cause differences in config "
-            "values with the app" % (ELLAR_CONFIG_MODULE,)
-        )
+    config = _fallback_configs.get(config_module)
+    if config is None:
+        if not config_module:
+            logger.warning(
+                "You are trying to access app config outside app context "
+                "and %s is not specified. This may cause differences in config "
+                "values with the app" % (ELLAR_CONFIG_MODULE,)
+            )
+        config = _fallback_configs[config_module] = Config(config_module=config_module)
+    return config
+
 
-    return Config(config_module=config_module)
+class _CurrentInjectorProxy(ContextLocalProxy):
+    def get(self, interface: t.Any, scope: t.Any = None) -> t.Any:
+        # skips the generic attribute proxy for the most used injector method
+        return _get_injector().get(interface, scope)
 
 
-current_config: Config = t.cast(Config, SimpleLazyObject(func=_get_application_config))
+current_config: Config = t.cast(Config, ContextLocalProxy(func=_get_application_config))
 
 current_injector: EllarInjector = t.cast(
-    EllarInjector, SimpleLazyObject(func=_get_injector)
+    EllarInjector, _CurrentInjectorProxy(func=_get_injector)
 )
 
 
-def _clear_lazy_objects() -> None:
-    current_injector._wrapped = empty  # type:ignore[attr-defined]
-    current_config._wrapped = empty
-
-
 @asynccontextmanager
 async def injector_context(
     injector: EllarInjector,
 ) -> t.AsyncGenerator[EllarInjector, t.Any]:
-    _clear_lazy_objects()
     _injector_reset_token = _injector_context_var.set(injector)
 
     yield injector
 
     _injector_context_var.reset(_injector_reset_token)
-    _clear_lazy_objects()
+    if _fallback_configs:
+        _fallback_configs.clear()
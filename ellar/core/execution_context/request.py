@@ -9,11 +9,7 @@ from ellar.di import (
     request_context_var,
 )
 from ellar.events import request_started, request_teardown
-from ellar.utils.functional import SimpleLazyObject, empty
-
-
-def _clear_lazy_objects() -> None:
-    current_connection._wrapped = empty  # type:ignore[attr-defined]
+from ellar.utils.functional import ContextLocalProxy, empty
 
 
 class HttpRequestConnectionContext(RequestScopeContext):
@@ -27,8 +23,6 @@ class HttpRequestConnectionContext(RequestScopeContext):
 
         register_request_scope_context(IHostContext, self.host_context)
 
-        _clear_lazy_objects()
-
         await request_started.run(context=self.host_context)
         return self
 
@@ -44,8 +38,6 @@ class HttpRequestConnectionContext(RequestScopeContext):
             await request_teardown.run(context=self.host_context)
         except ValueError as vex:
             logger.exception(vex)
-        finally:
-            _clear_lazy_objects()
 
 
 def _get_connection() -> IHostContext:
@@ -59,5 +51,5 @@ def _get_connection() -> IHostContext:
 
 
 current_connection: IHostContext = t.cast(
-    IHostContext, SimpleLazyObject(func=_get_connection)
+    IHostContext, ContextLocalProxy(func=_get_connection)
 )
@@ -15,11 +15,15 @@ class GuardConsumer(IGuardsConsumer):
     async def execute(
         self, context: IExecutionContext, route_operation: "RouteOperationBase"
     ) -> None:
-        await self.run_route_guards(context)
+        await self.run_route_guards(context, route_operation)
 
     @t.no_type_check
-    async def run_route_guards(self, context: IExecutionContext) -> None:
-        for guard in self._get_guards(context):
+    async def run_route_guards(
+        self,
+        context: IExecutionContext,
+        route_operation: t.Optional["RouteOperationBase"] = None,
+    ) -> None:
+        for guard in self._get_guards(context, route_operation):
             await self.run_guard(context, guard)
 
     async def run_guard(
@@ -29,7 +33,18 @@ class GuardConsumer(IGuardsConsumer):
         if not result:
             guard_instance.raise_exception()
 
-    def _get_guards(self, context: IExecutionContext) -> t.Iterable["GuardCanActivate"]:
+    def _get_guards(
+        self,
+        context: IExecutionContext,
+        route_operation: t.Optional["RouteOperationBase"] = None,
+    ) -> t.Iterable["GuardCanActivate"]:
+        get_guards = getattr(route_operation, "get_guards", None)
+        if get_guards is not None:
+            # guards chain computed once by the route operation
+            return [
+                self.get_guard_instance(context, guard) for guard in get_guards(context)
+            ]
+
         app = context.get_app()
         reflector = app.reflector
 
@@ -4,6 +4,7 @@ import typing as t
 from ellar.common import EllarInterceptor, IExecutionContext, IInterceptorsConsumer
 from ellar.common.constants import ROUTE_INTERCEPTORS, SCOPE_RESPONSE_STARTED
 from ellar.common.logging import request_logger
+from ellar.common.tracing import get_request_trace, now
 from ellar.di import injectable
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -23,19 +24,29 @@ class EllarInterceptorConsumer(IInterceptorsConsumer):
             )
         return interceptor
 
-    async def execute(
+    def _get_interceptors(
         self, context: IExecutionContext, route_operation: "RouteOperationBase"
-    ) -> t.Any:
+    ) -> t.Iterable[t.Union[t.Type[EllarInterceptor], EllarInterceptor]]:
+        get_interceptors = getattr(route_operation, "get_interceptors", None)
+        if get_interceptors is not None:
+            # interceptors chain computed once by the route operation
+            return t.cast(t.Iterable[t.Any], get_interceptors(context))
+
         reflector = context.get_app().reflector
-        route_interceptors: t.List[EllarInterceptor] = list(
-            map(
-                functools.partial(self.get_interceptor, context),
-                reflector.get_all_and_override(
-                    ROUTE_INTERCEPTORS, *[context.get_handler(), context.get_class()]
-                )
-                or context.get_app().get_interceptors(),
+        return (
+            reflector.get_all_and_override(
+                ROUTE_INTERCEPTORS, *[context.get_handler(), context.get_class()]
             )
+            or context.get_app().get_interceptors()
         )
+
+    async def execute(
+        self, context: IExecutionContext, route_operation: "RouteOperationBase"
+    ) -> t.Any:
+        route_interceptors: t.List[EllarInterceptor] = [
+            self.get_interceptor(context, interceptor)
+            for interceptor in self._get_interceptors(context, route_operation)
+        ]
         route_interceptors_length = len(route_interceptors or [])
 
         if route_interceptors:
@@ -47,13 +58,21 @@ class EllarInterceptorConsumer(IInterceptorsConsumer):
                     context, functools.partial(handler, idx + 1)
                 )
 
-            res = await handler(0)
+            trace = get_request_trace(context.get_args()[0])
+            if trace is None:
+                res = await handler(0)
+            else:
+                start, first_span = now(), len(trace.spans)
+                res = await handler(0)
+                # time spent in interceptors only, without the request handling spans
+                trace.record_exclusive("interceptors", start, first_span)
         else:
             res = await route_operation.handle_request(context=context)
 
         if context.get_args()[0][SCOPE_RESPONSE_STARTED]:
             request_logger.debug(
-                f"Stopped Processing Since `response.send` has been called - '{self.__class__.__name__}'"
+                "Stopped Processing Since `response.send` has been called - '%s'",
+                self.__class__.__name__,
             )
             return
         await route_operation.handle_response(context, res)
@@ -9,6 +9,7 @@ from .errors import ServerErrorMiddleware
 from .exceptions import ExceptionMiddleware
 from .function import FunctionBasedMiddleware, as_middleware
 from .middleware import EllarMiddleware as Middleware
+from .tracing import RequestTracingMiddleware
 from .trusted_host import TrustedHostMiddleware
 from .versioning import RequestVersioningMiddleware
 
@@ -23,6 +24,7 @@ __all__ = [
     "TrustedHostMiddleware",
     "WSGIMiddleware",
     "RequestVersioningMiddleware",
+    "RequestTracingMiddleware",
     "ServerErrorMiddleware",
     "as_middleware",
 ]
@@ -0,0 +1,64 @@
+import typing as t
+
+from ellar.common.constants import SCOPE_REQUEST_TRACE
+from ellar.common.interfaces import IRequestMetricsSink
+from ellar.common.tracing import RequestTrace
+from ellar.common.types import ASGIApp, TMessage, TReceive, TScope, TSend
+from ellar.core.conf import Config
+from starlette.datastructures import MutableHeaders
+
+
+class RequestTracingMiddleware:
+    """
+    Sets a `RequestTrace` in the scope of every HTTP and websocket request.
+    Once the request is done, its phase timings are sent as a `Server-Timing` header
+    and/or handed to a metrics sink, depending on configuration.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = False,
+        metrics_sink: t.Optional[IRequestMetricsSink] = None,
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.metrics_sink = metrics_sink
+
+    @classmethod
+    def is_enabled(cls, config: Config) -> bool:
+        return bool(
+            config.REQUEST_TRACING
+            or config.REQUEST_TRACING_SERVER_TIMING
+            or config.REQUEST_TRACING_METRICS_SINK
+        )
+
+    @classmethod
+    def from_config(cls, app: ASGIApp, config: Config) -> "RequestTracingMiddleware":
+        return cls(
+            app,
+            server_timing=config.REQUEST_TRACING_SERVER_TIMING,
+            metrics_sink=config.REQUEST_TRACING_METRICS_SINK,
+        )
+
+    async def __call__(self, scope: TScope, receive: TReceive, send: TSend) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        trace = scope[SCOPE_REQUEST_TRACE] = RequestTrace()
+        _send = send
+
+        if self.server_timing and scope["type"] == "http":
+
+            async def _send(message: TMessage) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", trace.server_timing())
+                await send(message)
+
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            if self.metrics_sink is not None:
+                self.metrics_sink.record(scope, trace)
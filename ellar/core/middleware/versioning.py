@@ -1,6 +1,7 @@
 import typing as t
 
 from ellar.common.constants import SCOPE_API_VERSIONING_RESOLVER
+from ellar.common.tracing import get_request_trace, now
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.core.conf import Config
 from ellar.core.versioning import BaseAPIVersioning, DefaultAPIVersioning
@@ -25,9 +26,15 @@ class RequestVersioningMiddleware:
             or DefaultAPIVersioning()
         )
 
+        trace = get_request_trace(scope)
+        start = now() if trace is not None else 0.0
+
         version_scheme_resolver = scheme.get_version_resolver(scope)
         version_scheme_resolver.resolve()
 
+        if trace is not None:
+            trace.record("versioning", start)
+
         scope[SCOPE_API_VERSIONING_RESOLVER] = version_scheme_resolver
         await self.app(scope, receive, send)
 
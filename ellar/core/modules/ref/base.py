@@ -190,6 +190,7 @@ class ModuleRefBase(ABC):
 
     def export_all(self) -> None:
         self._exports = list(set(self._exports + list(self._providers.keys())))
+        self.container.invalidate_resolutions()
 
     @t.no_type_check
     def build_dependencies(self, step: int = -1) -> None:
@@ -230,6 +231,7 @@ class ModuleRefBase(ABC):
 
         if provider_type not in self.exports:
             self._exports.append(provider_type)
+            self.container.invalidate_resolutions()
 
     def add_provider(
         self, provider: t.Union[t.Type, ProviderConfig, t.Any], export: bool = False
@@ -10,14 +10,20 @@ from ellar.common.interfaces import (
     IInterceptorsConsumer,
 )
 from ellar.common.logging import request_logger
+from ellar.common.tracing import get_request_trace, now
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.core.execution_context import current_injector
-from ellar.di import register_request_scope_context
+from ellar.core.guards import GuardConsumer
+from ellar.core.interceptors import EllarInterceptorConsumer
+from ellar.di import SingletonScope, register_request_scope_context
 from ellar.reflect import reflect
+from injector import ScopeDecorator
 from starlette.routing import Match
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.app import App
     from ellar.core.versioning.resolver import BaseAPIVersioningResolver
+    from ellar.di import EllarInjector
 
 __all__ = [
     "RouteOperationBase",
@@ -25,11 +31,50 @@ __all__ = [
 ]
 
 
+class _OperationChain(t.NamedTuple):
+    app: "App"
+    # app level items are read from the config, the chain is computed again when it changes
+    config_revision: int
+    # singleton scoped types are resolved to instances,
+    # other types are resolved on every request
+    items: t.Tuple[t.Any, ...]
+
+
+def _get_app_guards(app: "App") -> t.List[t.Any]:
+    return app.get_guards()
+
+
+def _get_app_interceptors(app: "App") -> t.List[t.Any]:
+    return app.get_interceptors()
+
+
+class _OperationPipeline(t.NamedTuple):
+    app: "App"
+    # available when IExecutionContextFactory is singleton scoped
+    execution_context_factory: t.Optional[IExecutionContextFactory]
+    # True when IGuardsConsumer and IInterceptorsConsumer are not overridden
+    default_consumers: bool
+
+
+def _is_singleton(injector: "EllarInjector", interface: t.Type) -> bool:
+    try:
+        binding, _ = injector.container.get_binding(interface)
+    except Exception:
+        return False
+
+    scope = binding.scope
+    if isinstance(scope, ScopeDecorator):  # pragma: no cover
+        scope = scope.scope
+    return isinstance(scope, type) and issubclass(scope, SingletonScope)
+
+
 class RouteOperationBase:
     methods: t.Set[str]
 
     def __init__(self, endpoint: t.Callable) -> None:
         self.endpoint = endpoint
+        self._chains: t.Dict[str, _OperationChain] = {}
+        self._pipeline: t.Optional[_OperationPipeline] = None
 
     @cached_property
     def router_reflect_key(self) -> t.Any:
@@ -44,25 +89,145 @@ class RouteOperationBase:
 
     async def app(self, scope: TScope, receive: TReceive, send: TSend) -> None:
         request_logger.debug(
-            f"Started Computing Execution Context - '{self.__class__.__name__}'"
+            "Started Computing Execution Context - '%s'", self.__class__.__name__
         )
+        trace = get_request_trace(scope)
+        if trace is not None:
+            trace.route = scope.get("root_path", "") + getattr(self, "path", "")
 
-        execution_context_factory = current_injector.get(IExecutionContextFactory)
+        pipeline = self._get_pipeline(scope)
+        execution_context_factory = (
+            pipeline.execution_context_factory
+            or current_injector.get(IExecutionContextFactory)
+        )
         context = execution_context_factory.create_context(
             operation=self, scope=scope, receive=receive, send=send
         )
         register_request_scope_context(IExecutionContext, context)
 
+        if (
+            pipeline.default_consumers
+            and not self.get_guards(context)
+            and not self.get_interceptors(context)
+        ):
+            request_logger.debug(
+                "No Guards and Interceptors, Running Handler - '%s'",
+                self.__class__.__name__,
+            )
+            await self._run_handler(context)
+            return
+
         interceptor_consumer = current_injector.get(IInterceptorsConsumer)
         guard_consumer = current_injector.get(IGuardsConsumer)
 
         request_logger.debug(
-            f"Running Guards and Interceptors - '{self.__class__.__name__}'"
+            "Running Guards and Interceptors - '%s'", self.__class__.__name__
         )
 
-        await guard_consumer.execute(context, self)
+        if trace is None:
+            await guard_consumer.execute(context, self)
+        else:
+            start = now()
+            await guard_consumer.execute(context, self)
+            trace.record("guards", start)
         await interceptor_consumer.execute(context, self)
 
+    async def _run_handler(self, context: IExecutionContext) -> None:
+        res = await self.handle_request(context=context)
+
+        if context.get_args()[0].get(constants.SCOPE_RESPONSE_STARTED):
+            request_logger.debug(
+                "Stopped Processing Since `response.send` has been called - '%s'",
+                self.__class__.__name__,
+            )
+            return
+        await self.handle_response(context, res)
+
+    def _get_pipeline(self, scope: TScope) -> _OperationPipeline:
+        app = scope["app"]
+        pipeline = self._pipeline
+
+        if pipeline is None or pipeline.app is not app:
+            injector = current_injector
+            pipeline = _OperationPipeline(
+                app=app,
+                execution_context_factory=injector.get(IExecutionContextFactory)
+                if _is_singleton(injector, IExecutionContextFactory)
+                else None,
+                default_consumers=type(injector.get(IGuardsConsumer)) is GuardConsumer
+                and type(injector.get(IInterceptorsConsumer))
+                is EllarInterceptorConsumer,
+            )
+            self._pipeline = pipeline
+        return pipeline
+
+    def get_guards(self, context: IExecutionContext) -> t.Tuple[t.Any, ...]:
+        """
+        Returns route guards in the order they are to be executed.
+        Types that are not singleton scoped are returned as-is and have to be resolved per request.
+        """
+        return self._get_chain(context, constants.GUARDS_KEY, _get_app_guards)
+
+    def get_interceptors(self, context: IExecutionContext) -> t.Tuple[t.Any, ...]:
+        """
+        Returns route interceptors in the order they are to be executed.
+        Types that are not singleton scoped are returned as-is and have to be resolved per request.
+        """
+        return self._get_chain(
+            context, constants.ROUTE_INTERCEPTORS, _get_app_interceptors
+        )
+
+    def invalidate_chains(self) -> None:
+        """
+        Drops computed guards and interceptors chains.
+        Should be called when route or controller guards and interceptors metadata changes after the first request.
+        """
+        self._chains.clear()
+
+    def _get_chain(
+        self,
+        context: IExecutionContext,
+        metadata_key: str,
+        get_app_items: t.Callable[["App"], t.List[t.Any]],
+    ) -> t.Tuple[t.Any, ...]:
+        app = context.get_app()
+        config_revision = app.config.revision
+        chain = self._chains.get(metadata_key)
+
+        if (
+            chain is None
+            or chain.app is not app
+            or chain.config_revision != config_revision
+        ):
+            request_logger.debug(
+                "Computing '%s' chain - '%s'", metadata_key, self.__class__.__name__
+            )
+            chain = _OperationChain(
+                app=app,
+                config_revision=config_revision,
+                items=self._compute_chain(context, metadata_key, get_app_items(app)),
+            )
+            self._chains[metadata_key] = chain
+        return chain.items
+
+    def _compute_chain(
+        self, context: IExecutionContext, metadata_key: str, app_items: t.List[t.Any]
+    ) -> t.Tuple[t.Any, ...]:
+        items = (
+            context.get_app().reflector.get_all_and_override(
+                metadata_key, context.get_handler(), context.get_class()
+            )
+            or app_items
+        )
+        injector = context.get_service_provider()
+
+        return tuple(
+            injector.get(item)
+            if isinstance(item, type) and _is_singleton(injector, item)
+            else item
+            for item in items
+        )
+
     def get_controller_type(self) -> t.Any:
         """
         For operation under a controller, `get_control_type` and `get_class` will return the same result
@@ -87,7 +252,7 @@ class RouteOperationBase:
     @cached_property
     def allowed_version(self) -> t.Set[t.Union[int, float, str]]:
         request_logger.debug(
-            f"Resolving Endpoint Versions - '{self.__class__.__name__}'"
+            "Resolving Endpoint Versions - '%s'", self.__class__.__name__
         )
         versions = (
             reflect.get_metadata(constants.VERSIONING_KEY, self.endpoint) or set()
@@ -113,7 +278,9 @@ class RouteOperationBase:
 
     def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
         request_logger.debug(
-            f"Matching Endpoint URL, path={scope['path']}- '{self.__class__.__name__}'"
+            "Matching Endpoint URL, path=%s- '%s'",
+            scope["path"],
+            self.__class__.__name__,
         )
 
         match = super().matches(scope)  # type: ignore
@@ -126,7 +293,7 @@ class RouteOperationBase:
                 route_versions=self.allowed_version
             ):
                 request_logger.debug(
-                    f"URL Matched with invalid Version - '{self.__class__.__name__}'"
+                    "URL Matched with invalid Version - '%s'", self.__class__.__name__
                 )
                 return Match.NONE, {}
         return match  # type: ignore
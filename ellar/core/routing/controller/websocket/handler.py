@@ -21,14 +21,14 @@ class ControllerWebSocketExtraHandler(WebSocketExtraHandler):
 
         receiver_kwargs.update(extra_kwargs)
         request_logger.debug(
-            f"Executing on_receive handler from {self.__class__.__name__}"
+            "Executing on_receive handler from %s", self.__class__.__name__
         )
         await self.on_receive(self.controller_instance, **receiver_kwargs)
 
     async def execute_on_connect(self, *, context: IExecutionContext) -> None:
         if self.on_connect:
             request_logger.debug(
-                f"Executing on_connect handler from {self.__class__.__name__}"
+                "Executing on_connect handler from %s", self.__class__.__name__
             )
             await self.on_connect(
                 self.controller_instance, context.switch_to_websocket().get_client()
@@ -41,7 +41,7 @@ class ControllerWebSocketExtraHandler(WebSocketExtraHandler):
     ) -> None:
         if self.on_disconnect:
             request_logger.debug(
-                f"Executing on_disconnect handler from {self.__class__.__name__}"
+                "Executing on_disconnect handler from %s", self.__class__.__name__
             )
             await self.on_disconnect(
                 self.controller_instance,
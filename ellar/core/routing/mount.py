@@ -6,6 +6,7 @@ from ellar.common.constants import (
     SCOPE_API_VERSIONING_RESOLVER,
 )
 from ellar.common.logging import logger, request_logger
+from ellar.common.tracing import get_request_trace, now
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.reflect import fail_silently, reflect
 from starlette._utils import get_route_path
@@ -62,7 +63,9 @@ class EllarControllerMount(StarletteMount):
 
     def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
         request_logger.debug(
-            f"Matching URL Handler path={scope['path']} - '{self.__class__.__name__}'"
+            "Matching URL Handler path=%s - '%s'",
+            scope["path"],
+            self.__class__.__name__,
         )
         match, _child_scope = super().matches(scope)
         if match == Match.FULL:
@@ -71,7 +74,9 @@ class EllarControllerMount(StarletteMount):
             partial: t.Optional["RouteOperation"] = None
             partial_scope = {}
 
-            for route in self.routes:
+            for route in t.cast(RouteCollection, self.routes).match_candidates(
+                scope_copy
+            ):
                 # Determine if any route matches the incoming scope,
                 # and hand over to the matching route if found.
                 match, child_scope = route.matches(scope_copy)
@@ -96,7 +101,9 @@ class EllarControllerMount(StarletteMount):
 
     async def _app_handler(self, scope: TScope, receive: TReceive, send: TSend) -> None:
         request_logger.debug(
-            f"Executing Matched URL Handler, path={scope['path']} - '{self.__class__.__name__}'"
+            "Executing Matched URL Handler, path=%s - '%s'",
+            scope["path"],
+            self.__class__.__name__,
         )
         route = t.cast(t.Optional[Route], scope.get(self._lookup_key))
         if route:
@@ -137,6 +144,7 @@ class ApplicationRouter(Router):
         on_startup: t.Optional[t.Sequence[t.Callable]] = None,
         on_shutdown: t.Optional[t.Sequence[t.Callable]] = None,
         lifespan: t.Optional[t.Callable[[t.Any], t.AsyncContextManager]] = None,
+        compiled: bool = False,
     ):
         super().__init__(
             routes=None,
@@ -148,6 +156,8 @@ class ApplicationRouter(Router):
         )
         self.default = router_default_decorator(self.default)
         self.routes: RouteCollection = RouteCollection(routes)
+        if compiled:
+            self.routes.compile()
 
     def _get_route_handler(
         self, scope: TScope
@@ -155,7 +165,7 @@ class ApplicationRouter(Router):
         partial = None
         partial_scope: t.Dict = {}
 
-        for route in self.routes:
+        for route in self.routes.match_candidates(scope):
             # Determine if any route matches the incoming scope,
             # and hand over to the matching route if found.
             match, child_scope = route.matches(scope)
@@ -182,7 +192,7 @@ class ApplicationRouter(Router):
             else:
                 redirect_scope["path"] = redirect_scope["path"] + "/"
 
-            for route in self.routes:
+            for route in self.routes.match_candidates(redirect_scope):
                 match, child_scope = route.matches(redirect_scope)
                 if match != Match.NONE:
                     redirect_url = URL(scope=redirect_scope)
@@ -199,7 +209,13 @@ class ApplicationRouter(Router):
         if scope["type"] == "lifespan":
             return await self.lifespan(scope, receive, send)
 
-        route = self._get_route_handler(scope)
+        trace = get_request_trace(scope)
+        if trace is None:
+            route = self._get_route_handler(scope)
+        else:
+            start = now()
+            route = self._get_route_handler(scope)
+            trace.record("match", start)
 
         if route is None:
             return await self.default(scope, receive, send)
@@ -7,6 +7,7 @@ from ellar.common.interfaces import IExecutionContext
 from ellar.common.logging import request_logger
 from ellar.common.params import ExtraEndpointArg, RequestEndpointArgsModel
 from ellar.common.responses.models import RouteResponseModel
+from ellar.common.tracing import get_request_trace, now
 from ellar.reflect import reflect
 from ellar.utils import generate_operation_unique_id, get_name
 from starlette.concurrency import run_in_threadpool
@@ -112,29 +113,67 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
 
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
         request_logger.debug(
-            f"Executing Request Endpoint Handler - '{self.__class__.__name__}'"
+            "Executing Request Endpoint Handler - '%s'", self.__class__.__name__
         )
         if self._is_coroutine:
             return await self.endpoint(**kwargs)
-        else:
-            return await run_in_threadpool(self.endpoint, **kwargs)
+        return await self._run_in_threadpool(context, (), kwargs)
+
+    async def _run_in_threadpool(
+        self, context: IExecutionContext, args: t.Tuple, kwargs: t.Dict
+    ) -> t.Any:
+        trace = get_request_trace(context.get_args()[0])
+        if trace is None:
+            return await run_in_threadpool(self.endpoint, *args, **kwargs)
+
+        queued = now()
+
+        def _run_endpoint() -> t.Any:
+            # time spent waiting for a worker thread
+            trace.record("threadpool", queued)
+            return self.endpoint(*args, **kwargs)
+
+        return await run_in_threadpool(_run_endpoint)
 
     async def handle_request(self, context: IExecutionContext) -> t.Any:
         request_logger.debug(
-            f"Resolving Request Endpoint Handler Dependencies - '{self.__class__.__name__}'"
+            "Resolving Request Endpoint Handler Dependencies - '%s'",
+            self.__class__.__name__,
         )
+        trace = get_request_trace(context.get_args()[0])
+        if trace is None:
+            res = await self.endpoint_parameter_model.resolve_dependencies(ctx=context)
+            if res.errors:
+                raise RequestValidationError(res.errors)
+            return await self.run(context, res.data)
+
+        start = now()
         res = await self.endpoint_parameter_model.resolve_dependencies(ctx=context)
+        trace.record("resolve", start)
         if res.errors:
             raise RequestValidationError(res.errors)
 
-        return await self.run(context, res.data)
+        start, first_span = now(), len(trace.spans)
+        try:
+            return await self.run(context, res.data)
+        finally:
+            # without the `threadpool` wait of sync handlers
+            trace.record_exclusive("handler", start, first_span)
 
     async def handle_response(
         self, context: IExecutionContext, response_obj: t.Any
     ) -> None:
-        request_logger.debug(f"Processing Response - '{self.__class__.__name__}'")
-        response = self.response_model.process_response(
-            ctx=context, response_obj=response_obj
-        )
+        request_logger.debug("Processing Response - '%s'", self.__class__.__name__)
+        trace = get_request_trace(context.get_args()[0])
+        if trace is None:
+            response = self.response_model.process_response(
+                ctx=context, response_obj=response_obj
+            )
+        else:
+            start = now()
+            response = self.response_model.process_response(
+                ctx=context, response_obj=response_obj
+            )
+            trace.record("serialize", start)
         if isinstance(response, Response):
             await response(*context.get_args())
@@ -3,16 +3,22 @@ import uuid
 from collections import OrderedDict
 
 from ellar.common.exceptions import ImproperConfiguration
+from ellar.common.params import EndpointArgsModel
 from ellar.utils import generate_controller_operation_unique_id
+from starlette._utils import get_route_path
 from starlette.routing import BaseRoute, Host, Mount
+from starlette.types import Scope
+
+from .route_tree import RouteTree
 
 
 class RouteCollection(t.Sequence[BaseRoute]):
-    __slots__ = ("_routes", "_served_routes")
+    __slots__ = ("_routes", "_served_routes", "_route_tree")
 
     def __init__(self, routes: t.Optional[t.Sequence[BaseRoute]] = None) -> None:
         self._routes: t.Dict[int, BaseRoute] = OrderedDict()
         self._served_routes: t.List[BaseRoute] = []
+        self._route_tree: t.Optional[RouteTree] = None
         self.extend([] if routes is None else list(routes))
 
     def __contains__(self, item: t.Any) -> bool:
@@ -46,11 +52,53 @@ class RouteCollection(t.Sequence[BaseRoute]):
         return self
 
     def sort_routes(self) -> None:
-        # TODO: flatten the routes for faster look up
         self._served_routes = list(self._routes.values())
         self._served_routes.sort(
             key=lambda e: e.host if isinstance(e, Host) else e.path  # type: ignore
         )
+        if self._route_tree is not None:
+            self.compile()
+
+    @property
+    def compiled(self) -> bool:
+        return self._route_tree is not None
+
+    def compile(self) -> "RouteCollection":
+        """
+        Builds a RouteTree for this collection and every nested route collection.
+        Once compiled, the tree is rebuilt whenever the collection changes.
+        """
+        self._route_tree = RouteTree(self._served_routes)
+        for route in self._served_routes:
+            routes = getattr(route, "routes", None)
+            if isinstance(routes, RouteCollection) and not routes.compiled:
+                routes.compile()
+        return self
+
+    def compile_parameter_resolvers(self, compiled: bool = True) -> "RouteCollection":
+        """
+        Resolves the path, query, header and cookie parameters of every route operation
+        of this collection and nested route collections with a `CompiledParameterResolver`,
+        or with their own resolvers when `compiled` is False.
+        """
+        for route in self._served_routes:
+            endpoint_parameter_model = getattr(route, "endpoint_parameter_model", None)
+            if isinstance(endpoint_parameter_model, EndpointArgsModel):
+                endpoint_parameter_model.compile_route_models(compiled)
+
+            routes = getattr(route, "routes", None)
+            if isinstance(routes, RouteCollection):
+                routes.compile_parameter_resolvers(compiled)
+        return self
+
+    def match_candidates(self, scope: Scope) -> t.Sequence[BaseRoute]:
+        """
+        Returns routes that may match the scope path in their served order.
+        Without compilation, this is every route in the collection.
+        """
+        if self._route_tree is None:
+            return self._served_routes
+        return self._route_tree.get_candidates(get_route_path(scope))
 
     def _compute_operation_hash(self, operation: BaseRoute) -> None:
         if not isinstance(operation, BaseRoute):
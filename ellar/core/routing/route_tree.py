@@ -0,0 +1,117 @@
+import typing as t
+
+from starlette.routing import BaseRoute, Mount
+
+__all__ = ["RouteTree"]
+
+# Convertors whose regex can never match across a `/` boundary.
+# Any other convertor (e.g. `path` or custom ones) makes the route a prefix route.
+_SEGMENT_CONVERTORS = frozenset(["str", "int", "float", "uuid"])
+
+
+class _RouteTreeNode:
+    __slots__ = ("static", "param", "routes", "prefix_routes")
+
+    def __init__(self) -> None:
+        self.static: t.Dict[str, "_RouteTreeNode"] = {}
+        self.param: t.Optional["_RouteTreeNode"] = None
+        # routes whose path ends exactly at this node
+        self.routes: t.List[int] = []
+        # routes that may match any path below this node. eg: Mount, `{path:path}`
+        self.prefix_routes: t.List[int] = []
+
+
+def _is_segment_param(segment: str) -> t.Optional[bool]:
+    """
+    Returns None for a static segment, True for a segment
+    whose parameters are confined to the segment and False otherwise
+    """
+    if "{" not in segment:
+        return None
+
+    for part in segment.split("{")[1:]:
+        name = part.split("}", 1)[0]
+        convertor_type = name.split(":", 1)[1] if ":" in name else "str"
+        if convertor_type not in _SEGMENT_CONVERTORS:
+            return False
+    return True
+
+
+class RouteTree:
+    """
+    Prefix tree of route path segments computed once from a route collection.
+
+    A lookup walks the request path segment by segment and returns the routes
+    that can possibly match it, in their original order. Each candidate still runs
+    its own `matches`, so FULL/PARTIAL results and versioning checks stay unchanged;
+    only the routes that can't match the path are skipped.
+    """
+
+    __slots__ = ("_root", "_routes", "_fallback")
+
+    def __init__(self, routes: t.Sequence[BaseRoute]) -> None:
+        self._root = _RouteTreeNode()
+        self._routes: t.List[BaseRoute] = list(routes)
+        # routes that can't be indexed by path, eg: Host, are always candidates
+        self._fallback: t.List[int] = []
+
+        for index, route in enumerate(self._routes):
+            self._insert(index, route)
+
+    def _insert(self, index: int, route: BaseRoute) -> None:
+        path = getattr(route, "path", None)
+        if isinstance(route, Mount):
+            is_prefix = True
+        elif isinstance(path, str) and hasattr(route, "path_regex"):
+            is_prefix = False
+        else:
+            self._fallback.append(index)
+            return
+
+        node = self._root
+        for segment in t.cast(str, path).split("/"):
+            is_param = _is_segment_param(segment)
+            if is_param is None:
+                node = node.static.setdefault(segment, _RouteTreeNode())
+            elif is_param:
+                if node.param is None:
+                    node.param = _RouteTreeNode()
+                node = node.param
+            else:
+                node.prefix_routes.append(index)
+                return
+
+        if is_prefix:
+            node.prefix_routes.append(index)
+        else:
+            node.routes.append(index)
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def get_candidates(self, route_path: str) -> t.List[BaseRoute]:
+        found = list(self._fallback)
+        nodes = [self._root]
+
+        for segment in route_path.split("/"):
+            next_nodes = []
+            for node in nodes:
+                found.extend(node.prefix_routes)
+
+                child = node.static.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+
+                if node.param is not None and segment:
+                    next_nodes.append(node.param)
+
+            nodes = next_nodes
+            if not nodes:
+                break
+
+        for node in nodes:
+            found.extend(node.prefix_routes)
+            found.extend(node.routes)
+
+        found.sort()
+        return [self._routes[index] for index in found]
@@ -37,7 +37,7 @@ class WebSocketExtraHandler:
         self, context: "IExecutionContext", **receiver_kwargs: t.Any
     ) -> None:
         request_logger.debug(
-            f"Running Websocket Dispatch Action from '{self.__class__.__name__}'"
+            "Running Websocket Dispatch Action from '%s'", self.__class__.__name__
         )
         websocket = context.switch_to_websocket().get_client()
         await self.execute_on_connect(context=context)
@@ -69,7 +69,7 @@ class WebSocketExtraHandler:
         self, context: "IExecutionContext", data: t.Any
     ) -> t.Dict:
         request_logger.debug(
-            f"Resolving Receiver Dependencies from '{self.__class__.__name__}'"
+            "Resolving Receiver Dependencies from '%s'", self.__class__.__name__
         )
         res = await self.route_parameter_model.resolve_ws_body_dependencies(
             ctx=context, body_data=data
@@ -93,14 +93,14 @@ class WebSocketExtraHandler:
 
         receiver_kwargs.update(extra_kwargs)
         request_logger.debug(
-            f"Executing on_receive handler from '{self.__class__.__name__}'"
+            "Executing on_receive handler from '%s'", self.__class__.__name__
         )
         await self.on_receive(**receiver_kwargs)
 
     async def execute_on_connect(self, *, context: "IExecutionContext") -> None:
         if self.on_connect is not None:
             request_logger.debug(
-                f"Executing on_connect handler from '{self.__class__.__name__}'"
+                "Executing on_connect handler from '%s'", self.__class__.__name__
             )
             await self.on_connect(context.switch_to_websocket().get_client())
             return
@@ -111,7 +111,7 @@ class WebSocketExtraHandler:
     ) -> None:
         if self.on_disconnect is not None:
             request_logger.debug(
-                f"Executing on_disconnect handler from '{self.__class__.__name__}'"
+                "Executing on_disconnect handler from '%s'", self.__class__.__name__
             )
             await self.on_disconnect(
                 context.switch_to_websocket().get_client(), close_code
@@ -119,7 +119,7 @@ class WebSocketExtraHandler:
 
     async def decode(self, websocket: "WebSocket", message: Message) -> t.Any:
         request_logger.debug(
-            f"Decoding websocket stream message from '{self.__class__.__name__}'"
+            "Decoding websocket stream message from '%s'", self.__class__.__name__
         )
         if self.encoding == "text":
             if "text" not in message:
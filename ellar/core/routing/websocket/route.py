@@ -87,11 +87,11 @@ class WebsocketRouteOperation(WebsocketRouteOperationBase, StarletteWebSocketRou
 
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
         request_logger.debug(
-            f"Running Websocket Endpoint handler from '{self.__class__.__name__}'"
+            "Running Websocket Endpoint handler from '%s'", self.__class__.__name__
         )
         if self._use_extra_handler:
             request_logger.debug(
-                f"Switched Websocket Extra Handler from '{self.__class__.__name__}'"
+                "Switched Websocket Extra Handler from '%s'", self.__class__.__name__
             )
             ws_extra_handler_type = (
                 self._extra_handler_type or self.get_websocket_handler()
@@ -106,7 +106,7 @@ class WebsocketRouteOperation(WebsocketRouteOperationBase, StarletteWebSocketRou
 
     async def handle_request(self, context: IExecutionContext) -> t.Any:
         request_logger.debug(
-            f"Resolving request handler dependencies '{self.__class__.__name__}'"
+            "Resolving request handler dependencies '%s'", self.__class__.__name__
         )
         res = await self.endpoint_parameter_model.resolve_dependencies(ctx=context)
         if res.errors:
@@ -33,22 +33,29 @@ class Reflector:
 
         if len(metadata_collection) == 1:
             content = metadata_collection[0]
-            if isinstance(content, (list, tuple, set, dict)):
+            if isinstance(content, (list, tuple, set, frozenset, t.Mapping)):
                 return content
 
             return [content]
 
         @t.no_type_check
         def inline_function(previous_item: t.Any, next_item: t.Any) -> t.Any:
-            if isinstance(previous_item, (list, tuple, set)):
+            if isinstance(previous_item, (list, tuple, set, frozenset)):
+                # frozen metadata is returned as tuples and frozensets
+                if not isinstance(previous_item, list):
+                    previous_item = list(previous_item)
                 previous_item.extend(
                     list(next_item)
-                    if isinstance(next_item, (list, tuple, set))
+                    if isinstance(next_item, (list, tuple, set, frozenset))
                     else [next_item]
                 )
                 return previous_item
 
-            if isinstance(previous_item, dict) and isinstance(next_item, dict):
+            if isinstance(previous_item, t.Mapping) and isinstance(
+                next_item, t.Mapping
+            ):
+                if not isinstance(previous_item, dict):
+                    previous_item = dict(previous_item)
                 previous_item.update(next_item)
                 return previous_item
 
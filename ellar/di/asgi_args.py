@@ -1,14 +1,79 @@
 import typing as t
 
-from .providers import Provider
+from .providers import InstanceProvider, Provider
+
+_empty = object()
+# interface -> index in `RequestScopeContext` slot array.
+# Slots are reserved when request scoped services are registered and never released.
+_request_scope_slots: t.Dict[t.Any, int] = {}
+
+
+def reserve_request_scope_slot(interface: t.Any) -> int:
+    """Returns the slot index of `interface`, reserving a new one if needed."""
+    slot = _request_scope_slots.get(interface)
+    if slot is None:
+        slot = _request_scope_slots.setdefault(interface, len(_request_scope_slots))
+    return slot
 
 
 class RequestScopeContext:
-    __slots__ = ("_injector_scoped_context",)
+    """
+    Per-request store of request scoped instances.
+
+    Instances live in a list preallocated to the number of reserved slots and
+    are created lazily on first resolution. Providers registered for the request
+    through `register_request_scope_context` are kept aside in a dict.
+    """
+
+    __slots__ = ("_instances", "_providers")
 
     def __init__(self) -> None:
-        self._injector_scoped_context: t.Dict[t.Type, "Provider"] = {}
+        self._instances: t.List[t.Any] = [_empty] * len(_request_scope_slots)
+        self._providers: t.Optional[t.Dict[t.Any, Provider]] = None
+
+    def _get_slot(self, interface: t.Any) -> int:
+        slot = reserve_request_scope_slot(interface)
+        if slot >= len(self._instances):
+            self._instances.extend(
+                [_empty] * (len(_request_scope_slots) - len(self._instances))
+            )
+        return slot
+
+    def set_instance(self, interface: t.Any, value: t.Any) -> None:
+        if self._providers:
+            self._providers.pop(interface, None)
+        self._instances[self._get_slot(interface)] = value
+
+    def set_provider(self, interface: t.Any, provider: Provider) -> None:
+        if self._providers is None:
+            self._providers = {}
+        self._providers[interface] = provider
+        self._instances[self._get_slot(interface)] = _empty
+
+    def get_instance(
+        self, interface: t.Any, provider: Provider, injector: t.Any
+    ) -> t.Any:
+        """
+        Returns the instance of `interface` kept for this request,
+        creating it with `provider` on first call.
+        """
+        if self._providers and interface in self._providers:
+            return self._providers[interface].get(injector)
+
+        slot = self._get_slot(interface)
+        instance = self._instances[slot]
+        if instance is _empty:
+            instance = self._instances[slot] = provider.get(injector)
+        return instance
 
     @property
-    def context(self) -> t.Dict[t.Type, "Provider"]:
-        return self._injector_scoped_context
+    def context(self) -> t.Dict[t.Type, Provider]:
+        """Snapshot of the request scoped providers. Mutating it has no effect."""
+        context: t.Dict[t.Type, Provider] = {
+            interface: InstanceProvider(self._instances[slot])
+            for interface, slot in _request_scope_slots.items()
+            if slot < len(self._instances) and self._instances[slot] is not _empty
+        }
+        if self._providers:
+            context.update(self._providers)
+        return context
@@ -14,7 +14,9 @@ from injector import (
 from injector import NoScope as TransientScope
 from injector import Scope as InjectorScope
 
+from ..asgi_args import reserve_request_scope_slot
 from ..scopes import (
+    RequestScope,
     ScopeDecorator,
 )
 from ..service_config import get_scope
@@ -40,6 +42,9 @@ class Container(InjectorBinder):
     )
 
     injector: "EllarInjector"
+    # Incremented on every binding or export change.
+    # EllarInjector drops its resolved bindings when it changes.
+    bindings_version: t.ClassVar[int] = 0
 
     def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
         super().__init__(*args, **kwargs)
@@ -71,10 +76,28 @@ class Container(InjectorBinder):
         self, interface: t.Type, binding: Binding, tag: t.Optional[str] = None
     ) -> None:
         self._bindings[interface] = binding
+        self.invalidate_resolutions()
+
+        if isinstance(binding.scope, type) and issubclass(binding.scope, RequestScope):
+            reserve_request_scope_slot(interface)
 
         if tag:
             self._bindings_by_tag[tag] = interface
 
+    @classmethod
+    def invalidate_resolutions(cls) -> None:
+        cls.bindings_version += 1
+
+    def bind(self, interface: t.Any, *args: t.Any, **kwargs: t.Any) -> None:
+        super().bind(interface, *args, **kwargs)
+        # scope instances are bound on first use and change no other resolution
+        if not (isinstance(interface, type) and issubclass(interface, InjectorScope)):
+            self.invalidate_resolutions()
+
+    def multibind(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().multibind(*args, **kwargs)
+        self.invalidate_resolutions()
+
     @t.no_type_check
     def register(
         self,
@@ -169,13 +192,8 @@ class Container(InjectorBinder):
         except (KeyError, UnsatisfiedRequirement) as uex:
             try:
                 if self.injector.owner:
-                    module_name = (
-                        self.injector.owner.name if self.injector.owner else None
-                    )
-
-                    module_owner = self.injector.tree_manager.search_module_tree(
-                        filter_item=lambda data: data.name == module_name,
-                        find_predicate=lambda data: interface in data.exports,
+                    module_owner = self.injector.tree_manager.get_exporting_module(
+                        self.injector.owner.module, interface
                     )
 
                     if module_owner and module_owner.is_ready:
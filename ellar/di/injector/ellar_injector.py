@@ -1,3 +1,4 @@
+import logging
 import sys
 import typing as t
 from functools import cached_property
@@ -8,7 +9,8 @@ from ellar.di.logger import log
 from injector import Injector, Scope, ScopeDecorator
 from typing_extensions import Annotated
 
-from ..providers import InstanceProvider, Provider
+from ..providers import Provider
+from ..scopes import RequestScope
 from ..types import T
 from .container import Container
 
@@ -28,9 +30,9 @@ def register_request_scope_context(interface: t.Type[T], value: T) -> None:
         return
 
     if isinstance(value, Provider):
-        scoped_context.context.update({interface: value})
+        scoped_context.set_provider(interface, value)
     else:
-        scoped_context.context.update({interface: InstanceProvider(value)})
+        scoped_context.set_instance(interface, value)
 
 
 class _TagInfo(t.NamedTuple):
@@ -54,12 +56,20 @@ def _tag_info_interface(type_: t.Any) -> t.Optional[_TagInfo]:
     return None
 
 
+class _Resolution(t.NamedTuple):
+    interface: t.Any
+    provider: Provider
+    scope_instance: Scope
+
+
 class EllarInjector(Injector):
     __slots__ = (
         "_stack",
         "parent",
         "container",
         "owner",
+        "_resolutions",
+        "_resolutions_version",
     )
 
     def __init__(
@@ -77,6 +87,9 @@ class EllarInjector(Injector):
             parent=parent.binder if parent is not None else None,
         )
         self.owner = owner
+        # interface -> resolved binding provider and scope instance
+        self._resolutions: t.Dict[t.Any, _Resolution] = {}
+        self._resolutions_version = Container.bindings_version
         # Bind some useful types
         self.container.register(EllarInjector, self)
         self.container.register(Container, self.binder)
@@ -107,12 +120,7 @@ class EllarInjector(Injector):
             for item in self.tree_manager.get_by_ref_type(MODULE_REF_TYPES.TEMPLATE)
         }
 
-    @t.no_type_check
-    def get(
-        self,
-        interface: t.Union[Annotated[t.Type[T], type], Annotated[str, type], t.Any],
-        scope: t.Union[ScopeDecorator, t.Type[Scope]] = None,
-    ) -> T:
+    def _resolve(self, interface: t.Any) -> _Resolution:
         data = _tag_info_interface(interface)
         if data and data.supertype is Tag:
             interface = self.container.get_interface_by_tag(data.tag)
@@ -126,12 +134,40 @@ class EllarInjector(Injector):
         scope_binding, _ = binder.get_binding(scope)
         scope_instance = t.cast(Scope, scope_binding.provider.get(self))
 
-        log.debug(
-            f"{self._log_prefix}EllarInjector.get({interface}, scope={scope}) using {binding.provider}"
-        )
+        return _Resolution(interface, binding.provider, scope_instance)
 
-        result = scope_instance.get(interface, binding.provider).get(
-            self.container.injector
-        )
-        log.debug(f"{self._log_prefix} -> {result}")
+    @t.no_type_check
+    def get(
+        self,
+        interface: t.Union[Annotated[t.Type[T], type], Annotated[str, type], t.Any],
+        scope: t.Union[ScopeDecorator, t.Type[Scope]] = None,
+    ) -> T:
+        if self._resolutions_version != Container.bindings_version:
+            self._resolutions.clear()
+            self._resolutions_version = Container.bindings_version
+
+        resolution = self._resolutions.get(interface)
+        if resolution is None:
+            resolution = self._resolutions[interface] = self._resolve(interface)
+
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug(
+                f"{self._log_prefix}EllarInjector.get({resolution.interface}, "
+                f"scope={type(resolution.scope_instance)}) using {resolution.provider}"
+            )
+
+        scope_instance = resolution.scope_instance
+        if isinstance(scope_instance, RequestScope):
+            # request scoped instances are read straight from the request context slots
+            result = scope_instance.get_instance(
+                resolution.interface, resolution.provider, self.container.injector
+            )
+        else:
+            result = scope_instance.get(resolution.interface, resolution.provider).get(
+                self.container.injector
+            )
+
+        if debug:
+            log.debug(f"{self._log_prefix} -> {result}")
         return t.cast(T, result)
@@ -5,6 +5,8 @@ from ellar.di.service_config import (
     ProviderConfig,
 )
 
+from .container import Container
+
 if t.TYPE_CHECKING:  # pragma: no cover
     from ellar.core.modules import ModuleForwardRef, ModuleRefBase, ModuleSetup
 
@@ -42,7 +44,15 @@ class TreeData(t.NamedTuple):
 
 
 class ModuleTreeManager:
-    __slots__ = ("modules", "_core_module", "_app_module", "_forward_refs")
+    __slots__ = (
+        "modules",
+        "_core_module",
+        "_app_module",
+        "_forward_refs",
+        "_exported_by",
+        "_dependency_order",
+        "_index_version",
+    )
 
     # , root_module: t.Union["ModuleRefBase", "ModuleSetup"]
     def __init__(
@@ -53,6 +63,13 @@ class ModuleTreeManager:
             WeakKeyDictionary()
         )  # Dictionary to store modules by their ID or value
         self._forward_refs: t.MutableMapping["ModuleForwardRef", TreeData] = {}
+        # exported interface -> modules exporting it
+        self._exported_by: t.Dict[t.Any, t.List[t.Type]] = {}
+        # module -> {reachable module: DFS position}, computed on demand
+        self._dependency_order: t.Dict[t.Type, t.Dict[t.Type, int]] = {}
+        # Container.bindings_version the indexes were built for.
+        # Module, dependency and export changes all bump it.
+        self._index_version = -1
 
         self._core_module = app_core_module.module if app_core_module else None
         self._app_module: t.Optional[t.Type[t.Any]] = None
@@ -95,6 +112,7 @@ class ModuleTreeManager:
         data = TreeData(value=value, parent=parent_module, dependencies=[])
 
         self.modules[module_type] = data
+        Container.invalidate_resolutions()
 
         if parent_module:
             if parent_module not in self.modules:
@@ -140,6 +158,7 @@ class ModuleTreeManager:
             self._forward_refs[forward_ref] = _forward_data
 
         module_node.dependencies.append(_forward_data.value)
+        Container.invalidate_resolutions()
 
         return self
 
@@ -155,6 +174,7 @@ class ModuleTreeManager:
             )
 
         data.dependencies.append(dependency)
+        Container.invalidate_resolutions()
 
     def update_module(
         self,
@@ -172,8 +192,62 @@ class ModuleTreeManager:
             dependencies=data.dependencies,
         )
         self.modules[module_type] = new_module_data
+        Container.invalidate_resolutions()
         return self
 
+    def _ensure_indexes(self) -> None:
+        if self._index_version == Container.bindings_version:
+            return
+
+        self._exported_by = {}
+        self._dependency_order = {}
+        for module_type, data in self.modules.items():
+            for interface in data.exports:
+                self._exported_by.setdefault(interface, []).append(module_type)
+        self._index_version = Container.bindings_version
+
+    def _get_dependency_order(self, module_type: t.Type) -> t.Dict[t.Type, int]:
+        order = self._dependency_order.get(module_type)
+        if order is not None:
+            return order
+
+        order = {}
+        data = self.get_module(module_type)
+        stack = [data] if data else []
+        # same traversal order as `search_module_tree`
+        while stack:
+            node = stack.pop()
+            if node.value.module in order:
+                continue
+            order[node.value.module] = len(order)
+            children = [self.get_module(child_id) for child_id in node.dependencies]
+            stack.extend(
+                child
+                for child in reversed(children)
+                if child and child.value.module not in order
+            )
+
+        self._dependency_order[module_type] = order
+        return order
+
+    def get_exporting_module(
+        self, module_type: t.Type, interface: t.Any
+    ) -> t.Optional[TreeData]:
+        """
+        Returns the first module, in `module_type` and its dependencies, that exports `interface`.
+        Uses the exports index instead of walking the module tree.
+        """
+        self._ensure_indexes()
+        exported_by = self._exported_by.get(interface)
+        if not exported_by:
+            return None
+
+        order = self._get_dependency_order(module_type)
+        owners = [item for item in exported_by if item in order]
+        if not owners:
+            return None
+        return self.get_module(min(owners, key=order.__getitem__))
+
     def add_or_update(
         self,
         module_type: t.Type,
@@ -31,34 +31,32 @@ class RequestScope(InjectorScope):
             return None
 
     def get(self, key: t.Type[T], provider: Provider[T]) -> Provider[T]:
+        return InstanceProvider(self.get_instance(key, provider, self.injector))
+
+    def get_instance(self, key: t.Type[T], provider: Provider[T], injector: t.Any) -> T:
+        """
+        Resolves `key` without wrapping it in a provider.
+        The instance is kept alive in the request context throughout the request lifetime.
+        """
         scoped_context = self.get_context()
 
         if scoped_context is None:
             raise UnsatisfiedRequirement(None, key)
-        try:
-            return scoped_context.context[key]
-        except KeyError:
-            # if context is available and provider is not in context,
-            # we switch to instance provider which will keep the instance alive throughout request lifetime
-            provider = InstanceProvider(provider.get(self.injector))
-            scoped_context.context[key] = provider
-            return provider
+        return t.cast(T, scoped_context.get_instance(key, provider, self.injector))
 
 
 class RequestORTransientScope(RequestScope):
     def get(self, key: t.Type[T], provider: Provider[T]) -> Provider[T]:
+        if self.get_context() is None:
+            return provider
+        return super().get(key, provider)
+
+    def get_instance(self, key: t.Type[T], provider: Provider[T], injector: t.Any) -> T:
         scoped_context = self.get_context()
 
         if scoped_context is None:
-            return provider
-        try:
-            return scoped_context.context[key]
-        except KeyError:
-            # if context is available and provider is not in context,
-            # we switch to instance provider which will keep the instance alive throughout request lifetime
-            provider = InstanceProvider(provider.get(self.injector))
-            scoped_context.context[key] = provider
-            return provider
+            return provider.get(injector)
+        return t.cast(T, scoped_context.get_instance(key, provider, self.injector))
 
 
 transient_scope = ScopeDecorator(TransientScope)
@@ -89,7 +89,9 @@ class OpenAPIMountDocumentation(OpenAPIRoute):
 
         for route in self.mount.routes:
             if isinstance(route, RouteOperation) and route.include_in_schema:
-                openapi = reflector.get(OPENAPI_OPERATION_KEY, route.endpoint) or {}
+                openapi = dict(
+                    reflector.get(OPENAPI_OPERATION_KEY, route.endpoint) or {}
+                )
                 guards = reflector.get(GUARDS_KEY, route.endpoint)
 
                 if not openapi.get("tags", False):
@@ -1,7 +1,9 @@
+import inspect
 import logging
 import typing as t
 import weakref
 from contextlib import asynccontextmanager, contextmanager
+from types import MappingProxyType
 from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from .utils import ensure_target, fail_silently, get_original_target
@@ -60,8 +62,21 @@ def _get_actual_target(
     )
 
 
+def _freeze_value(value: t.Any) -> t.Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return MappingProxyType(dict(value))
+    return value
+
+
+_empty_metadata: t.Mapping[str, t.Any] = MappingProxyType({})
+
+
 class _Reflect:
-    __slots__ = ("_meta_data",)
+    __slots__ = ("_meta_data", "_frozen_meta_data")
 
     _un_hashable: t.Dict[int, _Hashable] = {}
     _data_type_update_callbacks: t.MutableMapping[t.Type, t.Callable] = (
@@ -72,6 +87,53 @@ class _Reflect:
         self._meta_data: t.MutableMapping[t.Union[t.Type, t.Callable], t.Dict] = (
             WeakKeyDictionary()
         )
+        # target -> metadata snapshot, set by `freeze`
+        self._frozen_meta_data: t.Optional[t.Dict[t.Any, t.Mapping[str, t.Any]]] = None
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen_meta_data is not None
+
+    def freeze(self) -> None:
+        """
+        Snapshots all metadata into plain dicts keyed directly by target.
+
+        While frozen, reads skip target resolution and return lists and tuples as tuples,
+        sets as frozensets and dicts as read-only mappings without copying them.
+        Writes raise a RuntimeError until `unfreeze` is called.
+        """
+        self._frozen_meta_data = {
+            target: {key: _freeze_value(value) for key, value in metadata.items()}
+            for target, metadata in self._meta_data.items()
+        }
+
+    def unfreeze(self) -> None:
+        self._frozen_meta_data = None
+
+    def _ensure_not_frozen(self) -> None:
+        if self._frozen_meta_data is not None:
+            raise RuntimeError(
+                "Metadata is frozen and can not be modified. Call `reflect.unfreeze()` first."
+            )
+
+    def _get_frozen_metadata(
+        self,
+        frozen_meta_data: t.Dict[t.Any, t.Mapping[str, t.Any]],
+        target: t.Union[t.Type, t.Callable],
+    ) -> t.Mapping[str, t.Any]:
+        try:
+            return frozen_meta_data[target]
+        except (KeyError, TypeError):
+            pass
+
+        target_metadata = (
+            frozen_meta_data.get(_get_actual_target(target)) or _empty_metadata
+        )
+        if isinstance(target, type) or inspect.isfunction(target):
+            # cache wrapped functions and targets without metadata.
+            # Bound methods and other short-lived objects are resolved on every call.
+            frozen_meta_data[target] = target_metadata
+        return target_metadata
 
     def add_type_update_callback(self, type_: t.Type, func: t.Callable) -> None:
         self._data_type_update_callbacks[type_] = func
@@ -93,6 +155,7 @@ class _Reflect:
     ) -> t.Any:
         if target is None:
             raise Exception("`target` is not a valid type")
+        self._ensure_not_frozen()
         # if (
         #     not isinstance(target, type)
         #     and not callable(target)
@@ -121,6 +184,11 @@ class _Reflect:
     def has_metadata(
         self, metadata_key: str, target: t.Union[t.Type, t.Callable]
     ) -> bool:
+        if self._frozen_meta_data is not None:
+            return metadata_key in self._get_frozen_metadata(
+                self._frozen_meta_data, target
+            )
+
         _target_actual = _get_actual_target(target)
         target_metadata = self._meta_data.get(_target_actual) or {}
 
@@ -129,6 +197,11 @@ class _Reflect:
     def get_metadata(
         self, metadata_key: str, target: t.Union[t.Type, t.Callable]
     ) -> t.Optional[t.Any]:
+        if self._frozen_meta_data is not None:
+            return self._get_frozen_metadata(self._frozen_meta_data, target).get(
+                metadata_key
+            )
+
         _target_actual = _get_actual_target(target)
         target_metadata = self._meta_data.get(_target_actual) or {}
 
@@ -141,6 +214,11 @@ class _Reflect:
     def get_metadata_search_safe(
         self, metadata_key: str, target: t.Union[t.Type, t.Callable]
     ) -> t.Any:
+        if self._frozen_meta_data is not None:
+            return self._get_frozen_metadata(self._frozen_meta_data, target)[
+                metadata_key
+            ]
+
         _target_actual = _get_actual_target(target)
         meta = self._meta_data[_target_actual]
 
@@ -161,17 +239,24 @@ class _Reflect:
     def get_metadata_keys(
         self, target: t.Union[t.Type, t.Callable]
     ) -> t.KeysView[t.Any]:
+        if self._frozen_meta_data is not None:
+            return self._get_frozen_metadata(self._frozen_meta_data, target).keys()
+
         _target_actual = _get_actual_target(target)
         target_metadata = self._meta_data.get(_target_actual) or {}
 
         return target_metadata.keys()
 
     def get_all_metadata(self, target: t.Union[t.Type, t.Callable]) -> t.Dict:
+        if self._frozen_meta_data is not None:
+            return dict(self._get_frozen_metadata(self._frozen_meta_data, target))
+
         _target_actual = _get_actual_target(target)
         target_metadata = self._meta_data.get(_target_actual) or {}
         return type(target_metadata)(target_metadata)
 
     def delete_all_metadata(self, target: t.Union[t.Type, t.Callable]) -> None:
+        self._ensure_not_frozen()
         _target = _get_actual_target(target)
         if _target in self._meta_data:
             self._meta_data.pop(_target)
@@ -179,6 +264,7 @@ class _Reflect:
     def delete_metadata(
         self, metadata_key: str, target: t.Union[t.Type, t.Callable]
     ) -> t.Any:
+        self._ensure_not_frozen()
         _target_actual = _get_actual_target(target)
         target_metadata = self._meta_data.get(_target_actual) or {}
 
@@ -214,16 +300,20 @@ class _Reflect:
     @asynccontextmanager
     async def async_context(self) -> t.AsyncGenerator[None, None]:
         cached_meta_data = self._clone_meta_data()
+        frozen_meta_data = self._frozen_meta_data
         yield
         reflect._meta_data.clear()
         reflect._meta_data = WeakKeyDictionary(dict=cached_meta_data)
+        reflect._frozen_meta_data = frozen_meta_data
 
     @contextmanager
     def context(self) -> t.Generator:
         cached_meta_data = self._clone_meta_data()
+        frozen_meta_data = self._frozen_meta_data
         yield
         reflect._meta_data.clear()
         reflect._meta_data = WeakKeyDictionary(dict=cached_meta_data)
+        reflect._frozen_meta_data = frozen_meta_data
 
 
 def _list_update(existing_value: t.Any, new_value: t.Any) -> t.Any:
@@ -1,7 +1,12 @@
+from .event_loop_thread import EventLoopThread, run_in_event_loop_thread
 from .sync_worker import (
+    SyncWorkerPool,
+    configure_sync_worker_pool,
     execute_async_context_manager,
     execute_async_gen,
     execute_coroutine,
+    get_sync_worker_pool,
+    shutdown_sync_worker_pool,
 )
 from .utils import run_as_sync
 
@@ -10,4 +15,10 @@ __all__ = [
     "execute_coroutine",
     "execute_async_gen",
     "execute_async_context_manager",
+    "EventLoopThread",
+    "run_in_event_loop_thread",
+    "SyncWorkerPool",
+    "configure_sync_worker_pool",
+    "get_sync_worker_pool",
+    "shutdown_sync_worker_pool",
 ]
@@ -0,0 +1,102 @@
+import asyncio
+import concurrent.futures
+import threading
+import typing as t
+
+_T = t.TypeVar("_T")
+
+
+class EventLoopThread:
+    """
+    An event loop running forever in a daemon thread.
+
+    It lets synchronous code wait for coroutines without creating an event loop per call,
+    and works whether or not the calling thread already runs an event loop.
+    The thread is started on first use.
+    """
+
+    def __init__(self, name: str = "ellar-event-loop") -> None:
+        self._name = name
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self._thread: t.Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            loop = self._start()
+        return loop
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run, args=(loop,), name=self._name, daemon=True
+            )
+            self._thread.start()
+            self._loop = loop
+            return loop
+
+    def _run(self, loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def is_loop_thread(self) -> bool:
+        """Whether the calling thread is the one running the loop."""
+        return self._thread is threading.current_thread()
+
+    def submit(
+        self, coro: t.Coroutine[t.Any, t.Any, _T]
+    ) -> "concurrent.futures.Future[_T]":
+        """
+        Schedules `coro` in the loop thread, in a copy of the calling context,
+        and returns a future of its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: t.Coroutine[t.Any, t.Any, _T]) -> _T:
+        """Runs `coro` in the loop thread and blocks until its result is available."""
+        if self.is_loop_thread():
+            coro.close()
+            raise RuntimeError(
+                "EventLoopThread.run() can not be called from its own event loop"
+            )
+        return self.submit(coro).result()
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is not None and thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+
+
+_event_loop_thread = EventLoopThread()
+
+
+def run_in_event_loop_thread(coro: t.Coroutine[t.Any, t.Any, _T]) -> _T:
+    """
+    Run a coroutine from synchronous code on a shared event loop running in a
+    background thread.
+
+    example:
+    ```python
+
+        async def coroutine_function():
+            return "Coroutine Function"
+
+        res = run_in_event_loop_thread(coroutine_function())
+        assert res == "Coroutine Function"
+    ```
+    """
+    return _event_loop_thread.run(coro)
@@ -6,15 +6,21 @@ https://github.com/lablup/backend.ai/blob/4a19001f9d1ae12be7244e14b304d783da9ea4
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
 import contextlib
 import enum
 import inspect
+import itertools
 import logging
 import queue
+import sys
 import threading
 import typing as t
 from contextvars import Context, copy_context
 
+from .event_loop_thread import EventLoopThread
+
 _Item = t.TypeVar("_Item")
 
 logger = logging.getLogger("ellar")
@@ -150,8 +156,7 @@ class _SyncWorkerThread(threading.Thread):
             self.work_queue.put(sentinel)  # initial loop closing
 
     def _update_context(self, context: Context) -> None:
-        for var, value in context.items():
-            var.set(value)
+        _update_context(context)
 
     @contextlib.contextmanager
     def execute_async_context_generator(
@@ -199,20 +204,185 @@ class _SyncWorkerThread(threading.Thread):
         self.stream_queue.put(sentinel)
 
 
-def execute_coroutine(coro: t.Coroutine) -> t.Any:
+class _AsyncContextManagerTask:
+    """
+    Enters and exits an async context manager in one task, so context variables
+    set when entering can be reset when exiting. The task waits for the exit
+    without blocking the event loop.
     """
-    Run a coroutine function as synchronous function with SyncWorker
 
-    example:
-    ```python
+    __slots__ = ("async_context_manager", "entered", "_exit")
 
-        async def coroutine_function():
-            return "Coroutine Function"
+    def __init__(self, async_context_manager: t.AsyncContextManager) -> None:
+        self.async_context_manager = async_context_manager
+        # value of `__aenter__` and the context it was entered in
+        self.entered: concurrent.futures.Future[t.Tuple[t.Any, Context]] = (
+            concurrent.futures.Future()
+        )
+        self._exit: t.Optional[asyncio.Future] = None
 
-        res = execute_coroutine(coroutine_function())
-        assert res == "Coroutine Function"
-    ```
+    async def run(self) -> t.Optional[bool]:
+        self._exit = asyncio.get_running_loop().create_future()
+        try:
+            value = await self.async_context_manager.__aenter__()
+        except BaseException as ex:
+            self.entered.set_exception(ex)
+            return None
+
+        self.entered.set_result((value, copy_context()))
+        exc_info = await self._exit
+        return await self.async_context_manager.__aexit__(*exc_info)
+
+    def exit(self, loop: asyncio.AbstractEventLoop, exc_info: t.Tuple) -> None:
+        assert self._exit is not None
+        loop.call_soon_threadsafe(self._exit.set_result, exc_info)
+
+
+class _AsyncGeneratorTask:
     """
+    Iterates an async generator in one task, so every step and the final `aclose()`
+    run in the same context and context variables set by the generator are kept
+    between items. The task waits for the next item to be requested without
+    blocking the event loop.
+    """
+
+    __slots__ = ("async_gen", "item", "_resume")
+
+    def __init__(self, async_gen: t.AsyncIterator) -> None:
+        self.async_gen = async_gen
+        # next item, or `StopAsyncIteration` once the generator is exhausted
+        self.item: concurrent.futures.Future[t.Any] = concurrent.futures.Future()
+        self._resume: t.Optional[asyncio.Future] = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    item = await self.async_gen.__anext__()
+                except BaseException as ex:
+                    self.item.set_exception(ex)
+                    return
+
+                self._resume = loop.create_future()
+                self.item.set_result(item)
+                if not await self._resume:
+                    return
+        finally:
+            aclose = getattr(self.async_gen, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def resume(self, loop: asyncio.AbstractEventLoop, next_item: bool) -> None:
+        """Requests the next item, or the end of the iteration."""
+        assert self._resume is not None
+        self.item = concurrent.futures.Future()
+        loop.call_soon_threadsafe(self._resume.set_result, next_item)
+
+
+class SyncWorkerPool:
+    """
+    Runs coroutines, async generators and async context managers from synchronous code
+    on `max_workers` threads, each running an event loop for the whole process.
+
+    Submissions are spread over the threads and run concurrently on their loops.
+    Threads are started on first use. Code already running on one of the threads can
+    not wait on its own loop, so it runs its submissions on a `_SyncWorkerThread`
+    started for the call, like before the pool existed.
+    """
+
+    def __init__(self, max_workers: int = 1, name: str = "ellar-sync-worker") -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, received {max_workers}")
+        self._threads = [
+            EventLoopThread(name=f"{name}-{index}") for index in range(max_workers)
+        ]
+        self._next_thread = itertools.cycle(self._threads)
+
+    @property
+    def max_workers(self) -> int:
+        return len(self._threads)
+
+    def _get_thread(self) -> t.Optional[EventLoopThread]:
+        if any(thread.is_loop_thread() for thread in self._threads):
+            return None
+        return next(self._next_thread)
+
+    def run(self, coro: t.Coroutine) -> t.Any:
+        thread = self._get_thread()
+        if thread is None:
+            return _run_in_worker_thread(coro)
+        return thread.submit(coro).result()
+
+    def iterate(self, async_gen: t.AsyncIterator[_Item]) -> t.Iterator[_Item]:
+        thread = self._get_thread()
+        if thread is None:
+            yield from _iterate_in_worker_thread(async_gen)
+            return
+
+        task = _AsyncGeneratorTask(async_gen)
+        done = thread.submit(task.run())
+        try:
+            while True:
+                try:
+                    item: _Item = task.item.result()
+                except StopAsyncIteration:
+                    break
+
+                try:
+                    yield item
+                except BaseException:
+                    task.resume(thread.loop, False)
+                    raise
+                task.resume(thread.loop, True)
+        finally:
+            done.result()
+
+    @contextlib.contextmanager
+    def enter(
+        self, async_context_manager: t.AsyncContextManager, context_update: bool = True
+    ) -> t.Iterator[t.Any]:
+        thread = self._get_thread()
+        if thread is None:
+            with _enter_in_worker_thread(async_context_manager, context_update) as item:
+                yield item
+            return
+
+        task = _AsyncContextManagerTask(async_context_manager)
+        done = thread.submit(task.run())
+        item, updated_ctx = task.entered.result()
+        # context variables set when entering are reset on exit
+        tokens = (
+            [var.set(value) for var, value in updated_ctx.items()]
+            if context_update
+            else []
+        )
+        del updated_ctx
+        try:
+            yield item
+        except BaseException:
+            task.exit(thread.loop, sys.exc_info())
+            if not done.result():
+                raise
+        else:
+            task.exit(thread.loop, (None, None, None))
+            done.result()
+        finally:
+            for token in reversed(tokens):
+                token.var.reset(token)
+
+    def shutdown(self) -> None:
+        """Stops the threads. They are started again if the pool is used afterwards."""
+        for thread in self._threads:
+            thread.stop()
+
+
+def _update_context(context: Context) -> None:
+    for var, value in context.items():
+        var.set(value)
+
+
+def _run_in_worker_thread(coro: t.Coroutine) -> t.Any:
     _worker_thread = _SyncWorkerThread()
     _worker_thread.start()
 
@@ -224,11 +394,83 @@ def execute_coroutine(coro: t.Coroutine) -> t.Any:
     return res
 
 
+def _iterate_in_worker_thread(
+    async_gen: t.AsyncIterator[_Item],
+) -> t.Iterator[_Item]:
+    _worker_thread = _SyncWorkerThread()
+    _worker_thread.start()
+
+    for item in _worker_thread.execute_generator(async_gen):
+        yield item
+
+    _worker_thread.work_queue.put(sentinel)
+    _worker_thread.join()
+
+
+@contextlib.contextmanager
+def _enter_in_worker_thread(
+    async_gen: t.AsyncContextManager, context_update: bool = True
+) -> t.Iterator[t.Any]:
+    _worker_thread = _SyncWorkerThread()
+    _worker_thread.start()
+
+    with _worker_thread.execute_async_context_generator(
+        async_gen, context_update
+    ) as item:
+        yield item
+
+    _worker_thread.work_queue.put(sentinel)
+    _worker_thread.join()
+
+
+_sync_worker_pool = SyncWorkerPool()
+
+
+def configure_sync_worker_pool(max_workers: int) -> SyncWorkerPool:
+    """
+    Replaces the pool used by `execute_coroutine`, `execute_async_gen` and
+    `execute_async_context_manager` with one of `max_workers` threads.
+    The threads of the previous pool are stopped.
+    """
+    global _sync_worker_pool
+
+    pool, _sync_worker_pool = _sync_worker_pool, SyncWorkerPool(max_workers)
+    pool.shutdown()
+    return _sync_worker_pool
+
+
+def get_sync_worker_pool() -> SyncWorkerPool:
+    return _sync_worker_pool
+
+
+@atexit.register
+def shutdown_sync_worker_pool() -> None:
+    """Stops the threads of the pool. It is also called when the interpreter exits."""
+    _sync_worker_pool.shutdown()
+
+
+def execute_coroutine(coro: t.Coroutine) -> t.Any:
+    """
+    Run a coroutine function as synchronous function with the SyncWorkerPool
+
+    example:
+    ```python
+
+        async def coroutine_function():
+            return "Coroutine Function"
+
+        res = execute_coroutine(coroutine_function())
+        assert res == "Coroutine Function"
+    ```
+    """
+    return _sync_worker_pool.run(coro)
+
+
 def execute_async_gen(
     async_gen: t.AsyncIterator[_Item],
 ) -> t.Iterator[_Item]:
     """
-    Runs AsyncGenerator function as a Generator using SyncWorker
+    Runs AsyncGenerator function as a Generator using the SyncWorkerPool
 
     example:
     ```python
@@ -240,14 +482,7 @@ def execute_async_gen(
         assert res == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
     ```
     """
-    _worker_thread = _SyncWorkerThread()
-    _worker_thread.start()
-
-    for item in _worker_thread.execute_generator(async_gen):
-        yield item
-
-    _worker_thread.work_queue.put(sentinel)
-    _worker_thread.join()
+    yield from _sync_worker_pool.iterate(async_gen)
 
 
 @contextlib.contextmanager  # type:ignore[arg-type]
@@ -255,7 +490,7 @@ def execute_async_context_manager(  # type:ignore[misc]
     async_gen: t.AsyncContextManager, context_update: bool = True
 ) -> t.ContextManager:
     """
-    Run AsyncContextManager as a ContextManager
+    Run AsyncContextManager as a ContextManager using the SyncWorkerPool
 
     example:
 
@@ -268,13 +503,5 @@ def execute_async_context_manager(  # type:ignore[misc]
             assert ctx == 10
     ```
     """
-    _worker_thread = _SyncWorkerThread()
-    _worker_thread.start()
-
-    with _worker_thread.execute_async_context_generator(
-        async_gen, context_update
-    ) as item:
+    with _sync_worker_pool.enter(async_gen, context_update) as item:
         yield item
-
-    _worker_thread.work_queue.put(sentinel)
-    _worker_thread.join()
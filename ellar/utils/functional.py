@@ -201,6 +201,28 @@ class SimpleLazyObject(LazyObject):
         return other + self
 
 
+class ContextLocalProxy(LazyObject):
+    """
+    A proxy to the object returned by `func`.
+
+    Unlike SimpleLazyObject, the result is never cached and `func` runs on every access.
+    A single proxy can then be shared by concurrent contexts when `func` reads a ContextVar.
+    """
+
+    def __init__(self, func: t.Callable) -> None:
+        self.__dict__["_getter"] = func
+
+    @property  # type:ignore[override]
+    def _wrapped(self) -> t.Any:
+        return self._getter()
+
+    def _setup(self) -> None:  # pragma: no cover
+        pass
+
+    def __repr__(self) -> str:
+        return "<%s: %r>" % (type(self).__name__, self._getter)
+
+
 class LazyStrImport(LazyObject):
     def __init__(self, import_str: str):
         self.__dict__["_import_str"] = import_str
@@ -1,5 +1,6 @@
 import logging
 
+import anyio
 import pytest
 from ellar.app import App
 from ellar.common import Body, post
@@ -91,3 +92,26 @@ async def test_current_config_works_(anyio_backend):
 
     with pytest.raises(RuntimeError):
         current_injector.get(Config)
+
+
+async def test_current_injector_is_isolated_between_concurrent_contexts(
+    anyio_backend,
+):
+    first = Test.create_test_module(config_module={"FRAMEWORK_NAME": "first"})
+    second = Test.create_test_module(config_module={"FRAMEWORK_NAME": "second"})
+    results = {}
+
+    async def run(name, tm):
+        app = tm.create_application()
+        async with injector_context(app.injector):
+            await anyio.sleep(0)
+            results[name] = (
+                current_injector.get(App) is app,
+                current_config.FRAMEWORK_NAME,
+            )
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(run, "first", first)
+        tg.start_soon(run, "second", second)
+
+    assert results == {"first": (True, "first"), "second": (True, "second")}
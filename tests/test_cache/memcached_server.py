@@ -0,0 +1,134 @@
+import asyncio
+import collections
+import time
+
+
+class MemcachedServer:
+    """
+    Memcached stand-in speaking the part of the text protocol used by `AioMemCacheBackend`:
+    get, set, add, delete, touch, incr, decr and flush_all.
+    """
+
+    MAX_RELATIVE_TTL = 60 * 60 * 24 * 30
+
+    def __init__(self, max_item_size: int = 1024 * 1024) -> None:
+        self.max_item_size = max_item_size
+        self.items = {}
+        self.commands = collections.Counter()
+        self.connections = 0
+        self._server = None
+        self._handlers = set()
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"{host}:{port}"
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.address
+
+    async def stop(self) -> None:
+        self._server.close()
+        for handler in self._handlers:
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def reset(self) -> None:
+        self.items.clear()
+        self.commands.clear()
+        self.connections = 0
+
+    def _expires_at(self, exptime: int) -> float:
+        if exptime == 0:
+            return float("inf")
+        if exptime < 0:
+            return 0
+        if exptime > self.MAX_RELATIVE_TTL:
+            return exptime
+        return time.time() + exptime
+
+    def _lookup(self, key: bytes):
+        item = self.items.get(key)
+        if item is not None and item[1] <= time.time():
+            del self.items[key]
+            return None
+        return item
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                line = await reader.readuntil(b"\r\n")
+                command, *args = line[:-2].split(b" ")
+                self.commands[command.decode()] += 1
+                if command in (b"set", b"add"):
+                    data = await reader.readexactly(int(args[3]) + 2)
+                    if command == b"add" and self._lookup(args[0]) is not None:
+                        writer.write(b"NOT_STORED\r\n")
+                    else:
+                        writer.write(self._set(args, data[:-2]))
+                else:
+                    handler = getattr(self, f"_{command.decode()}", None)
+                    writer.write(handler(args) if handler else b"ERROR\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    def _set(self, args, data: bytes) -> bytes:
+        key, _flags, exptime, _length = args
+        if len(data) > self.max_item_size:
+            return b"SERVER_ERROR object too large for cache\r\n"
+        self.items[key] = (data, self._expires_at(int(exptime)))
+        return b"STORED\r\n"
+
+    def _get(self, args) -> bytes:
+        response = b""
+        for key in args:
+            item = self._lookup(key)
+            if item is not None:
+                response += b"VALUE %s 0 %d\r\n%s\r\n" % (key, len(item[0]), item[0])
+        return response + b"END\r\n"
+
+    def _delete(self, args) -> bytes:
+        if self._lookup(args[0]) is None:
+            return b"NOT_FOUND\r\n"
+        del self.items[args[0]]
+        return b"DELETED\r\n"
+
+    def _touch(self, args) -> bytes:
+        key, exptime = args
+        item = self._lookup(key)
+        if item is None:
+            return b"NOT_FOUND\r\n"
+        self.items[key] = (item[0], self._expires_at(int(exptime)))
+        return b"TOUCHED\r\n"
+
+    def _incr_decr(self, args, sign: int) -> bytes:
+        key, delta = args
+        item = self._lookup(key)
+        if item is None:
+            return b"NOT_FOUND\r\n"
+        if not item[0].isdigit():
+            return b"CLIENT_ERROR cannot increment or decrement non-numeric value\r\n"
+        value = max(0, int(item[0]) + sign * int(delta))
+        self.items[key] = (b"%d" % value, item[1])
+        return b"%d\r\n" % value
+
+    def _incr(self, args) -> bytes:
+        return self._incr_decr(args, 1)
+
+    def _decr(self, args) -> bytes:
+        return self._incr_decr(args, -1)
+
+    def _flush_all(self, args) -> bytes:
+        self.items.clear()
+        return b"OK\r\n"
@@ -15,6 +15,12 @@ class MockClient(Client):
         self._cache[key] = (value, _time)
         return True
 
+    def add(self, *args, **kwargs):
+        key, value, _time = args
+        if self.get(key) is not None:
+            return False
+        return self.set(key, value, _time)
+
     def get(self, *args, **kwargs):
         (key,) = args
         _res = self._cache.get(key)
@@ -43,6 +49,22 @@ class MockClient(Client):
             value = False
         return value
 
+    def get_multi(self, keys, *args, **kwargs):
+        return {
+            key: value
+            for key, value in ((key, self.get(key)) for key in keys)
+            if value is not None
+        }
+
+    def set_multi(self, mapping, _time=0, *args, **kwargs):
+        return [
+            key for key, value in mapping.items() if not self.set(key, value, _time)
+        ]
+
+    def delete_multi(self, keys, *args, **kwargs):
+        results = [self.delete(key) for key in keys]
+        return all(results)
+
     def disconnect_all(self, *args, **kwargs):
         return None
 
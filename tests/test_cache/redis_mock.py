@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 
@@ -17,6 +18,8 @@ class MockAsyncMemCacheClient:
 
     async def set(self, *args, **kwargs):
         key, value = args
+        if kwargs.get("nx") and await self.get(key) is not None:
+            return None
         self._cache[key] = (
             value,
             self.get_backend_ttl(kwargs.get(self._time_lookup)),
@@ -49,12 +52,11 @@ class MockAsyncMemCacheClient:
         return value
 
     async def delete(self, *args, **kwargs):
-        (key,) = args
-        value = True
-        if self._cache.get(key):
-            del self._cache[key]
-        else:
-            value = False
+        value = False
+        for key in args:
+            if self._cache.get(key):
+                del self._cache[key]
+                value = True
         return value
 
     async def _incr_decr_action(self, key: str, delta: int) -> int:
@@ -95,3 +97,75 @@ class MockRedisClient(MockAsyncMemCacheClient):
 
     async def expire(self, key, ex):
         return await self.touch(key, ex=ex)
+
+    async def mget(self, keys):
+        self.mget_calls = getattr(self, "mget_calls", 0) + 1
+        return [await self.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return MockRedisPipeline(self)
+
+    async def publish(self, channel, message):
+        subscribers = MockRedisPubSub.subscribers.get(channel, [])
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+        return len(subscribers)
+
+    def pubsub(self):
+        return MockRedisPubSub()
+
+
+class MockRedisPubSub:
+    # channel -> [(loop, queue)], shared by every client like the static cache
+    subscribers = {}
+
+    def __init__(self):
+        self._subscriptions = []
+
+    async def subscribe(self, channel):
+        subscription = (asyncio.get_running_loop(), asyncio.Queue())
+        self.subscribers.setdefault(channel, []).append(subscription)
+        self._subscriptions.append((channel, subscription))
+
+    async def listen(self):
+        for channel, _ in self._subscriptions:
+            yield {"type": "subscribe", "channel": channel, "data": 1}
+        queue = self._subscriptions[0][1][1]
+        while True:
+            yield {"type": "message", "data": await queue.get()}
+
+    async def aclose(self):
+        for channel, subscription in self._subscriptions:
+            self.subscribers[channel].remove(subscription)
+        self._subscriptions.clear()
+
+
+class MockRedisPipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self._commands.clear()
+
+    def __getattr__(self, command):
+        def _queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+
+        return _queue
+
+    async def execute(self, raise_on_error=True):
+        self._client.pipeline_calls = getattr(self._client, "pipeline_calls", 0) + 1
+        results = []
+        for command, args, kwargs in self._commands:
+            try:
+                results.append(await getattr(self._client, command)(*args, **kwargs))
+            except Exception as ex:
+                if raise_on_error:
+                    raise
+                results.append(ex)
+        return results
@@ -0,0 +1,242 @@
+import asyncio
+from time import sleep
+
+import pytest
+from ellar.cache.backends.aio_memcache import (
+    AioMemCacheBackend,
+    MemcacheClient,
+    MemcacheError,
+    MemcacheIllegalInputError,
+    MemcacheUnexpectedResponseError,
+)
+from ellar.cache.backends.aio_memcache.client import HashRing, _call, parse_server
+from ellar.cache.model import CacheKeyWarning
+from ellar.threading import EventLoopThread
+
+from .memcached_server import MemcachedServer
+
+
+@pytest.fixture(scope="module")
+def memcached_servers():
+    thread = EventLoopThread(name="memcached-servers")
+    servers = [MemcachedServer(max_item_size=1024), MemcachedServer()]
+    for server in servers:
+        thread.run(server.start())
+    yield servers
+    for server in servers:
+        thread.run(server.stop())
+    thread.stop()
+
+
+@pytest.fixture
+def memcached_server(memcached_servers):
+    for server in memcached_servers:
+        server.reset()
+    return memcached_servers[0]
+
+
+@pytest.fixture
+def backend(memcached_server):
+    return AioMemCacheBackend(servers=[memcached_server.address])
+
+
+def test_parse_server():
+    assert parse_server("127.0.0.1:11212") == ("127.0.0.1", 11212)
+    assert parse_server("127.0.0.1") == ("127.0.0.1", 11211)
+    assert parse_server("/tmp/memcached.sock") == ("/tmp/memcached.sock", None)
+    assert parse_server("unix:/tmp/memcached.sock") == ("/tmp/memcached.sock", None)
+
+
+def test_hash_ring_only_moves_keys_of_removed_server():
+    servers = ["10.0.0.1:11211", "10.0.0.2:11211", "10.0.0.3:11211"]
+    ring = HashRing(servers)
+    keys = [f"key-{i}" for i in range(1000)]
+    placement = {key: ring.get_node(key) for key in keys}
+    assert set(placement.values()) == set(servers)
+
+    smaller_ring = HashRing(servers[:2])
+    for key, server in placement.items():
+        if server != servers[2]:
+            assert smaller_ring.get_node(key) == server
+
+
+class TestAioMemCacheBackend:
+    def test_set(self, backend):
+        assert backend.set("test", "1", 1)
+        assert backend.get("test") == "1"
+        sleep(1.1)
+        assert backend.get("test") is None
+
+    def test_has_key(self, backend):
+        assert not backend.has_key("test-has-key")
+        assert backend.set("test-has-key", "1", 1)
+        assert backend.has_key("test-has-key")
+
+    def test_add(self, backend):
+        assert backend.add("test-add", "1", 1)
+        assert not backend.add("test-add", "2", 1)
+        assert backend.get("test-add") == "1"
+
+    def test_delete(self, backend):
+        assert not backend.delete("test-delete")
+        assert backend.set("test-delete", "1", 1)
+        assert backend.delete("test-delete")
+
+    def test_touch(self, backend):
+        assert not backend.touch("test-touch")
+        assert backend.set("test-touch", "1", 0.1)
+        assert backend.touch("test-touch", 30)
+        sleep(1.1)
+        assert backend.get("test-touch") == "1"
+
+    def test_set_with_zero_ttl_expires_immediately(self, backend):
+        assert backend.set("test-zero-ttl", "1", 0)
+        assert backend.get("test-zero-ttl") is None
+
+    def test_incr_decr(self, backend):
+        assert backend.set("test-incr", 5)
+        assert backend.incr("test-incr", 10) == 15
+        assert backend.decr("test-incr", 3) == 12
+        assert backend.incr("test-incr", -2) == 10
+        # memcached does not decrement below 0
+        assert backend.decr("test-incr", 20) == 0
+        assert backend.get("test-incr") == 0
+
+        with pytest.raises(ValueError, match="not found"):
+            backend.incr("test-incr-missing")
+
+        assert backend.set("test-incr-str", "a")
+        with pytest.raises(MemcacheError, match="non-numeric"):
+            backend.incr("test-incr-str")
+
+    def test_many(self, backend, memcached_server):
+        assert backend.set_many({"a": 1, "b": "b", "c": {"c": 3}}, ttl=10) == []
+        memcached_server.commands.clear()
+
+        assert backend.get_many(["a", "b", "c", "d"]) == {
+            "a": 1,
+            "b": "b",
+            "c": {"c": 3},
+        }
+        assert memcached_server.commands == {"get": 1}
+
+        backend.delete_many(["a", "b"])
+        assert backend.get_many(["a", "b", "c"]) == {"c": {"c": 3}}
+
+    def test_set_fails_for_too_large_values(self, backend):
+        assert backend.set("test-large", "1")
+        assert not backend.set("test-large", "a" * 2048)
+        assert backend.get("test-large") is None
+        assert backend.set_many({"small": 1, "large": "a" * 2048}) == ["large"]
+        assert backend.get("small") == 1
+
+    def test_clear(self, backend):
+        assert backend.set("test-clear", "1")
+        backend.clear()
+        assert backend.get("test-clear") is None
+
+    def test_invalid_key_length(self, backend):
+        # memcached limits key length to 250.
+        key = ("a" * 250) + "清"
+        expected_warning = (
+            "Cache key will cause errors if used with memcached: "
+            "%r (longer than %s)" % (key, backend.MEMCACHE_MAX_KEY_LENGTH)
+        )
+        with pytest.warns(CacheKeyWarning) as wa, pytest.raises(
+            MemcacheIllegalInputError, match="longer than 250 bytes"
+        ):
+            backend.set(key, "value")
+        assert str(wa.list[0].message) == str(CacheKeyWarning(expected_warning))
+
+    @pytest.mark.parametrize(
+        "key", ["x\r\nflush_all", "with space", "tab\t", "nul\x00", "a" * 251]
+    )
+    def test_illegal_keys_are_rejected(self, backend, memcached_server, key):
+        assert backend.set("victim", "value")
+        memcached_server.commands.clear()
+
+        with pytest.warns(CacheKeyWarning):
+            with pytest.raises(MemcacheIllegalInputError):
+                backend.set(key, "value")
+        for call in (
+            lambda: backend.get(key),
+            lambda: backend.delete(key),
+            lambda: backend.touch(key),
+            lambda: backend.incr(key),
+            lambda: backend.get_many(["victim", key]),
+            lambda: backend.delete_many(["victim", key]),
+        ):
+            with pytest.raises(MemcacheIllegalInputError):
+                call()
+
+        assert not memcached_server.commands
+        assert backend.get("victim") == "value"
+
+    def test_backend_ttl(self, backend):
+        assert backend.get_backend_ttl() == 300
+        assert backend.get_backend_ttl(0.1) == 1
+        assert backend.get_backend_ttl(0) == -1
+        assert backend.get_backend_ttl(60 * 60 * 24 * 31) > 60 * 60 * 24 * 365
+
+
+class TestAioMemCacheBackendAsync:
+    @pytest.mark.asyncio
+    async def test_set_get_async(self, backend):
+        assert await backend.set_async("test", "1", 1)
+        assert await backend.get_async("test") == "1"
+        assert await backend.has_key_async("test")
+        assert await backend.delete_async("test")
+        assert await backend.get_async("test") is None
+
+    @pytest.mark.asyncio
+    async def test_connections_are_pooled(self, memcached_server):
+        backend = AioMemCacheBackend(
+            servers=[memcached_server.address], options={"pool_size": 2}
+        )
+        await asyncio.gather(
+            *(backend.set_async(f"pooled-{i}", i, ttl=10) for i in range(20))
+        )
+        for i in range(20):
+            assert await backend.get_async(f"pooled-{i}") == i
+        assert memcached_server.connections == 2
+        await backend.close_async()
+
+    @pytest.mark.asyncio
+    async def test_connection_is_closed_on_unexpected_response(self, memcached_server):
+        client = MemcacheClient([memcached_server.address], pool_size=1)
+        assert await client.set("key", b"value")
+        pool = client._get_pool("key")
+
+        # a second response is left unread on the connection
+        await client._execute(pool, _call, b"flush_all\r\nflush_all\r\n", (b"OK",))
+        with pytest.raises(MemcacheUnexpectedResponseError):
+            await client.get("key")
+        assert not pool._idle
+
+        assert await client.set("key", b"value")
+        assert await client.get("key") == b"value"
+        assert memcached_server.connections == 2
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_keys_are_distributed_over_servers(self, memcached_servers):
+        for server in memcached_servers:
+            server.reset()
+        backend = AioMemCacheBackend(
+            servers=[server.address for server in memcached_servers]
+        )
+        mapping = {f"key-{i}": i for i in range(50)}
+        assert await backend.set_many_async(mapping, ttl=10) == []
+        assert all(server.items for server in memcached_servers)
+        assert sum(len(server.items) for server in memcached_servers) == 50
+
+        for server in memcached_servers:
+            server.commands.clear()
+        assert await backend.get_many_async(list(mapping)) == mapping
+        # one get per server
+        assert [server.commands["get"] for server in memcached_servers] == [1, 1]
+
+        for key, value in list(mapping.items())[:5]:
+            assert await backend.get_async(key) == value
+        await backend.clear_async()
+        assert not any(server.items for server in memcached_servers)
@@ -1,8 +1,16 @@
+import asyncio
+import time
 from time import sleep
 
-from ellar.cache import Cache, CacheModule
-from ellar.common import ModuleRouter, PlainTextResponse
+import httpx
+import pytest
+from ellar.cache import Cache, CacheModule, ICacheService
+from ellar.cache.decorator import RouteCacheEntry, _CacheEllarInterceptor
+from ellar.cache.response import CachedHTTPResponse
+from ellar.common import Inject, ModuleRouter, PlainTextResponse
+from ellar.core import Reflector
 from ellar.testing import Test
+from starlette.requests import Request
 
 
 def test_cache_route_function_return_data():
@@ -116,3 +124,491 @@ def test_cache_route_function_return_response():
     assert res.text == "Response Information cached"
     assert res.status_code == 200
     assert called_count == 1
+
+
+def _index_key(context, key_prefix):
+    return "index"
+
+
+def _create_test_module(router):
+    return Test.create_test_module(
+        modules=[CacheModule.register_setup()],
+        routers=[router],
+    )
+
+
+@pytest.mark.parametrize("value", [0, [], "", None])
+def test_cache_route_function_caches_falsy_values(value):
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return value
+
+    client = _create_test_module(mr).get_test_client()
+    for _i in range(3):
+        res = client.get("/index")
+
+    assert res.json() == value
+    assert called_count == 1
+
+
+def test_cache_route_function_serves_stale_value_while_refreshing():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=0.1, stale_ttl=10)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"count": called_count}
+
+    client = _create_test_module(mr).get_test_client()
+    assert client.get("/index").json() == {"count": 1}
+
+    sleep(0.15)
+    # stale value, refreshed after the response is sent
+    assert client.get("/index").json() == {"count": 1}
+    assert called_count == 2
+    assert client.get("/index").json() == {"count": 2}
+    assert called_count == 2
+
+
+def test_cache_route_function_serves_stale_response_while_refreshing():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=0.1, stale_ttl=10)
+    async def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return PlainTextResponse(f"count={called_count}")
+
+    client = _create_test_module(mr).get_test_client()
+    assert client.get("/index").text == "count=1"
+
+    sleep(0.15)
+    assert client.get("/index").text == "count=1"
+    assert client.get("/index").text == "count=2"
+    assert called_count == 2
+
+
+def test_cache_route_function_keeps_stale_value_when_refresh_fails():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=0.1, stale_ttl=10)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        if called_count > 1:
+            raise RuntimeError("Refresh failed")
+        return {"count": called_count}
+
+    client = _create_test_module(mr).get_test_client()
+    assert client.get("/index").json() == {"count": 1}
+
+    sleep(0.15)
+    for _i in range(2):
+        res = client.get("/index")
+        assert res.status_code == 200
+        assert res.json() == {"count": 1}
+    assert called_count == 3
+
+
+def test_cache_route_function_stores_value_for_whole_seconds():
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=0.5, make_key_callback=_index_key)
+    def homepage():
+        return {"message": "cached"}
+
+    tm = _create_test_module(mr)
+    cache_service = tm.get(ICacheService)
+
+    set_ttls = []
+    set_async = cache_service.set_async
+
+    async def _set_async(key, value, ttl=None, **kwargs):
+        set_ttls.append(ttl)
+        return await set_async(key, value, ttl=ttl, **kwargs)
+
+    cache_service.set_async = _set_async
+    client = tm.get_test_client()
+
+    assert client.get("/index").json() == {"message": "cached"}
+    assert set_ttls == [1]
+    entry = cache_service.get("index")
+    assert entry.fresh_until - time.time() <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_cache_route_function_runs_once_for_concurrent_requests():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3)
+    async def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        await asyncio.sleep(0.1)
+        return {"count": called_count}
+
+    app = _create_test_module(mr).create_application()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        responses = await asyncio.gather(*(client.get("/index") for _ in range(5)))
+
+    assert [res.json() for res in responses] == [{"count": 1}] * 5
+    assert called_count == 1
+
+
+def test_cache_interceptors_do_not_share_computations():
+    cache_service = _create_test_module(ModuleRouter()).get(ICacheService)
+    first = _CacheEllarInterceptor(cache_service, Reflector())
+    second = _CacheEllarInterceptor(cache_service, Reflector())
+
+    assert first._flights is not second._flights
+    assert first._refreshing is not second._refreshing
+
+
+@pytest.mark.asyncio
+async def test_cache_route_function_waits_for_the_lock_owner():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, lock=True, lock_ttl=2, make_key_callback=_index_key)
+    async def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"owner": "this worker"}
+
+    tm = _create_test_module(mr)
+    cache_service = tm.get(ICacheService)
+    app = tm.create_application()
+
+    # the lock is held by another worker, which caches the value a bit later
+    assert await cache_service.add_async("index:lock", 1, ttl=2)
+
+    async def _other_worker():
+        await asyncio.sleep(0.1)
+        await cache_service.set_async(
+            "index", RouteCacheEntry(time.time() + 3, {"owner": "other worker"})
+        )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        res, _ = await asyncio.gather(client.get("/index"), _other_worker())
+
+    assert res.json() == {"owner": "other worker"}
+    assert called_count == 0
+
+
+def test_cache_route_function_computes_after_waiting_lock_ttl():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, lock=True, lock_ttl=0.2, make_key_callback=_index_key)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"count": called_count}
+
+    tm = _create_test_module(mr)
+    assert tm.get(ICacheService).add("index:lock", 1, ttl=10)
+    client = tm.get_test_client()
+
+    start = time.monotonic()
+    assert client.get("/index").json() == {"count": 1}
+    assert time.monotonic() - start >= 0.2
+    # the lock of the other worker is kept
+    assert tm.get(ICacheService).has_key("index:lock")
+
+
+def test_cache_route_function_keeps_lock_taken_by_another_worker():
+    lock_expires = False
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, lock=True, lock_ttl=1, make_key_callback=_index_key)
+    async def homepage(cache_service: Inject[ICacheService]):
+        assert await cache_service.has_key_async("index:lock")
+        if lock_expires:
+            # the lock expires while the handler runs and another worker takes it
+            await cache_service.set_async("index:lock", "other worker", ttl=10)
+        return {"message": "computed"}
+
+    tm = _create_test_module(mr)
+    cache_service = tm.get(ICacheService)
+    client = tm.get_test_client()
+
+    assert client.get("/index").json() == {"message": "computed"}
+    # the lock of this worker is released
+    assert not cache_service.has_key("index:lock")
+
+    cache_service.delete("index")
+    lock_expires = True
+    assert client.get("/index").json() == {"message": "computed"}
+    assert cache_service.get("index:lock") == "other worker"
+
+
+def test_cache_route_function_caches_response_with_etag():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, cache_response=True, make_key_callback=_index_key)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"count": called_count}
+
+    tm = _create_test_module(mr)
+    client = tm.get_test_client()
+    res = client.get("/index")
+    etag = res.headers["etag"]
+    assert res.json() == {"count": 1}
+
+    entry = tm.get(ICacheService).get("index")
+    assert isinstance(entry.value, CachedHTTPResponse)
+    assert entry.value.body == res.content
+    assert entry.value.etag == etag.encode()
+
+    res = client.get("/index")
+    assert res.status_code == 200
+    assert res.headers["etag"] == etag
+    assert res.headers["content-type"] == "application/json"
+    assert res.json() == {"count": 1}
+
+    res = client.get("/index", headers={"If-None-Match": f'W/"other", {etag}'})
+    assert res.status_code == 304
+    assert res.headers["etag"] == etag
+    assert res.content == b""
+
+    res = client.get("/index", headers={"If-None-Match": '"other"'})
+    assert res.status_code == 200
+    assert called_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_route_function_response_waits_for_the_lock_owner():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(
+        ttl=3, lock=True, lock_ttl=2, cache_response=True, make_key_callback=_index_key
+    )
+    async def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"owner": "this worker"}
+
+    tm = _create_test_module(mr)
+    cache_service = tm.get(ICacheService)
+    app = tm.create_application()
+
+    # the lock is held by another worker, which caches its response a bit later
+    assert await cache_service.add_async("index:lock", 1, ttl=2)
+    entry = RouteCacheEntry(
+        time.time() + 3,
+        CachedHTTPResponse(
+            200,
+            [(b"content-type", b"application/json"), (b"etag", b'"other"')],
+            b'{"owner":"other worker"}',
+            b'"other"',
+        ),
+    )
+
+    async def _other_worker():
+        await asyncio.sleep(0.1)
+        await cache_service.set_async("index", entry)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        res, _ = await asyncio.gather(client.get("/index"), _other_worker())
+        assert res.json() == {"owner": "other worker"}
+        assert res.headers["etag"] == '"other"'
+
+        res = await client.get("/index", headers={"If-None-Match": '"other"'})
+        assert res.status_code == 304
+
+    assert called_count == 0
+    # the response of the lock owner is kept as it was cached
+    assert await cache_service.get_async("index") == entry
+
+
+@pytest.mark.asyncio
+async def test_cache_route_function_response_is_recorded_by_the_request_running_handler():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, cache_response=True, make_key_callback=_index_key)
+    async def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        await asyncio.sleep(0.1)
+        return {"count": called_count}
+
+    tm = _create_test_module(mr)
+    cache_service = tm.get(ICacheService)
+    app = tm.create_application()
+
+    set_values = []
+    set_async = cache_service.set_async
+
+    async def _set_async(key, value, *args, **kwargs):
+        set_values.append(value.value)
+        return await set_async(key, value, *args, **kwargs)
+
+    cache_service.set_async = _set_async
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        responses = await asyncio.gather(*(client.get("/index") for _ in range(5)))
+
+    assert [res.json() for res in responses] == [{"count": 1}] * 5
+    assert called_count == 1
+    # the value computed, then the response sent for it
+    assert len(set_values) == 2
+    assert isinstance(set_values[1], CachedHTTPResponse)
+
+
+def test_cache_route_function_response_varies_on_request_headers():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, cache_response=True, vary=["Accept-Language"])
+    def homepage(request: Inject[Request]):
+        nonlocal called_count
+
+        called_count += 1
+        return {"language": request.headers.get("accept-language")}
+
+    client = _create_test_module(mr).get_test_client()
+    for _i in range(2):
+        res = client.get("/index", headers={"Accept-Language": "en"})
+        assert res.json() == {"language": "en"}
+        assert res.headers["vary"] == "accept-language"
+        assert client.get("/index", headers={"Accept-Language": "fr"}).json() == {
+            "language": "fr"
+        }
+    assert called_count == 2
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        PlainTextResponse("error", status_code=500),
+        PlainTextResponse("private", headers={"Cache-Control": "private"}),
+        PlainTextResponse("cookie", headers={"Set-Cookie": "session=1"}),
+    ],
+)
+def test_cache_route_function_does_not_cache_uncacheable_responses(response):
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=3, cache_response=True)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return response
+
+    client = _create_test_module(mr).get_test_client()
+    for _i in range(2):
+        res = client.get("/index")
+        assert res.text == response.body.decode()
+        assert "etag" not in res.headers
+    assert called_count == 2
+
+
+def test_cache_route_function_does_not_cache_responses_of_unsafe_methods():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.post("/index")
+    @Cache(ttl=3, cache_response=True)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"count": called_count}
+
+    client = _create_test_module(mr).get_test_client()
+    assert client.post("/index").json() == {"count": 1}
+    assert client.post("/index").json() == {"count": 2}
+
+
+def test_cache_route_function_records_refreshed_response():
+    called_count = 0
+
+    mr = ModuleRouter()
+
+    @mr.get("/index")
+    @Cache(ttl=0.1, stale_ttl=10, cache_response=True, make_key_callback=_index_key)
+    def homepage():
+        nonlocal called_count
+
+        called_count += 1
+        return {"count": called_count}
+
+    tm = _create_test_module(mr)
+    client = tm.get_test_client()
+    etag = client.get("/index").headers["etag"]
+
+    sleep(0.15)
+    # stale response, refreshed after it is sent
+    res = client.get("/index", headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert called_count == 2
+
+    # the refreshed value is rendered once, then its response is cached
+    res = client.get("/index")
+    assert res.json() == {"count": 2}
+    assert res.headers["etag"] != etag
+    assert isinstance(tm.get(ICacheService).get("index").value, CachedHTTPResponse)
+    assert client.get("/index").json() == {"count": 2}
+    assert called_count == 2
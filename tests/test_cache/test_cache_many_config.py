@@ -42,9 +42,9 @@ def test_cache_operation_with_backend_works():
     response = client.get("/index-1")
     assert response.text == "ExampleController Cache 1"
     result = cache_service.get("http://testserver/index-1:another", backend="another")
-    assert result.body == b"ExampleController Cache 1"
+    assert result.value.body == b"ExampleController Cache 1"
 
     response = client.get("/index-2")
     assert response.json() == {"message": "ExampleController Cache 2"}
     result = cache_service.get("http://testserver/index-2:view", backend="default")
-    assert result == {"message": "ExampleController Cache 2"}
+    assert result.value == {"message": "ExampleController Cache 2"}
@@ -58,6 +58,15 @@ class TestCacheService:
         with pytest.raises(InvalidCacheBackendKeyException):
             self.cache_service.get_backend("what_doesnot_exist_will_raise_exception")
 
+    def test_many(self):
+        assert self.cache_service.set_many({"many-a": 1, "many-b": 2}) == []
+        assert self.cache_service.get_many(["many-a", "many-b", "many-c"]) == {
+            "many-a": 1,
+            "many-b": 2,
+        }
+        self.cache_service.delete_many(["many-a", "many-b"])
+        assert self.cache_service.get_many(["many-a", "many-b"]) == {}
+
 
 class TestCacheServiceAsync:
     def setup_method(self):
@@ -101,3 +110,11 @@ class TestCacheServiceAsync:
         await self.cache_service.decr_async("test-decr-async", 2, version="1")
         await self.cache_service.decr_async("test-decr-async", 3, version="1")
         assert await self.cache_service.get_async("test-decr-async") == 0
+
+    async def test_many_async(self, anyio_backend):
+        assert await self.cache_service.set_many_async({"many-a": 1}, version="2") == []
+        assert await self.cache_service.get_many_async(["many-a"], version="2") == {
+            "many-a": 1
+        }
+        await self.cache_service.delete_many_async(["many-a"], version="2")
+        assert await self.cache_service.get_many_async(["many-a"], version="2") == {}
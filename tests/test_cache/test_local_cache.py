@@ -1,6 +1,11 @@
+import pickle
+import sys
+import threading
 from time import sleep
 
 import pytest
+from ellar.cache import CacheService
+from ellar.cache.backends import ReferenceSerializer
 from ellar.cache.backends.local_cache import LocalMemCacheBackend
 
 
@@ -18,6 +23,11 @@ class TestLocalMemCacheBackend:
         assert self.backend.set("test-has-key", "1", 0.1)
         assert self.backend.has_key("test-has-key")
 
+    def test_add(self):
+        assert self.backend.add("test-add", "1", 0.1)
+        assert not self.backend.add("test-add", "2", 0.1)
+        assert self.backend.get("test-add") == "1"
+
     def test_delete(self):
         assert not self.backend.delete("test-delete")
         assert self.backend.set("test-delete", "1", 0.1)
@@ -111,3 +121,216 @@ class TestLocalMemCacheBackendAsync:
         with pytest.raises(ValueError):
             await self.backend.set_async("test-decr-async-backend", 2, ttl=0)
             await self.backend.decr_async("test-decr-async-backend")
+
+
+class TestLocalMemCacheBackendLimits:
+    def test_max_entries_evicts_least_recently_used(self):
+        backend = LocalMemCacheBackend(max_entries=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        assert backend.get("a") == 1
+        backend.set("c", 3)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+        assert backend.get_stats() == {
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+            "entries": 2,
+            "bytes": backend._size,
+        }
+
+    def test_max_bytes_evicts_by_size(self):
+        size = len(pickle.dumps("x" * 100, LocalMemCacheBackend.pickle_protocol))
+        backend = LocalMemCacheBackend(max_bytes=size * 2)
+        backend.set("a", "x" * 100)
+        backend.set("b", "x" * 100)
+        backend.set("c", "x" * 100)
+
+        assert not backend.has_key("a")
+        assert backend._size == size * 2
+        assert backend.get_stats()["evictions"] == 1
+
+        assert not backend.set("big", "x" * size * 2)
+        assert backend.get("big") is None
+        assert backend.has_key("c")
+
+    def test_expired_entries_are_swept_on_write(self):
+        backend = LocalMemCacheBackend(sweep_interval=0)
+        backend.set("a", 1, ttl=0.01)
+        backend.set("b", 1, ttl=0.01)
+        backend.touch("b", 30)
+        sleep(0.02)
+        backend.set("c", 1)
+
+        assert "a" not in {key.split(":")[-1] for key in backend._cache}
+        assert backend.get("b") == 1
+        assert backend.get_stats()["entries"] == 2
+
+    def test_incr_evicts_when_value_grows(self):
+        backend = LocalMemCacheBackend(max_bytes=sys.getsizeof(1) * 2)
+        backend.set("a", 1)
+        backend.set("b", 1)
+        backend.incr("b", 2**62)
+
+        assert not backend.has_key("a")
+        assert backend.get("b") == 2**62 + 1
+        assert backend._size <= sys.getsizeof(1) * 2
+        assert backend.get_stats()["evictions"] == 1
+
+    def test_add_and_incr_of_expired_keys(self):
+        backend = LocalMemCacheBackend()
+        backend.set("a", 1, ttl=0.01)
+        backend.set("b", 1, ttl=0.01)
+        sleep(0.02)
+
+        with pytest.raises(ValueError):
+            backend.incr("a")
+        assert backend.add("b", 2)
+        assert backend.get("b") == 2
+        assert backend.get_stats()["entries"] == 1
+
+    def test_touch_of_evicted_key_leaves_no_expiry(self):
+        backend = LocalMemCacheBackend(max_entries=1)
+        backend.set("a", 1, ttl=30)
+        key = next(iter(backend._cache))
+        # an expiry left for a key evicted while it was touched
+        backend.set("b", 1, ttl=30)
+        backend._expire_track[key] = backend._expire_track[next(iter(backend._cache))]
+
+        assert not backend.touch("a", 60)
+        assert key not in backend._expire_track
+        assert len(backend._expire_track) == 1
+
+        backend._expire_track[key] = 0
+        assert not backend.delete("a")
+        assert key not in backend._expire_track
+
+    def test_cache_service_exposes_backend_stats(self):
+        service = CacheService({"default": LocalMemCacheBackend(max_entries=1)})
+        service.set("a", 1)
+        service.set("b", 2)
+        assert service.get("a") is None
+        assert service.get_stats() == service.get_backend().get_stats()
+        assert service.get_stats()["evictions"] == 1
+
+
+class TestLocalMemCacheBackendLocking:
+    async def test_reads_do_not_wait_for_write_locks(self, anyio_backend):
+        backend = LocalMemCacheBackend()
+        await backend.set_async("a", 1)
+
+        with backend._lock:
+            for lock in backend._key_locks:
+                lock.acquire()
+            try:
+                assert await backend.get_async("a") == 1
+                assert await backend.has_key_async("a")
+                assert await backend.get_async("missing") is None
+            finally:
+                for lock in backend._key_locks:
+                    lock.release()
+
+    def test_concurrent_incr_from_threads(self):
+        backend = LocalMemCacheBackend(lock_stripes=4)
+        backend.set("counter", 0)
+
+        def _incr():
+            for _ in range(200):
+                backend.incr("counter")
+
+        threads = [threading.Thread(target=_incr) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert backend.get("counter") == 800
+        assert len(backend._key_locks) == 4
+
+
+class TestLocalMemCacheBackendValueStorage:
+    def test_integers_are_stored_without_pickle(self, monkeypatch):
+        backend = LocalMemCacheBackend()
+        backend.set("counter", 1)
+
+        def _fail(*args, **kwargs):  # pragma: no cover
+            raise AssertionError("pickle should not be used")
+
+        monkeypatch.setattr(pickle, "dumps", _fail)
+        monkeypatch.setattr(pickle, "loads", _fail)
+        assert backend.incr("counter", 2) == 3
+        assert backend.decr("counter", 5) == 0
+        assert backend.get("counter") == 0
+        assert backend._cache[backend.make_key("counter")] == 0
+
+    def test_reference_storage_returns_the_same_object(self):
+        backend = LocalMemCacheBackend(value_storage="reference")
+        value = {"items": [1, 2]}
+        backend.set("a", value)
+        assert backend.get("a") is value
+
+        backend.set("none", None)
+        assert backend.has_key("none")
+        assert backend.get("none") is None
+
+    @pytest.mark.parametrize(
+        "value_storage, deep", [("copy", False), ("deepcopy", True)]
+    )
+    def test_copy_storage_returns_copies(self, value_storage, deep):
+        backend = LocalMemCacheBackend(value_storage=value_storage)
+        value = {"items": [1, 2]}
+        backend.set("a", value)
+        value["other"] = 1
+
+        result = backend.get("a")
+        assert result == {"items": [1, 2]}
+        assert result is not backend.get("a")
+        assert (result["items"] is not value["items"]) is deep
+
+    def test_custom_serializer_and_invalid_value_storage(self):
+        serializer = ReferenceSerializer()
+        backend = LocalMemCacheBackend(value_storage="pickle", serializer=serializer)
+        assert backend._serializer is serializer
+
+        with pytest.raises(ValueError, match="Invalid value_storage='json'"):
+            LocalMemCacheBackend(value_storage="json")
+
+
+async def test_local_cache_sync_api_under_running_loop(anyio_backend):
+    backend = LocalMemCacheBackend()
+    assert backend.set("a", 1)
+    assert backend.incr("a") == 2
+    assert await backend.get_async("a") == 2
+
+
+class TestLocalMemCacheBackendMany:
+    def test_many(self):
+        backend = LocalMemCacheBackend(key_prefix="many")
+        assert backend.set_many({"a": 1, "b": {"c": 2}}, version="2") == []
+        assert backend.get_many(["a", "b", "c"], version="2") == {"a": 1, "b": {"c": 2}}
+        assert backend.get_many(["a", "b"]) == {}
+        assert backend.has_key("a", version="2")
+
+        backend.delete_many(["a", "c"], version="2")
+        assert backend.get_many(["a", "b"], version="2") == {"b": {"c": 2}}
+        assert backend.get_stats()["misses"] == 4
+
+    async def test_many_async(self, anyio_backend):
+        size = len(pickle.dumps("x" * 100, LocalMemCacheBackend.pickle_protocol))
+        backend = LocalMemCacheBackend(max_bytes=size)
+        assert await backend.set_many_async({"a": "x" * 100, "b": "x" * 200}) == ["b"]
+        assert await backend.get_many_async(["a", "b"]) == {"a": "x" * 100}
+        await backend.delete_many_async(["a"])
+        assert await backend.get_many_async(["a"]) == {}
+
+
+def test_clear():
+    backend = LocalMemCacheBackend(max_bytes=1024)
+    backend.set_many({"a": 1, "b": "b"}, ttl=10)
+    backend.clear()
+    assert backend.get_many(["a", "b"]) == {}
+    assert backend.get_stats()["entries"] == 0
+    assert backend.get_stats()["bytes"] == 0
@@ -53,6 +53,11 @@ class TestPyLibMCCacheBackend:
         assert self.backend.set("test-has-key", "1", 1)
         assert self.backend.has_key("test-has-key")
 
+    def test_add(self):
+        assert self.backend.add("test-add", "1", 1)
+        assert not self.backend.add("test-add", "2", 1)
+        assert self.backend.get("test-add") == "1"
+
     def test_delete(self):
         assert not self.backend.delete("test-delete")
         assert self.backend.set("test-delete", "1", 1)
@@ -181,6 +186,32 @@ class TestPyLibMCCacheBackendAsync:
         assert await self.backend.get_async("test-decr-async-pylib") == 0
 
 
+class TestPyLibMCCacheBackendMany:
+    def setup_method(self):
+        self.backend = PyLibMCCacheBackendMock(servers=["127.0.0.1:11211"])
+
+    def test_many(self):
+        assert self.backend.set_many({"a": 1, "b": "2"}, ttl=1, version="2") == []
+        assert self.backend.get_many(["a", "b", "c"], version="2") == {"a": 1, "b": "2"}
+        assert self.backend.get_many(["a", "b"]) == {}
+
+        self.backend.delete_many(["a"], version="2")
+        assert self.backend.get_many(["a", "b"], version="2") == {"b": "2"}
+
+    async def test_many_async(self, anyio_backend):
+        assert await self.backend.set_many_async({"a": 1, "b": "2"}, ttl=1) == []
+        assert await self.backend.get_many_async(["a", "b"]) == {"a": 1, "b": "2"}
+        await self.backend.delete_many_async(["a", "b"])
+        assert await self.backend.get_many_async(["a", "b"]) == {}
+
+    def test_set_many_returns_failed_keys(self):
+        class DemoPyLibMemCacheBackend(PyLibMCCacheBackend):
+            MEMCACHE_CLIENT = MockSetFailureClient
+
+        backend = DemoPyLibMemCacheBackend(servers=["127.0.0.1:11211"])
+        assert backend.set_many({"a": 1, "b": 2}) == ["a", "b"]
+
+
 class TestPyMemCacheBackend:
     def test_init_pymemcache_backend(self):
         backend = PyMemcacheCacheBackend(servers=["127.0.0.1:11211"])
@@ -251,3 +282,12 @@ class TestPyMemCacheBackend:
         with pytest.warns(CacheKeyWarning) as wa:
             backend.set(key, "value")
         assert str(wa.list[0].message) == str(CacheKeyWarning(expected_warning))
+
+    @patch("pymemcache.HashClient.get_multi")
+    def test_get_many_uses_one_multi_get(self, mock_get_multi):
+        backend = PyMemcacheCacheBackend(servers=["127.0.0.1:11211"])
+        mock_get_multi.return_value = {backend.make_key("a"): 1}
+        assert backend.get_many(["a", "b"]) == {"a": 1}
+        mock_get_multi.assert_called_once_with(
+            [backend.make_key("a"), backend.make_key("b")]
+        )
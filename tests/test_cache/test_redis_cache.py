@@ -1,7 +1,9 @@
+import asyncio
 from time import sleep
 
 import pytest
 from ellar.cache.backends.redis import RedisCacheBackend
+from ellar.cache.backends.redis.pipeline import AutoPipeline
 from ellar.cache.model import CacheKeyWarning
 
 from .redis_mock import MockRedisClient
@@ -42,6 +44,11 @@ class TestRedisCacheBackend:
         assert self.backend.set("test-has-key", "1", 1)
         assert self.backend.has_key("test-has-key")
 
+    def test_add(self):
+        assert self.backend.add("test-add", "1", 1)
+        assert not self.backend.add("test-add", "2", 1)
+        assert self.backend.get("test-add") == "1"
+
     def test_delete(self):
         assert not self.backend.delete("test-delete")
         assert self.backend.set("test-delete", "1", 1)
@@ -178,3 +185,136 @@ class TestRedisCacheBackendAsync:
         backend = DemoMemCachedBackend(servers=["redis://localhost:6379/0"])
         await backend.set_async("zero", "value", ttl=0)
         assert set_called and delete_called
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_sync_api_under_running_loop() -> None:
+    backend = RedisCacheBackendMock(servers=["redis://localhost:6379/0"])
+    assert backend.set("test-sync-under-loop", "1", 1)
+    assert backend.get("test-sync-under-loop") == "1"
+    assert await backend.get_async("test-sync-under-loop") == "1"
+    # sync calls run on the background loop, with a client of their own
+    assert len(backend._pipelines) == 2
+
+
+class TestRedisCacheBackendMany:
+    def setup_method(self):
+        self.backend = RedisCacheBackendMock(servers=["redis://localhost:6379/0"])
+
+    def test_many(self):
+        assert self.backend.set_many({"many-a": 1, "many-b": "2"}, ttl=1) == []
+        assert self.backend.get_many(["many-a", "many-b", "many-c"]) == {
+            "many-a": 1,
+            "many-b": "2",
+        }
+        self.backend.delete_many(["many-a", "many-b"])
+        assert self.backend.get_many(["many-a", "many-b"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_many_async_round_trips(self, monkeypatch):
+        clients = []
+        get_client = self.backend._get_client
+
+        def _get_client(**kwargs):
+            clients.append(get_client(**kwargs))
+            return clients[-1]
+
+        monkeypatch.setattr(self.backend, "_get_client", _get_client)
+        mapping = {f"many-async-{i}": i for i in range(10)}
+        assert await self.backend.set_many_async(mapping, ttl=1, version="3") == []
+        assert await self.backend.get_many_async(list(mapping), version="3") == mapping
+
+        set_client, get_client_ = clients
+        assert set_client.pipeline_calls == 1
+        assert get_client_.mget_calls == 1
+
+        assert await self.backend.set_many_async(mapping, ttl=0, version="3") == []
+        assert await self.backend.get_many_async(list(mapping), version="3") == {}
+
+
+class TestRedisCacheBackendClient:
+    servers = [
+        "redis://localhost:6379/0",
+        "redis://localhost:6379/1",
+        "redis://localhost:6379/2",
+    ]
+
+    @pytest.mark.asyncio
+    async def test_commands_of_the_same_loop_iteration_are_pipelined(self):
+        backend = RedisCacheBackendMock(servers=self.servers[:1])
+        await backend.set_many_async({"pipe-a": 1, "pipe-b": "b"}, ttl=10)
+        client = backend._get_client()
+        client.pipeline_calls = 0
+
+        results = await asyncio.gather(
+            backend.get_async("pipe-a"),
+            backend.get_async("pipe-b"),
+            backend.has_key_async("pipe-c"),
+            backend.incr_async("pipe-a"),
+        )
+        assert results == [1, "b", False, 2]
+        assert client.pipeline_calls == 1
+
+        # a single command is sent without a pipeline
+        assert await backend.get_async("pipe-a") == 2
+        assert client.pipeline_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_pipelined_command_errors_are_raised_to_their_caller(self):
+        backend = RedisCacheBackendMock(servers=self.servers[:1])
+        await backend.set_async("pipe-error", "not-a-number", ttl=10)
+
+        results = await asyncio.gather(
+            backend.get_async("pipe-error"),
+            backend.incr_async("pipe-error"),
+            return_exceptions=True,
+        )
+        assert results[0] == "not-a-number"
+        assert isinstance(results[1], TypeError)
+
+    @pytest.mark.asyncio
+    async def test_pipeline_keeps_running_flushes(self):
+        backend = RedisCacheBackendMock(servers=self.servers[:1])
+        pipeline = AutoPipeline(backend._get_client())
+
+        futures = [
+            pipeline.execute("exists", "pipe-a"),
+            pipeline.execute("get", "pipe-a"),
+        ]
+        await asyncio.sleep(0)
+        assert len(pipeline._flushes) == 1
+
+        await asyncio.gather(*futures)
+        await asyncio.sleep(0)
+        assert pipeline._flushes == set()
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_and_health_checked(self):
+        backend = RedisCacheBackendMock(servers=self.servers[:1], auto_pipeline=False)
+        assert backend._get_client() is backend._get_client()
+        assert backend._options == {"health_check_interval": 30}
+        assert await backend.set_async("no-pipe", 1, ttl=10)
+        assert await backend.get_async("no-pipe") == 1
+
+    def test_read_strategies(self):
+        backend = RedisCacheBackendMock(
+            servers=self.servers, read_strategy="round_robin"
+        )
+        assert [backend._get_connection_pool_index(write=False) for _ in range(4)] == [
+            1,
+            2,
+            1,
+            2,
+        ]
+        assert backend._get_connection_pool_index(write=True) == 0
+
+        backend = RedisCacheBackendMock(
+            servers=self.servers, read_strategy="least_latency"
+        )
+        backend._record_latency(1, 0.5)
+        assert backend._get_connection_pool_index(write=False) == 2
+        backend._record_latency(2, 1.0)
+        assert backend._get_connection_pool_index(write=False) == 1
+
+        with pytest.raises(ValueError, match="Invalid read_strategy='fastest'"):
+            RedisCacheBackendMock(servers=self.servers, read_strategy="fastest")
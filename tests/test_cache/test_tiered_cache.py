@@ -0,0 +1,126 @@
+import time
+
+import pytest
+from ellar.cache.backends.local_cache import LocalMemCacheBackend
+from ellar.cache.backends.tiered_cache import TieredCacheBackend
+
+from .redis_mock import MockRedisPubSub
+from .test_redis_cache import RedisCacheBackendMock
+
+
+def _l2():
+    return RedisCacheBackendMock(servers=["redis://localhost:6379/0"])
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+class TestTieredCacheBackend:
+    def setup_method(self):
+        self.l1 = LocalMemCacheBackend()
+        self.l2 = _l2()
+        self.backend = TieredCacheBackend(l1=self.l1, l2=self.l2, l1_ttl=0.2)
+
+    def test_reads_fall_through_to_l2_and_populate_l1(self):
+        assert self.l2.set("test-tiered", "1", ttl=10)
+        assert self.backend.get("test-tiered") == "1"
+        assert self.l1.get("test-tiered") == "1"
+
+        # served by L1 until its short ttl expires
+        assert self.l2.set("test-tiered", "2", ttl=10)
+        assert self.backend.get("test-tiered") == "1"
+        time.sleep(0.25)
+        assert self.backend.get("test-tiered") == "2"
+
+        assert self.backend.get("test-tiered-missing") is None
+        assert self.backend.get_stats()["l1_hits"] == 1
+        assert self.backend.get_stats()["l2_hits"] == 2
+        assert self.backend.get_stats()["misses"] == 1
+
+    def test_writes_and_deletes_go_to_both_tiers(self):
+        assert self.backend.set("test-tiered-set", "1", ttl=10)
+        assert self.l1.get("test-tiered-set") == "1"
+        assert self.l2.get("test-tiered-set") == "1"
+
+        assert self.backend.add("test-tiered-add", "1", ttl=10)
+        assert not self.backend.add("test-tiered-add", "2", ttl=10)
+        assert self.l1.get("test-tiered-add") == "1"
+
+        assert self.backend.delete("test-tiered-set")
+        assert self.l1.get("test-tiered-set") is None
+        assert self.l2.get("test-tiered-set") is None
+
+    def test_l1_ttl_is_not_longer_than_ttl(self):
+        assert self.backend.set("test-tiered-ttl", "1", ttl=0.1)
+        time.sleep(0.15)
+        assert self.l1.get("test-tiered-ttl") is None
+
+    def test_counters_are_read_from_l2(self):
+        assert self.backend.set("test-tiered-incr", 1, ttl=10)
+        assert self.backend.incr("test-tiered-incr", 2) == 3
+        assert self.l1.get("test-tiered-incr") is None
+        assert self.backend.get("test-tiered-incr") == 3
+
+    def test_many(self):
+        assert self.backend.set_many({"a": 1, "b": 2}, ttl=10) == []
+        self.l1.delete("b")
+        assert self.backend.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+        assert self.l1.get("b") == 2
+
+        self.backend.delete_many(["a", "b"])
+        assert self.backend.get_many(["a", "b"]) == {}
+        assert self.l2.get_many(["a", "b"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_async_api(self):
+        assert self.l2.set("test-tiered-async", "1", ttl=10)
+        assert await self.backend.get_async("test-tiered-async") == "1"
+        assert self.l1.get("test-tiered-async") == "1"
+
+        assert await self.backend.set_async("test-tiered-async", "2", ttl=10)
+        assert self.l1.get("test-tiered-async") == "2"
+        assert await self.backend.has_key_async("test-tiered-async")
+
+        assert await self.backend.delete_async("test-tiered-async")
+        assert not await self.backend.has_key_async("test-tiered-async")
+
+    def test_invalidation_channel_requires_pub_sub(self):
+        with pytest.raises(ValueError, match="ICacheBackendPubSub"):
+            TieredCacheBackend(
+                l1=LocalMemCacheBackend(),
+                l2=LocalMemCacheBackend(),
+                invalidation_channel="invalidation",
+            )
+
+
+def test_writes_invalidate_l1_of_other_workers():
+    workers = [
+        TieredCacheBackend(
+            l1=LocalMemCacheBackend(),
+            l2=_l2(),
+            l1_ttl=60,
+            invalidation_channel="test-invalidation",
+        )
+        for _ in range(2)
+    ]
+    try:
+        assert workers[0].set("test-tiered-shared", "1", ttl=60)
+        assert workers[1].get("test-tiered-shared") == "1"
+        _wait_for(
+            lambda: len(MockRedisPubSub.subscribers.get("test-invalidation", [])) == 2
+        )
+
+        assert workers[0].set("test-tiered-shared", "2", ttl=60)
+        _wait_for(lambda: workers[1].get("test-tiered-shared") == "2")
+
+        workers[0].delete("test-tiered-shared")
+        _wait_for(lambda: workers[1].get("test-tiered-shared") is None)
+    finally:
+        for worker in workers:
+            worker.close()
+
+    assert MockRedisPubSub.subscribers["test-invalidation"] == []
@@ -161,6 +161,24 @@ def test_can_change_configuration_values_after_instantiation():
     assert config.SOME_NEW_CONFIGS_2 == "some new configuration values changed"
 
 
+def test_configuration_revision_changes_with_settings():
+    config = Config()
+    assert config.revision == 0
+
+    _ = config.DEBUG
+    assert config.revision == 0
+
+    config.DEBUG = True
+    config["SOME_NEW_CONFIGS"] = "some new configuration values"
+    assert config.revision == 2
+
+    config.set_defaults(SOME_NEW_CONFIGS="ignored", SOME_NEW_CONFIGS_2="value")
+    assert config.revision == 3
+
+    del config.SOME_NEW_CONFIGS_2
+    assert config.revision == 4
+
+
 def test_can_export_configuration_values():
     config = Config()
     values = list(config.config_values)
@@ -10,6 +10,7 @@ from ellar.di import (
     request_scope,
     transient_scope,
 )
+from ellar.di.asgi_args import _request_scope_slots
 from ellar.di.providers import ClassProvider, InstanceProvider
 from injector import Binder, Injector, UnsatisfiedRequirement
 
@@ -92,6 +93,33 @@ def test_default_container_registration():
         injector.get(Binder)
 
 
+def test_injector_get_caches_resolved_bindings(monkeypatch):
+    parent = EllarInjector(auto_bind=False)
+    injector = EllarInjector(auto_bind=False, parent=parent)
+    parent.container.register(Foo1, scope=transient_scope)
+
+    get_binding_calls = []
+    _get_binding = Container.get_binding
+
+    def get_binding(self, interface):
+        get_binding_calls.append(interface)
+        return _get_binding(self, interface)
+
+    monkeypatch.setattr(Container, "get_binding", get_binding)
+
+    foo1 = injector.get(Foo1)
+    assert isinstance(foo1, Foo1)
+    assert injector.get(Foo1) is not foo1
+    assert get_binding_calls.count(Foo1) == 1
+
+    # registration on the parent container invalidates the child resolutions
+    foo1_instance = Foo1()
+    parent.container.register(Foo1, foo1_instance)
+    assert injector.get(Foo1) is foo1_instance
+    assert injector.get(Foo1) is foo1_instance
+    assert get_binding_calls.count(Foo1) == 2
+
+
 @pytest.mark.asyncio
 async def test_request_service_context():
     injector = EllarInjector(auto_bind=False)
@@ -140,3 +168,43 @@ async def test_injector_update_scoped_context():
 
     register_request_scope_context(Foo1, Foo1())
     assert request_context_var.get() is None
+
+
+@pytest.mark.asyncio
+async def test_request_scope_context_uses_reserved_slots(monkeypatch):
+    injector = EllarInjector(auto_bind=False)
+    injector.container.register(Foo1, scope=request_scope)
+    assert Foo1 in _request_scope_slots
+
+    created = []
+    _init = Foo1.__init__
+
+    def init(self, *args, **kwargs):
+        created.append(self)
+        _init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Foo1, "__init__", init)
+
+    async with HttpRequestConnectionContext(
+        HostContextFactory().create_context(scope={})
+    ) as context:
+        assert len(context._instances) == len(_request_scope_slots)
+        # instances are created lazily on first resolution and not wrapped in providers
+        assert created == []
+        foo1 = injector.get(Foo1)
+        assert injector.get(Foo1) is foo1
+        assert context._instances[_request_scope_slots[Foo1]] is foo1
+        assert created == [foo1]
+
+        # a provider registered for the request takes over the slot
+        register_request_scope_context(Foo1, ClassProvider(Foo1))
+        assert injector.get(Foo1) is not injector.get(Foo1)
+
+        foo1_instance = Foo1()
+        register_request_scope_context(Foo1, foo1_instance)
+        assert injector.get(Foo1) is foo1_instance
+
+    async with HttpRequestConnectionContext(
+        HostContextFactory().create_context(scope={})
+    ):
+        assert injector.get(Foo1) is not foo1
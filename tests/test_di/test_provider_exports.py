@@ -161,3 +161,32 @@ def test_module_forward_ref_circular_dependencies():
     moduleA = app.injector.tree_manager.get_module(ModuleA).value
 
     moduleA.container.injector.get(Foo1)
+
+
+def test_exported_provider_resolution_is_cached_in_importing_module():
+    @Module(
+        name="moduleA",
+        providers=[
+            ProviderConfig(IRepository, use_class=FooDBCatsRepository),
+            ProviderConfig(IDBContext, use_class=AnyDBContext),
+        ],
+        exports=[IRepository],
+    )
+    class ModuleA:
+        pass
+
+    @Module(name="moduleB", modules=[ModuleA])
+    class ModuleB:
+        pass
+
+    app = Test.create_test_module(modules=[ModuleB]).create_application()
+    moduleA = app.injector.tree_manager.get_module(ModuleA).value
+    moduleB = app.injector.tree_manager.get_module(ModuleB).value
+    moduleB_injector = moduleB.container.injector
+
+    repository = moduleB_injector.get(IRepository)
+    assert isinstance(repository, FooDBCatsRepository)
+    assert moduleB_injector._resolutions[IRepository].provider is (
+        moduleA.container.get_binding(IRepository)[0].provider
+    )
+    assert moduleB_injector.get(IRepository) is repository
@@ -173,6 +173,46 @@ def test_search_module_tree_works():
     assert res.value.module == module_type_
 
 
+def test_get_exporting_module_matches_search_module_tree():
+    class IService:
+        pass
+
+    core_module_type = ModuleSetup(Module()(get_unique_type("CoreModuleType")))
+    tree_manager = ModuleTreeManager(core_module_type)
+
+    app_module_type = Module()(get_unique_type("AppModuleType"))
+    tree_manager.add_module(app_module_type, ModuleSetup(app_module_type))
+
+    exporting_a = Module(exports=[IService])(get_unique_type("ExportingA"))
+    exporting_b = Module(exports=[IService])(get_unique_type("ExportingB"))
+    other = Module()(get_unique_type("Other"))
+
+    tree_manager.add_module(other, ModuleSetup(other), app_module_type)
+    tree_manager.add_module(exporting_b, ModuleSetup(exporting_b), other)
+    tree_manager.add_module(exporting_a, ModuleSetup(exporting_a), app_module_type)
+
+    def search(module_type):
+        return tree_manager.search_module_tree(
+            lambda data: data.value.module == module_type,
+            lambda data: IService in data.exports,
+        )
+
+    for module_type in (app_module_type, other, exporting_a, exporting_b):
+        expected = search(module_type)
+        assert tree_manager.get_exporting_module(module_type, IService) is expected
+
+    # DFS order: `other` subtree is visited before `exporting_a`
+    res = tree_manager.get_exporting_module(app_module_type, IService)
+    assert res.value.module is exporting_b
+    assert tree_manager.get_exporting_module(core_module_type.module, object) is None
+
+    # index follows tree updates
+    not_exporting_b = ModuleSetup(Module()(get_unique_type("NotExportingB")))
+    tree_manager.update_module(exporting_b, not_exporting_b)
+    res = tree_manager.get_exporting_module(app_module_type, IService)
+    assert res.value.module is exporting_a
+
+
 def test_find_module_return_list_of_items():
     core_module_type = ModuleSetup(Module()(get_unique_type("CoreModuleType")))
     tree_manager = ModuleTreeManager(core_module_type)
@@ -9,7 +9,12 @@ from ellar.common import (
     get,
     ws_route,
 )
-from ellar.di import injectable
+from ellar.common.constants import (
+    CONTROLLER_OPERATION_HANDLER_KEY,
+    ROUTE_INTERCEPTORS,
+)
+from ellar.di import injectable, request_scope
+from ellar.reflect import reflect
 from ellar.testing import Test
 
 
@@ -106,3 +111,49 @@ def test_global_guard_works():
         "Interceptor1": "Interceptor1 modified returned resulted",
         "message": "intercepted okay",
     }
+
+
+def test_interceptors_chain_is_computed_once_per_route():
+    @injectable(scope=request_scope)
+    class RequestScopedInterceptor(EllarInterceptor):
+        async def intercept(
+            self,
+            context: IExecutionContext,
+            next_interceptor: t.Callable[..., t.Coroutine],
+        ) -> t.Any:
+            data = await next_interceptor()
+            data.update(request_scoped=id(self))
+            return data
+
+    @get("/chain")
+    def _chain_endpoint():
+        return {"message": "intercepted okay"}
+
+    tm = Test.create_test_module(routers=[_chain_endpoint])
+    app = tm.create_application()
+    app.use_global_interceptors(Interceptor1, RequestScopedInterceptor)
+    _client = tm.get_test_client()
+
+    res = _client.get("/chain")
+    assert res.status_code == 200
+    first_request_scoped = res.json()["request_scoped"]
+
+    route_operation = reflect.get_metadata(
+        CONTROLLER_OPERATION_HANDLER_KEY, _chain_endpoint
+    )
+    chain = route_operation._chains[ROUTE_INTERCEPTORS].items
+    # singleton is resolved once, request scoped type is resolved per request
+    assert isinstance(chain[0], Interceptor1)
+    assert chain[1] is RequestScopedInterceptor
+
+    res = _client.get("/chain")
+    assert res.json()["request_scoped"] != first_request_scoped
+    assert route_operation._chains[ROUTE_INTERCEPTORS].items is chain
+
+    # changing application interceptors recomputes the chain
+    app.use_global_interceptors(InterceptCustomException)
+    _client.get("/chain")
+    assert len(route_operation._chains[ROUTE_INTERCEPTORS].items) == 3
+
+    route_operation.invalidate_chains()
+    assert route_operation._chains == {}
@@ -1,5 +1,8 @@
+import functools
+
 import pytest
 from ellar.reflect import reflect
+from ellar.testing import Test
 
 
 def test_define_metadata_creates_attribute_dict(random_type):
@@ -183,3 +186,55 @@ def test_define_metadata_raise_exception():
 
 def test_define_metadata_overrides_existing_collection_of_different_type():
     pass
+
+
+def test_frozen_metadata_is_read_only_and_not_copied(random_type):
+    def endpoint():
+        pass
+
+    @functools.wraps(endpoint)
+    def wrapper():
+        pass
+
+    reflect.define_metadata("list", ["a"], random_type)
+    reflect.define_metadata("set", {"a"}, random_type)
+    reflect.define_metadata("dict", {"a": 1}, random_type)
+    reflect.define_metadata("value", "Ellar", endpoint)
+
+    with reflect.context():
+        reflect.freeze()
+        assert reflect.is_frozen
+
+        assert reflect.get_metadata("list", random_type) == ("a",)
+        assert reflect.get_metadata("set", random_type) == frozenset({"a"})
+        assert reflect.get_metadata("list", random_type) is reflect.get_metadata(
+            "list", random_type
+        )
+        with pytest.raises(TypeError):
+            reflect.get_metadata("dict", random_type)["b"] = 2
+
+        assert reflect.get_metadata("value", wrapper) == "Ellar"
+        assert reflect.has_metadata("value", wrapper)
+        assert reflect.get_metadata("value", random_type) is None
+        assert list(reflect.get_metadata_keys(endpoint)) == ["value"]
+
+        with pytest.raises(RuntimeError, match="Metadata is frozen"):
+            reflect.define_metadata("value", "Starlette", endpoint)
+        with pytest.raises(RuntimeError, match="Metadata is frozen"):
+            reflect.delete_metadata("value", endpoint)
+
+        reflect.unfreeze()
+        reflect.define_metadata("value", "Starlette", endpoint)
+        assert reflect.get_metadata("list", random_type) == ["a"]
+
+    assert not reflect.is_frozen
+    assert reflect.get_metadata("value", endpoint) == "Ellar"
+
+
+def test_application_freezes_metadata_when_configured():
+    tm = Test.create_test_module(config_module={"FREEZE_REFLECT_METADATA": True})
+    tm.create_application()
+    try:
+        assert reflect.is_frozen
+    finally:
+        reflect.unfreeze()
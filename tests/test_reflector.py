@@ -96,3 +96,18 @@ def test_should_reflect_metadata_of_all_targets_and_return_a_first_not_undefined
     value = "value"
     reflect.define_metadata(key, value, SampleTarget)
     assert reflector.get_all_and_override(key, *[SampleTarget, SampleTarget]) == value
+
+
+def test_should_merge_frozen_metadata_without_modifying_it(random_type):
+    reflect.define_metadata("list", ["a"], random_type)
+    reflect.define_metadata("dict", {"a": 1}, random_type)
+
+    with reflect.context():
+        reflect.freeze()
+        assert reflector.get_all_and_merge("list", random_type, random_type) == [
+            "a",
+            "a",
+        ]
+        assert reflector.get_all_and_merge("dict", random_type, random_type) == {"a": 1}
+        assert reflector.get("list", random_type) == ("a",)
+        reflect.unfreeze()
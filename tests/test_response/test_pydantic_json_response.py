@@ -0,0 +1,114 @@
+import typing as t
+
+import pytest
+from ellar.common import ModuleRouter, PydanticJSONResponse
+from ellar.common.responses.models import ResponseModelField
+from ellar.pydantic import create_model_field
+from ellar.testing import Test
+from pydantic import BaseModel
+
+from .test_pydantic_response_model import mr as pydantic_response_router
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0.0
+
+
+class RevalidatedItem(Item, revalidate_instances="always"):
+    pass
+
+
+router = ModuleRouter("/direct")
+
+
+@router.get("/items", response=t.List[Item])
+def get_items():
+    return [Item(name=f"item-{i}", price=i) for i in range(3)]
+
+
+@router.get("/items/dict-input", response=t.List[Item])
+def get_items_from_dict():
+    return [{"name": "item", "price": "1.5"}]
+
+
+@router.get("/items/invalid", response=Item)
+def get_invalid_item():
+    return {"price": "not-a-price"}
+
+
+@router.get("/items/no-schema")
+def get_no_schema():
+    return {"name": "ünicode", "values": [1, 2.5, None, True]}
+
+
+def _create_model_field(type_: t.Any) -> ResponseModelField:
+    return t.cast(
+        ResponseModelField,
+        create_model_field(
+            name="response_model",
+            type_=type_,
+            model_field_class=ResponseModelField,
+            mode="serialization",
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/items/valid",
+        "/items/coerce",
+        "/items/validlist",
+        "/items/validdict",
+        "/items/valid-exclude-unset",
+        "/items/coerce-exclude-unset",
+        "/items/validlist-exclude-unset",
+        "/items/validdict-exclude-unset",
+        "/items/valid-ellipsis-response-model?switch=ellipsis",
+        "/items/valid-ellipsis-response-model?switch=none",
+        "/direct/items",
+        "/direct/items/dict-input",
+        "/direct/items/invalid",
+        "/direct/items/no-schema",
+    ],
+)
+def test_pydantic_json_response_matches_json_response(path):
+    routers = [pydantic_response_router, router]
+    client = Test.create_test_module(routers=routers).get_test_client(
+        raise_server_exceptions=False
+    )
+    direct_client = Test.create_test_module(
+        routers=routers, config_module={"DEFAULT_JSON_CLASS": PydanticJSONResponse}
+    ).get_test_client(raise_server_exceptions=False)
+
+    expected = client.get(path)
+    res = direct_client.get(path)
+
+    assert res.status_code == expected.status_code
+    assert res.json() == expected.json()
+    assert res.headers["content-type"] == expected.headers["content-type"]
+
+
+def test_prep_and_serialize_json_skips_validation_of_model_instances(monkeypatch):
+    model_field = _create_model_field(Item)
+    item = Item(name="item", price=1)
+
+    def _validate(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("validation should be skipped")
+
+    monkeypatch.setattr(model_field, "validate", _validate)
+    assert model_field.prep_and_serialize_json(item) == b'{"name":"item","price":1.0}'
+    assert model_field.prep_and_serialize(item) == {"name": "item", "price": 1.0}
+
+
+def test_prep_and_serialize_json_validates_revalidated_models():
+    assert _create_model_field(Item)._skip_validation_type is Item
+    assert _create_model_field(RevalidatedItem)._skip_validation_type is None
+    assert _create_model_field(t.List[Item])._skip_validation_type is None
+
+    model_field = _create_model_field(t.List[Item])
+    assert (
+        model_field.prep_and_serialize_json([{"name": "item", "price": "2"}])
+        == b'[{"name":"item","price":2.0}]'
+    )
@@ -0,0 +1,156 @@
+import typing as t
+
+from ellar.common import Controller, Cookie, Header, ModuleRouter, Query, get
+from ellar.common.constants import CONTROLLER_OPERATION_HANDLER_KEY
+from ellar.common.params.resolvers.compiled import CompiledParameterResolver
+from ellar.reflect import reflect
+from ellar.testing import Test
+from typing_extensions import Annotated
+
+
+def create_router() -> ModuleRouter:
+    mr = ModuleRouter("/items")
+
+    @mr.get("/{item_id:int}")
+    def get_item(
+        item_id: int,
+        q: Annotated[str, Query(min_length=2)],
+        limit: int = Query(10, le=100),
+        tags: t.List[str] = Query(None),
+        x_token: str = Header(),
+        user_agent: t.Optional[str] = Header(None),
+        session: t.Optional[str] = Cookie(None),
+    ):
+        return {
+            "item_id": item_id,
+            "q": q,
+            "limit": limit,
+            "tags": tags,
+            "x_token": x_token,
+            "user_agent": user_agent,
+            "session": session,
+        }
+
+    @mr.get("/range")
+    def get_range(
+        start: int = Query(..., ge=0),
+        end: int = Query(..., ge=0),
+    ):
+        return {"start": start, "end": end}
+
+    @mr.get("/number")
+    def get_number(
+        number: t.Union[int, str] = Query(..., union_mode="left_to_right"),
+        strict: int = Query(None, strict=True),
+    ):
+        return {"number": number, "strict": strict}
+
+    mr.endpoints = [get_item, get_range, get_number]
+    return mr
+
+
+def create_app_client(compiled: bool) -> t.Tuple[ModuleRouter, t.Any]:
+    router = create_router()
+    client = Test.create_test_module(
+        routers=[router], config_module={"COMPILED_PARAMETER_RESOLVERS": compiled}
+    ).get_test_client()
+    return router, client
+
+
+def get_route_operations(router: ModuleRouter) -> t.List[t.Any]:
+    return [
+        reflect.get_metadata(CONTROLLER_OPERATION_HANDLER_KEY, endpoint)
+        for endpoint in router.endpoints
+    ]
+
+
+def get_responses(client: t.Any) -> t.List[t.Tuple[int, t.Any]]:
+    requests = [
+        ("/items/1?q=ab&tags=a&tags=b", {"x-token": "t", "user-agent": "ua"}, None),
+        ("/items/1?q=ab", {"x-token": "t"}, {"session": "s1"}),
+        ("/items/1?q=a&limit=200", {}, None),
+        ("/items/foo?q=ab", {"x-token": "t"}, None),
+        ("/items/range?start=1&end=4", {}, None),
+        ("/items/range?start=-1&end=a", {}, None),
+        ("/items/range", {}, None),
+        ("/items/number?number=1", {}, None),
+        ("/items/number?number=1&strict=1", {}, None),
+    ]
+    responses = []
+    for url, headers, cookies in requests:
+        client.cookies.clear()
+        if cookies:
+            client.cookies.update(cookies)
+        res = client.get(url, headers=headers)
+        responses.append((res.status_code, res.json()))
+    return responses
+
+
+def test_compiled_resolver_is_only_built_when_enabled():
+    router, _ = create_app_client(compiled=False)
+    for route in get_route_operations(router):
+        assert route.endpoint_parameter_model._compiled_resolver is None
+
+    router, _ = create_app_client(compiled=True)
+    for route in get_route_operations(router):
+        model = route.endpoint_parameter_model
+        assert isinstance(model._compiled_resolver, CompiledParameterResolver)
+        assert not any(
+            CompiledParameterResolver.can_compile(resolver)
+            for resolver in model._uncompiled_route_models
+        )
+
+
+def test_compiled_resolver_matches_parameter_resolvers():
+    expected = get_responses(create_app_client(compiled=False)[1])
+    assert get_responses(create_app_client(compiled=True)[1]) == expected
+
+    assert expected[0] == (
+        200,
+        {
+            "item_id": 1,
+            "q": "ab",
+            "limit": 10,
+            "tags": ["a", "b"],
+            "x_token": "t",
+            "user_agent": "ua",
+            "session": None,
+        },
+    )
+    assert expected[1][1]["session"] == "s1"
+    assert expected[2][0] == 422
+    assert [error["loc"] for error in expected[2][1]["detail"]] == [
+        ["header", "x-token"],
+        ["query", "q"],
+        ["query", "limit"],
+    ]
+    assert expected[5][0] == 422
+    assert [error["loc"] for error in expected[5][1]["detail"]] == [
+        ["query", "start"],
+        ["query", "end"],
+    ]
+    # field settings such as union_mode and strict are kept
+    assert expected[7] == (200, {"number": 1, "strict": None})
+    assert expected[8][0] == 422
+    assert [error["loc"] for error in expected[8][1]["detail"]] == [["query", "strict"]]
+
+
+@Controller("/compiled")
+class CompiledController:
+    @get("/")
+    def index(self, q: str = Query("default")):
+        return {"q": q}
+
+
+def test_compiled_parameter_resolvers_setting_applies_to_controllers():
+    for compiled in (True, False):
+        tm = Test.create_test_module(
+            controllers=[CompiledController],
+            config_module={"COMPILED_PARAMETER_RESOLVERS": compiled},
+        )
+        app = tm.create_application()
+        (mount,) = [route for route in app.router.routes if route.path == "/compiled"]
+        (route,) = mount.routes
+        model = route.endpoint_parameter_model
+        assert (model._compiled_resolver is not None) is compiled
+        assert tm.get_test_client().get("/compiled/?q=value").json() == {"q": "value"}
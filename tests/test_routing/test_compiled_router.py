@@ -0,0 +1,146 @@
+import pytest
+from ellar.common import Controller, ModuleRouter, Version, get, post
+from ellar.core.routing import RouteCollection
+from ellar.core.routing.route_tree import RouteTree
+from ellar.core.versioning import VersioningSchemes as VERSIONING
+from ellar.testing import Test
+from starlette.routing import Mount, Route
+
+mr = ModuleRouter("/items")
+
+
+@mr.get("/")
+def list_items():
+    return {"name": "list"}
+
+
+@mr.get("/special")
+def special_item():
+    return {"name": "special"}
+
+
+@mr.get("/{item_id:int}")
+def get_item(item_id: int):
+    return {"item_id": item_id}
+
+
+@mr.post("/{item_id:int}")
+def update_item(item_id: int):
+    return {"updated": item_id}
+
+
+@mr.get("/files/{file_path:path}")
+def get_file(file_path: str):
+    return {"file_path": file_path}
+
+
+@Controller("/versioned")
+class VersionedController:
+    @get("/data")
+    @Version("1")
+    def data_v1(self):
+        return {"version": "1"}
+
+    @get("/data")
+    @Version("2")
+    def data_v2(self):
+        return {"version": "2"}
+
+    @post("/only-post")
+    def only_post(self):
+        return {"method": "post"}
+
+
+def _endpoint(request):  # pragma: no cover
+    pass
+
+
+def test_route_tree_candidates_skips_unreachable_routes():
+    routes = [
+        Route("/users", _endpoint),
+        Route("/users/{user_id:int}", _endpoint),
+        Route("/users/me", _endpoint),
+        Route("/static/{path:path}", _endpoint),
+        Mount("/sub", routes=[]),
+    ]
+    tree = RouteTree(routes)
+
+    assert tree.get_candidates("/users") == [routes[0]]
+    assert tree.get_candidates("/users/me") == [routes[1], routes[2]]
+    assert tree.get_candidates("/static/a/b.css") == [routes[3]]
+    assert tree.get_candidates("/sub/anything/else") == [routes[4]]
+    assert tree.get_candidates("/unknown") == []
+
+
+def test_route_collection_compile_is_recursive_and_rebuilds_on_change():
+    child = RouteCollection([Route("/a", _endpoint)])
+    mount = Mount("/child", routes=[])
+    mount._base_app.routes = child  # type: ignore[attr-defined]
+
+    collection = RouteCollection([mount]).compile()
+    assert collection.compiled
+    assert child.compiled
+
+    child.append(Route("/b", _endpoint))
+    scope = {"type": "http", "path": "/b", "root_path": ""}
+    assert [route.path for route in child.match_candidates(scope)] == ["/b"]
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize(
+    "method, path, status_code, expected_result",
+    [
+        ("get", "/items/", 200, {"name": "list"}),
+        ("get", "/items/special", 200, {"name": "special"}),
+        ("get", "/items/23", 200, {"item_id": 23}),
+        ("post", "/items/23", 200, {"updated": 23}),
+        ("get", "/items/files/css/main.css", 200, {"file_path": "css/main.css"}),
+        ("delete", "/items/23", 405, None),
+        ("get", "/items/foo", 404, None),
+        ("get", "/versioned/only-post", 405, None),
+    ],
+)
+def test_compiled_router_matches_like_linear_router(
+    compiled, method, path, status_code, expected_result
+):
+    tm = Test.create_test_module(
+        routers=[mr],
+        controllers=[VersionedController],
+        config_module={"COMPILED_ROUTER": compiled},
+    )
+    app = tm.create_application()
+    assert app.router.routes.compiled is compiled
+    for route in app.router.routes:
+        if isinstance(getattr(route, "routes", None), RouteCollection):
+            assert route.routes.compiled is compiled
+
+    client = tm.get_test_client()
+    res = getattr(client, method)(path)
+    assert res.status_code == status_code
+    if expected_result:
+        assert res.json() == expected_result
+
+
+@pytest.mark.parametrize(
+    "version, status_code, expected_result",
+    [
+        ("1", 200, {"version": "1"}),
+        ("2", 200, {"version": "2"}),
+        ("3", 406, None),
+    ],
+)
+def test_compiled_router_checks_versioning(version, status_code, expected_result):
+    tm = Test.create_test_module(
+        controllers=[VersionedController],
+        config_module={"COMPILED_ROUTER": True},
+    )
+    app = tm.create_application()
+    app.enable_versioning(VERSIONING.HEADER, version_parameter="v")
+
+    client = tm.get_test_client()
+    res = client.get(
+        "/versioned/data", headers={"accept": f"application/json; v={version}"}
+    )
+    assert res.status_code == status_code
+    if expected_result:
+        assert res.json() == expected_result
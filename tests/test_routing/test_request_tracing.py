@@ -0,0 +1,123 @@
+import logging
+
+import pytest
+from ellar.common import (
+    GuardCanActivate,
+    IExecutionContext,
+    ModuleRouter,
+    UseGuards,
+)
+from ellar.common.tracing import (
+    InMemoryMetricsSink,
+    RequestTrace,
+    get_request_trace,
+)
+from ellar.testing import Test
+
+traces = []
+
+
+class AllowGuard(GuardCanActivate):
+    async def can_activate(self, context: IExecutionContext) -> bool:
+        return True
+
+
+mr = ModuleRouter("/trace")
+
+
+@mr.get("/{item_id:int}")
+def get_item(ctx: IExecutionContext, item_id: int):
+    traces.append(get_request_trace(ctx.get_args()[0]))
+    return {"item_id": item_id}
+
+
+@mr.get("/guarded")
+@UseGuards(AllowGuard())
+def get_guarded(ctx: IExecutionContext):
+    traces.append(get_request_trace(ctx.get_args()[0]))
+    return {"guarded": True}
+
+
+def test_request_tracing_records_request_phases():
+    traces.clear()
+    client = Test.create_test_module(
+        routers=[mr], config_module={"REQUEST_TRACING": True}
+    ).get_test_client()
+
+    assert client.get("/trace/1").json() == {"item_id": 1}
+    assert client.get("/trace/guarded").json() == {"guarded": True}
+
+    trace, guarded_trace = traces
+    assert isinstance(trace, RequestTrace)
+    assert [span.name for span in trace.spans] == [
+        "versioning",
+        "authentication",
+        "match",
+        "resolve",
+        "threadpool",
+        "handler",
+        "serialize",
+    ]
+    assert [span.name for span in guarded_trace.spans] == [
+        "versioning",
+        "authentication",
+        "match",
+        "guards",
+        "resolve",
+        "threadpool",
+        "handler",
+        "serialize",
+    ]
+    assert all(span.duration >= 0 for span in trace.spans)
+    assert all(span.start >= trace.start for span in trace.spans)
+    assert trace.route == "/trace/{item_id:int}"
+    assert list(trace.durations()) == [span.name for span in trace.spans]
+
+
+def test_request_tracing_is_disabled_by_default(caplog):
+    traces.clear()
+    client = Test.create_test_module(routers=[mr]).get_test_client()
+
+    with caplog.at_level(logging.DEBUG, logger="ellar.request"):
+        assert client.get("/trace/1").json() == {"item_id": 1}
+
+    assert traces == [None]
+    assert "Executing Request Endpoint Handler - 'RouteOperation'" in caplog.text
+
+
+def test_request_tracing_server_timing_header_and_metrics_sink():
+    traces.clear()
+    sink = InMemoryMetricsSink()
+    client = Test.create_test_module(
+        routers=[mr],
+        config_module={
+            "REQUEST_TRACING_SERVER_TIMING": True,
+            "REQUEST_TRACING_METRICS_SINK": sink,
+        },
+    ).get_test_client()
+
+    res = client.get("/trace/1")
+    assert res.json() == {"item_id": 1}
+    client.get("/trace/2")
+    client.get("/trace/guarded")
+    client.get("/not-found")
+
+    phases = [
+        item.split(";dur=")[0] for item in res.headers["server-timing"].split(", ")
+    ]
+    assert phases == [span.name for span in traces[0].spans] + ["total"]
+    assert "threadpool" in phases
+
+    handler = sink.get_histogram("/trace/{item_id:int}", "handler")
+    assert handler.count == 2
+    assert sum(handler.buckets) == 2
+    assert sink.get_histogram("/trace/guarded", "guards").count == 1
+    assert sink.get_histogram("/trace/guarded", "total").count == 1
+    assert sink.get_histogram("<unmatched>", "match").count == 1
+
+
+def test_request_tracing_metrics_sink_config_is_validated():
+    with pytest.raises(Exception, match="Expected IRequestMetricsSink object"):
+        Test.create_test_module(
+            config_module={"REQUEST_TRACING_METRICS_SINK": object()}
+        ).create_application()
@@ -0,0 +1,52 @@
+from ellar.common import IGuardsConsumer, get
+from ellar.common.constants import CONTROLLER_OPERATION_HANDLER_KEY
+from ellar.core.guards import GuardConsumer
+from ellar.di import ProviderConfig
+from ellar.reflect import reflect
+from ellar.testing import Test
+
+_called = []
+
+
+class CustomGuardConsumer(GuardConsumer):
+    async def execute(self, context, route_operation):
+        _called.append(route_operation)
+        await super().execute(context, route_operation)
+
+
+@get("/plain")
+def plain_endpoint():
+    return {"message": "plain"}
+
+
+def test_route_without_guards_and_interceptors_skips_consumers():
+    tm = Test.create_test_module(routers=[plain_endpoint])
+    client = tm.get_test_client()
+
+    res = client.get("/plain")
+    assert res.status_code == 200
+    assert res.json() == {"message": "plain"}
+
+    route_operation = reflect.get_metadata(
+        CONTROLLER_OPERATION_HANDLER_KEY, plain_endpoint
+    )
+    assert route_operation._pipeline.default_consumers is True
+    assert route_operation._pipeline.execution_context_factory is not None
+
+
+def test_overridden_consumer_is_not_skipped():
+    _called.clear()
+    tm = Test.create_test_module(
+        routers=[plain_endpoint],
+        config_module={
+            "OVERRIDE_CORE_SERVICE": [
+                ProviderConfig(IGuardsConsumer, use_class=CustomGuardConsumer)
+            ]
+        },
+    )
+    client = tm.get_test_client()
+
+    res = client.get("/plain")
+    assert res.status_code == 200
+    assert res.json() == {"message": "plain"}
+    assert len(_called) == 1
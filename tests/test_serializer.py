@@ -8,6 +8,7 @@ import pytest
 from ellar.common.serializer.base import (
     Serializer,
     SerializerFilter,
+    _type_handlers,
     serialize_object,
 )
 from ellar.core import injector_context
@@ -177,6 +178,31 @@ def test_serializer_filter():
     ) == {"foo": "foo"}
 
 
+def test_serializer_filter_is_immutable_and_hashable():
+    serializer_filter = SerializerFilter(include={"foo", "bar"}, exclude_none=True)
+    same_filter = SerializerFilter(include=["bar", "foo"], exclude_none=True)
+    nested_filter = SerializerFilter(exclude={"foo": {"bar"}})
+
+    assert serializer_filter == same_filter
+    assert hash(serializer_filter) == hash(same_filter)
+    assert {serializer_filter: 1}[same_filter] == 1
+    assert hash(nested_filter) == hash(SerializerFilter(exclude={"foo": {"bar"}}))
+
+    with pytest.raises(AttributeError):
+        serializer_filter.exclude_none = False
+
+    assert serializer_filter.kwargs is serializer_filter.kwargs
+    kwargs = serializer_filter.dict()
+    kwargs.update(exclude_none=False)
+    assert serializer_filter.kwargs["exclude_none"] is True
+
+    model = ModelWithDefault(foo="foo", bar="bar")
+    assert (
+        serialize_object([model, model], serializer_filter=serializer_filter)
+        == [{"foo": "foo", "bar": "bar"}] * 2
+    )
+
+
 def test_serializer_pydantic_similar_functions():
     model = ModelWithDefault(foo="foo", bar="bar")
     dump = model.dict(exclude_none=True)
@@ -185,6 +211,35 @@ def test_serializer_pydantic_similar_functions():
     assert json_string == '{"foo":"foo","bar":"bar","bla":"bla"}'
 
 
+def test_serialize_object_nested_dataclasses_and_dispatch_cache():
+    @dataclass
+    class Address:
+        path: PurePath
+        role: RoleEnum
+
+    @dataclass
+    class Owner:
+        person: DataclassPerson
+        addresses: t.List[Address]
+        tags: t.Tuple[str, ...]
+
+    owner = Owner(
+        person=DataclassPerson(name="Eadwin", first_name="Eadwin"),
+        addresses=[Address(path=PurePosixPath("/foo"), role=RoleEnum.admin)],
+        tags=("a", "b"),
+    )
+    expected = {
+        "person": {"name": "Eadwin", "first_name": "Eadwin", "last_name": None},
+        "addresses": [{"path": "/foo", "role": "admin"}],
+        "tags": ["a", "b"],
+    }
+    assert serialize_object(owner, encoders={}) == expected
+    assert Owner in _type_handlers and Address in _type_handlers
+    assert serialize_object(owner, encoders={}) == expected
+    # dataclass instances are read, not copied or modified
+    assert owner.addresses[0].role is RoleEnum.admin
+
+
 def test_encode_class():
     person = Person(name="Foo")
     pet = Pet(owner=person, name="Firulais")
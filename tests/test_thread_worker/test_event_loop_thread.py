@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+import pytest
+from ellar.threading import EventLoopThread, run_in_event_loop_thread
+
+
+async def get_loop_thread():
+    return threading.current_thread(), asyncio.get_running_loop()
+
+
+def test_run_in_event_loop_thread_reuses_one_loop():
+    thread, loop = run_in_event_loop_thread(get_loop_thread())
+    assert thread is not threading.current_thread()
+    assert run_in_event_loop_thread(get_loop_thread()) == (thread, loop)
+
+
+@pytest.mark.asyncio
+async def test_run_in_event_loop_thread_works_under_a_running_loop():
+    _, loop = run_in_event_loop_thread(get_loop_thread())
+    assert loop is not asyncio.get_running_loop()
+
+
+def test_event_loop_thread_raises_errors_and_can_restart():
+    loop_thread = EventLoopThread(name="test-loop")
+
+    async def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        loop_thread.run(fail())
+
+    thread, loop = loop_thread.run(get_loop_thread())
+    assert thread.name == "test-loop"
+
+    loop_thread.stop()
+    assert not thread.is_alive()
+    assert loop.is_closed()
+    assert loop_thread.run(get_loop_thread())[1] is not loop
+    loop_thread.stop()
+
+
+def test_event_loop_thread_run_from_own_loop_fails():
+    loop_thread = EventLoopThread()
+
+    async def nested():
+        return loop_thread.run(get_loop_thread())
+
+    with pytest.raises(RuntimeError, match="can not be called from its own event loop"):
+        loop_thread.run(nested())
+    loop_thread.stop()
@@ -1,8 +1,14 @@
+import asyncio
 import contextlib
+import contextvars
+import threading
+import time
 
 import pytest
 from ellar.threading.sync_worker import (
+    SyncWorkerPool,
     _SyncWorkerThread,
+    configure_sync_worker_pool,
     execute_async_context_manager,
     execute_async_gen,
     execute_coroutine,
@@ -92,3 +98,144 @@ async def test_sync_worker_runs_async_context_manager(anyio_backend):
             async_context_manager(with_exception=True)
         ) as ctx:
             pass
+
+
+current_request = contextvars.ContextVar("current_request", default=None)
+
+
+async def get_loop_thread():
+    return threading.current_thread(), asyncio.get_running_loop()
+
+
+@contextlib.asynccontextmanager
+async def request_context(request):
+    token = current_request.set(request)
+    try:
+        yield request
+    finally:
+        # fails unless it exits in the context it entered in
+        current_request.reset(token)
+
+
+def test_sync_worker_pool_reuses_its_loops():
+    pool = SyncWorkerPool(max_workers=2)
+    try:
+        results = {pool.run(get_loop_thread()) for _ in range(4)}
+        assert len(results) == 2
+        assert threading.current_thread() not in {thread for thread, _ in results}
+    finally:
+        pool.shutdown()
+
+
+def test_sync_worker_pool_runs_submissions_concurrently():
+    pool = SyncWorkerPool(max_workers=1)
+    threads = [
+        threading.Thread(target=pool.run, args=(asyncio.sleep(0.2),)) for _ in range(5)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start < 0.5
+    pool.shutdown()
+
+
+def test_sync_worker_pool_keeps_context_of_async_context_manager():
+    pool = SyncWorkerPool()
+    try:
+        with pool.enter(request_context("request")) as request:
+            assert request == "request"
+            assert current_request.get() == "request"
+            # coroutines submitted meanwhile see the context of the caller
+            assert pool.run(_get_current_request()) == "request"
+        assert current_request.get() is None
+
+        with pytest.raises(RuntimeError, match="Raised in context"):
+            with pool.enter(request_context("request")):
+                raise RuntimeError("Raised in context")
+        assert current_request.get() is None
+    finally:
+        pool.shutdown()
+
+
+async def _get_current_request():
+    return current_request.get()
+
+
+def test_sync_worker_pool_closes_async_generators():
+    pool = SyncWorkerPool()
+    closed = False
+
+    async def numbers():
+        nonlocal closed
+        try:
+            for i in range(10):
+                yield i
+        finally:
+            closed = True
+
+    try:
+        for item in pool.iterate(numbers()):
+            if item == 3:
+                break
+        assert closed
+        assert list(pool.iterate(async_gen())) == list(range(10))
+    finally:
+        pool.shutdown()
+
+
+def test_sync_worker_pool_iterates_async_generators_in_one_context():
+    pool = SyncWorkerPool()
+    var = contextvars.ContextVar("var", default="unset")
+    reset = False
+
+    async def numbers():
+        nonlocal reset
+        token = var.set("inside")
+        try:
+            for i in range(3):
+                yield i, var.get()
+        finally:
+            var.reset(token)
+            reset = True
+
+    try:
+        assert list(pool.iterate(numbers())) == [(i, "inside") for i in range(3)]
+        assert reset
+
+        reset = False
+        for item in pool.iterate(numbers()):
+            assert item == (0, "inside")
+            break
+        assert reset
+        assert var.get() == "unset"
+    finally:
+        pool.shutdown()
+
+
+def test_sync_worker_pool_runs_nested_calls_in_a_new_thread():
+    pool = SyncWorkerPool(max_workers=1)
+
+    async def nested():
+        # the loop of the pool is busy running this coroutine
+        return pool.run(get_loop_thread())
+
+    try:
+        pool_thread, _ = pool.run(get_loop_thread())
+        nested_thread, _ = pool.run(nested())
+        assert nested_thread is not pool_thread
+    finally:
+        pool.shutdown()
+
+
+def test_configure_sync_worker_pool():
+    with pytest.raises(ValueError, match="at least 1"):
+        SyncWorkerPool(max_workers=0)
+
+    pool = configure_sync_worker_pool(max_workers=2)
+    try:
+        assert pool.max_workers == 2
+        assert execute_coroutine(coroutine_function()) == "Coroutine Function"
+    finally:
+        configure_sync_worker_pool(max_workers=1)
@@ -4,6 +4,7 @@ import sys
 
 import pytest
 from ellar.utils.functional import (
+    ContextLocalProxy,
     LazyObject,
     LazyStrImport,
     SimpleLazyObject,
@@ -518,3 +519,19 @@ def test_lazy_str_import_works():
     with pytest.raises(ImportFromStringError):
         lazy_import = LazyStrImport("tests.test_lazy_import:InvalidLazyClassImport")
         lazy_import()
+
+
+def test_context_local_proxy_reads_func_on_every_access():
+    values = [Foo(), Foo()]
+    values[1].foo = "baz"
+    proxy = ContextLocalProxy(lambda: values[0])
+
+    assert proxy.foo == "bar"
+    assert proxy == values[0]
+    assert isinstance(proxy, Foo)
+
+    values[0] = values[1]
+    assert proxy.foo == "baz"
+    proxy.foo = "qux"
+    assert values[1].foo == "qux"
+    assert "_wrapped" not in proxy.__dict__